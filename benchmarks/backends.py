@@ -0,0 +1,88 @@
+"""
+Compares the validation backends of a contract:
+
+    python benchmarks/backends.py --rows 50000
+
+The setup is the time to build the backend of an already parsed contract:
+the pydantic model, or the per field coercers of the lean backend. The
+lean backend skips building and dumping a model per item, values already
+of the field type are not coerced at all and the others are coerced field
+by field (e.g. numbers read as strings). Each backend is measured for each
+output of the valid items: a new dict, the model or the input dict.
+"""
+import argparse
+import random
+import time
+
+from data_sitter import Contract
+from data_sitter.Contract import MODEL_CACHE
+from data_sitter.backends import BACKENDS
+from data_sitter.Validation import ValidationOutput
+
+
+CONTRACT_DICT = {
+    "name": "Benchmark",
+    "fields": [
+        {"name": "id", "type": "Integer", "rules": ["Is not null", "Is positive"]},
+        {"name": "name", "type": "String", "rules": ["Is not null", "Has maximum length 20"]},
+        {"name": "country", "type": "String", "rules": ["Is one of ['ES', 'FR', 'PT', 'IT']"]},
+        {"name": "score", "type": "Float", "rules": ["Is between 0 and 100"]},
+        {"name": "age", "type": "Integer", "rules": ["Is at least 18", "Is at most 120"]},
+    ],
+}
+
+
+def make_items(rows: int, invalid_rate: float, as_strings: bool, seed: int = 0):
+    rng = random.Random(seed)
+    items = []
+    for row in range(rows):
+        item = {
+            "id": row + 1,
+            "name": f"name-{row}",
+            "country": rng.choice(["ES", "FR", "PT", "IT"]),
+            "score": rng.uniform(0, 100),
+            "age": rng.randint(18, 90),
+        }
+        if rng.random() < invalid_rate:
+            item["age"] = rng.randint(0, 17)
+        if as_strings:
+            item = {key: str(value) for key, value in item.items()}
+        items.append(item)
+    return items
+
+
+def run(backend: str, items, output: ValidationOutput) -> dict:
+    MODEL_CACHE.clear()
+    contract = Contract.from_dict(CONTRACT_DICT, backend=backend)
+    contract.field_validators  # Rules parsed out of the setup time
+    start = time.perf_counter()
+    contract.validate(items[0])
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    for item in items:
+        contract.validate(item, output)
+    elapsed = time.perf_counter() - start
+    return {"setup_ms": setup * 1000, "us_per_item": elapsed / len(items) * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--invalid-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{'input':<10} {'backend':<10} {'output':<8} {'setup (ms)':>12} {'per item (us)':>15}")
+    for as_strings in (False, True):
+        items = make_items(args.rows, args.invalid_rate, as_strings)
+        for backend in BACKENDS:
+            for output in ValidationOutput:
+                result = run(backend, items, output)
+                kind = "strings" if as_strings else "typed"
+                print(
+                    f"{kind:<10} {backend:<10} {output:<8} "
+                    f"{result['setup_ms']:>12.2f} {result['us_per_item']:>15.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,26 @@
 import json
 import yaml
-from typing import Any, Dict, List, NamedTuple
+import hashlib
+from pathlib import Path
+from itertools import islice
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Set, Type, Union
 from functools import cached_property
+from threading import Lock
+from weakref import WeakValueDictionary
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-from .Validation import Validation
 from .field_types import BaseField
-from .FieldResolver import FieldResolver
-from .rules import ProcessedRule, RuleRegistry, RuleParser
+from .backends import ValidationBackend, get_backend
+from .Validation import BatchValidation, Validation, ValidationOutput
+from .FieldResolver import FieldResolver, RuleNotFoundError
+from .rules import LogicalRule, MatchedRule, ProcessedRule, RuleRegistry, RuleParser, ValueSet, load_values
+from .rules.Parser.parser_utils import VALUE_REF_PATTERN
+from .dataset_rules import DatasetRules, DatasetValidator
+from .dataset_rules.UniqueKeyTracker import DEFAULT_MAX_KEYS
+from .profiling import DataProfile, profile_file
+from .profiling.inference import DEFAULT_MAX_CATEGORIES, infer_contract
 
 
 class ContractWithoutFields(Exception):
@@ -26,52 +38,144 @@ class Field(NamedTuple):
     rules: List[str] = []
 
 
+# Models are kept while a contract uses them
+MODEL_CACHE: "WeakValueDictionary[str, Type[BaseModel]]" = WeakValueDictionary()
+MODEL_CACHE_LOCK = Lock()
+
+
+def normalize_rule(rule: ProcessedRule) -> Union[list, dict]:
+    if isinstance(rule, LogicalRule):
+        return {rule.operator.value: [normalize_rule(processed_rule) for processed_rule in rule.processed_rules]}
+    return [rule.field_type, rule.field_rule, rule.resolved_values]
+
+
+def fingerprint_value(value: Any) -> str:
+    """External values are told apart by their content, the same file may have changed since loaded."""
+    if isinstance(value, ValueSet):
+        return f"{value!r}:{value.digest}"
+    return repr(value)
+
+
+def get_references(rules: List[Union[str, dict]]) -> Set[str]:
+    """The keys of the values referenced by the rules, logical rules included."""
+    return set(VALUE_REF_PATTERN.findall(json.dumps(rules)))
+
+
 class Contract:
     name: str
     fields: List[Field]
     rule_parser: RuleParser
     field_resolvers: Dict[str, FieldResolver]
+    values: Dict[str, Any]
+    values_dir: Optional[Path]
+    cache_size: Optional[int]
+    adaptive_order: bool
+    detailed: bool
+    regex_timeout: Optional[float]
+    backend_class: Type[ValidationBackend]
+    dataset_rules: List[str]
 
 
-    def __init__(self, name: str, fields: List[Field], values: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        name: str,
+        fields: List[Field],
+        values: Dict[str, Any],
+        cache_size: Optional[int] = None,
+        dataset_rules: Optional[List[str]] = None,
+        values_dir: Optional[Path] = None,
+        rule_parser: Optional[RuleParser] = None,
+        adaptive_order: bool = False,
+        detailed: bool = False,
+        regex_timeout: Optional[float] = None,
+        backend: Union[str, Type[ValidationBackend]] = "pydantic",
+    ) -> None:
+        """
+        `cache_size` enables a validation cache of that size on every field, see `BaseField.enable_cache`.
+        `adaptive_order` reorders the rules of each field by their observed cost and rejection rate,
+        see `BaseField.enable_adaptive_order`. When `detailed`, all the failing rules of a value are
+        reported instead of the first one.
+        External values files are looked for relative to `values_dir`. A `rule_parser` of the
+        already loaded `values` can be given to reuse it.
+        """
         self.name = name
         self.fields = fields
-        self.rule_parser = RuleParser(values)
+        self.values = values
+        self.values_dir = values_dir
+        self.cache_size = cache_size
+        self.adaptive_order = adaptive_order
+        self.detailed = detailed
+        self.regex_timeout = regex_timeout
+        self.backend_class = get_backend(backend)
+        self.dataset_rules = dataset_rules or []
+        self.rule_parser = rule_parser or RuleParser(load_values(values, values_dir))
         self.field_resolvers = {
             _type: FieldResolver(RuleRegistry.get_type(_type), self.rule_parser)
             for _type in list({field.type for field in self.fields})  # Unique types
         }
 
     @classmethod
-    def from_dict(cls, contract_dict: dict):
-        if "name" not in contract_dict:
-            raise ContractWithoutName()
-        if "fields" not in contract_dict:
-            raise ContractWithoutFields()
+    def from_dict(cls, contract_dict: dict, **kwargs):
+        cls.check_contract_dict(contract_dict)
 
         return cls(
             name=contract_dict["name"],
             fields=[Field(**field) for field in contract_dict["fields"]],
             values=contract_dict.get("values", {}),
+            dataset_rules=contract_dict.get("dataset_rules"),
+            **kwargs,
         )
 
+    @staticmethod
+    def check_contract_dict(contract_dict: dict):
+        if "name" not in contract_dict:
+            raise ContractWithoutName()
+        if "fields" not in contract_dict:
+            raise ContractWithoutFields()
+
+    @classmethod
+    def from_json(cls, contract_json: str, **kwargs):
+        return cls.from_dict(json.loads(contract_json), **kwargs)
+
     @classmethod
-    def from_json(cls, contract_json: str):
-        return cls.from_dict(json.loads(contract_json))
+    def from_yaml(cls, contract_yaml: str, **kwargs):
+        return cls.from_dict(yaml.load(contract_yaml, yaml.Loader), **kwargs)
 
     @classmethod
-    def from_yaml(cls, contract_yaml: str):
-        return cls.from_dict(yaml.load(contract_yaml, yaml.Loader))
+    def infer(
+        cls,
+        records_or_file: Union[Iterable[Mapping[str, Any]], str, Path],
+        sample_size: Optional[int] = None,
+        name: str = "inferred",
+        max_categories: int = DEFAULT_MAX_CATEGORIES,
+    ) -> dict:
+        """
+        Infers a contract dict from the records, or the file, in one streaming
+        pass over up to `sample_size` rows. The contract can be loaded with
+        `Contract.from_dict`.
+        """
+        profile = DataProfile()
+        if isinstance(records_or_file, (str, Path)):
+            profile_file(Path(records_or_file), profile, max_rows=sample_size)
+        else:
+            for record in islice(records_or_file, sample_size):
+                profile.add(record)
+        return infer_contract(profile, name, max_categories)
+
+    def get_field_validator(self, field: Field) -> BaseField:
+        field_validator = self.field_resolvers[field.type].get_field_validator(
+            field.name, field.rules, field.description, self.regex_timeout
+        )
+        if self.cache_size:
+            field_validator.enable_cache(self.cache_size)
+        if self.adaptive_order:
+            field_validator.enable_adaptive_order()
+        field_validator.detailed = self.detailed
+        return field_validator
 
     @cached_property
     def field_validators(self) -> Dict[str, BaseField]:
-        field_validators = {}
-        for field in self.fields:
-            field_resolver = self.field_resolvers[field.type]
-            field_validators[field.name] = field_resolver.get_field_validator(
-                field.name, field.rules, field.description
-            )
-        return field_validators
+        return {field.name: self.get_field_validator(field) for field in self.fields}
 
     @cached_property
     def rules(self) -> Dict[str, List[ProcessedRule]]:
@@ -81,18 +185,223 @@ class Contract:
             rules[field.name] = field_resolver.get_processed_rules(field.rules)
         return rules
 
-    def validate(self, item: dict) -> Validation:
-        return Validation.validate(self.pydantic_model, item)
+    def is_stale_value(self, key: str) -> bool:
+        """Whether the file of the values of `key` changed since they were loaded."""
+        value = self.rule_parser.values.get(key)
+        return isinstance(value, ValueSet) and value.is_stale()
+
+    def update(self, contract_dict: dict) -> Dict[str, List[str]]:
+        """
+        Updates the contract in place to a new version of its dict. Only the
+        fields whose definition or referenced values changed, the content of
+        their files included, are compiled again, the validators of the others
+        are reused. The new state replaces the old
+        one at once, so validations already running finish with the old one.
+        Returns the names of the added, removed and changed fields.
+        """
+        self.check_contract_dict(contract_dict)
+        fields = [Field(**field) for field in contract_dict["fields"]]
+        values = contract_dict.get("values", {})
+        changed_values = {
+            key for key in self.values.keys() | values.keys()
+            if self.values.get(key) != values.get(key) or self.is_stale_value(key)
+        }
+        if changed_values:
+            new_values = {key: value for key, value in values.items() if key in changed_values}
+            loaded_values = {key: self.rule_parser.values[key] for key in values if key not in changed_values}
+            loaded_values.update(load_values(new_values, self.values_dir))
+            rule_parser = RuleParser(loaded_values)
+        else:
+            rule_parser = self.rule_parser
+        contract = type(self)(
+            name=contract_dict["name"],
+            fields=fields,
+            values=values,
+            cache_size=self.cache_size,
+            dataset_rules=contract_dict.get("dataset_rules"),
+            values_dir=self.values_dir,
+            rule_parser=rule_parser,
+            adaptive_order=self.adaptive_order,
+            detailed=self.detailed,
+            regex_timeout=self.regex_timeout,
+            backend=self.backend_class,
+        )
+
+        old_fields = {field.name: field for field in self.fields}
+        reused = [
+            field.name for field in fields
+            if old_fields.get(field.name) == field and not get_references(field.rules) & changed_values
+        ]
+        field_validators = {}
+        rules = {}
+        for field in fields:
+            if field.name in reused:
+                field_validators[field.name] = self.field_validators[field.name]
+                rules[field.name] = self.rules[field.name]
+            else:
+                field_validators[field.name] = contract.get_field_validator(field)
+                rules[field.name] = contract.field_resolvers[field.type].get_processed_rules(field.rules)
+        contract.__dict__["field_validators"] = field_validators
+        contract.__dict__["rules"] = rules
+        if len(reused) == len(fields) == len(old_fields) and contract.name == self.name:
+            contract.__dict__["pydantic_model"] = self.pydantic_model
+
+        changes = {
+            "added": [field.name for field in fields if field.name not in old_fields],
+            "removed": [name for name in old_fields if name not in field_validators],
+            "changed": [field.name for field in fields if field.name in old_fields and field.name not in reused],
+        }
+        self.__dict__ = contract.__dict__  # Swapped at once
+        return changes
 
     @cached_property
-    def pydantic_model(self) -> BaseModel:
-        return type(self.name, (BaseModel,), {
-            "__annotations__": {
-                name: field_validator.get_annotation()
-                for name, field_validator in self.field_validators.items()
-            }
+    def processed_dataset_rules(self) -> List[MatchedRule]:
+        processed_rules = []
+        for parsed_rule in self.dataset_rules:
+            for rule in RuleRegistry.dataset_rules:
+                if matched_rule := self.rule_parser.match(rule, parsed_rule):
+                    processed_rules.append(matched_rule)
+                    break
+            else:
+                raise RuleNotFoundError(f"Dataset rule not found for parsed rule: '{parsed_rule}'")
+        return processed_rules
+
+    def dataset_validator(self, max_keys: int = DEFAULT_MAX_KEYS, tmp_dir: Optional[str] = None) -> DatasetValidator:
+        """
+        A validator of the dataset rules for a single pass over a dataset. Each
+        check keeps up to `max_keys` keys in memory, spilling to `tmp_dir` beyond.
+        """
+        dataset_rules = DatasetRules(self.field_validators, max_keys, tmp_dir)
+        return DatasetValidator({
+            processed_rule.parsed_rule: processed_rule.rule_setter(self=dataset_rules, **processed_rule.resolved_values)
+            for processed_rule in self.processed_dataset_rules
         })
 
+    def profile(self, records: Iterable[Mapping[str, Any]] = (), **profile_kwargs) -> DataProfile:
+        """
+        Profiles the contract fields over the records in a single pass. More
+        records or batches of columns can be added to the returned profile.
+        """
+        profile = DataProfile(self.field_validators, **profile_kwargs)
+        for record in records:
+            profile.add(record)
+        return profile
+
+    @cached_property
+    def backend(self) -> ValidationBackend:
+        return self.backend_class(self)
+
+    def validate(self, item: dict, output: ValidationOutput = ValidationOutput.DICT) -> Validation:
+        """
+        Validates an item. A valid item is returned as a new dict of the
+        validated values (`"dict"`), as the pydantic model instance
+        (`"model"`), or as the input dict itself (`"input"`), the last two
+        without copying the values for pass-through pipelines.
+        """
+        return self.backend.validate(item, output)
+
+    def coerce(self, item: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        The values of the fields of an item coerced to their types, None when
+        they can't be, as `validate_batch` leaves them in its columns.
+        """
+        return {
+            name: field_validator.coerce_value(item.get(name))
+            for name, field_validator in self.field_validators.items()
+        }
+
+    def validate_batch(self, columns: Mapping[str, Sequence], size: Optional[int] = None) -> BatchValidation:
+        """
+        Validates a batch of rows given as columns, running the rules column by
+        column instead of building a model per row. Columns not referenced by the
+        contract are ignored and missing ones are filled with Nones.
+        """
+        if size is None:
+            size = len(next(iter(columns.values()), []))
+        validated_columns = {}
+        violations = defaultdict(dict)
+        for name, field_validator in self.field_validators.items():
+            values = columns.get(name)
+            if values is None:
+                values = [None] * size
+            validated_columns[name], field_violations = field_validator.validate_column(values)
+            for row, violation in field_violations.items():
+                violations[row][name] = violation.expand()
+        return BatchValidation(columns=validated_columns, violations=dict(violations), size=size)
+
+    @cached_property
+    def structural_fingerprint(self) -> str:
+        """
+        Hash of what the pydantic model depends on: the name, the fields and
+        their rules normalised to their templates and resolved values.
+        """
+        structure = {
+            "name": self.name,
+            "cache_size": self.cache_size,
+            "adaptive_order": self.adaptive_order,
+            "detailed": self.detailed,
+            "regex_timeout": self.regex_timeout,
+            "fields": [
+                [name, field_validator.type_name.value, field_validator.description,
+                 [normalize_rule(rule) for rule in self.rules.get(name, [])]]
+                for name, field_validator in self.field_validators.items()
+            ],
+        }
+        canonical = json.dumps(structure, sort_keys=True, separators=(",", ":"), default=fingerprint_value)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @cached_property
+    def pydantic_model(self) -> BaseModel:
+        """The model of the contract, shared by the structurally identical contracts of the process."""
+        fingerprint = self.structural_fingerprint
+        with MODEL_CACHE_LOCK:
+            model = MODEL_CACHE.get(fingerprint)
+            if model is None:
+                model = MODEL_CACHE[fingerprint] = type(self.name, (BaseModel,), {
+                    "__annotations__": {
+                        name: field_validator.get_annotation()
+                        for name, field_validator in self.field_validators.items()
+                    }
+                })
+        return model
+
+    @cached_property
+    def json_model(self) -> Type[BaseModel]:
+        """
+        The model of the contract to validate JSON with pydantic-core. It keeps
+        the unknown keys and validates the missing ones as Nones, like
+        `validate` does with the input items.
+        """
+        key = f"{self.structural_fingerprint}:json"
+        with MODEL_CACHE_LOCK:
+            model = MODEL_CACHE.get(key)
+            if model is None:
+                model = MODEL_CACHE[key] = type(self.name, (BaseModel,), {
+                    "__annotations__": {
+                        name: field_validator.get_annotation()
+                        for name, field_validator in self.field_validators.items()
+                    },
+                    **dict.fromkeys(self.field_validators),
+                    "model_config": ConfigDict(extra="allow", validate_default=True),
+                })
+        return model
+
+    @cached_property
+    def json_list_adapter(self) -> TypeAdapter:
+        return TypeAdapter(List[self.json_model])
+
+    def validate_json(self, data: Union[str, bytes]) -> Validation:
+        """
+        Validates a JSON object straight from its bytes, with the pydantic-core
+        parser instead of `json.loads` and `validate`. Unknown keys are kept by
+        the model.
+        """
+        return Validation.validate_json(self.json_model, data)
+
+    def validate_json_many(self, data: Union[str, bytes]) -> List[Validation]:
+        """Validates a JSON array of objects straight from its bytes."""
+        return Validation.validate_json_many(self.json_model, data, self.json_list_adapter)
+
     @cached_property
     def contract(self) -> dict:
         return {
@@ -106,9 +415,17 @@ class Contract:
                 }
                 for name, field_validator in self.field_validators.items()
             ],
-            "values": self.rule_parser.values
+            "values": self.values,
+            **({"dataset_rules": self.dataset_rules} if self.dataset_rules else {}),
         }
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """Hash of the canonical form of the contract, the content of its values files included."""
+        contract = {**self.contract, "values": self.rule_parser.values}
+        canonical = json.dumps(contract, sort_keys=True, separators=(",", ":"), default=fingerprint_value)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
     def to_json(self, indent: int=2) -> str:
         return json.dumps(self.contract, indent=indent, sort_keys=False)
 
@@ -132,5 +449,5 @@ class Contract:
                 }
                 for name, field_validator in self.field_validators.items()
             ],
-            "values": self.rule_parser.values
+            "values": self.values
         }
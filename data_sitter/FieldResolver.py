@@ -1,4 +1,4 @@
-from typing import  Dict, List, Type, Union
+from typing import  Dict, List, Optional, Type, Union
 
 from .field_types import BaseField
 from .rules import Rule, ProcessedRule, LogicalRule, MatchedRule, RuleRegistry, LogicalOperator
@@ -26,9 +26,11 @@ class FieldResolver:
         self._match_rule_cache = {}
 
     def get_field_validator(
-        self, name: str, parsed_rules: List[Union[str, dict]], description: str = None
+        self, name: str, parsed_rules: List[Union[str, dict]], description: str = None,
+        regex_timeout: Optional[float] = None,
     ) -> BaseField:
         field_validator = self.field_class(name, description)
+        field_validator.regex_timeout = regex_timeout  # Known by the regex rules when they are built
         processed_rules = self.get_processed_rules(parsed_rules)
         validators = [pr.get_validator(field_validator) for pr in processed_rules]
         field_validator.validators = validators
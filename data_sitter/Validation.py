@@ -1,39 +1,176 @@
+import json
 from collections import defaultdict
-from typing import Any, Dict, List, Type
+from enum import StrEnum
+from typing import Any, Dict, Iterator, List, Tuple, Type, Union
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .rules import RuleViolation
+
+
+class ValidationOutput(StrEnum):
+    """
+    What a successful validation returns as its item: the validated values in
+    a new dict, the pydantic model instance, or the input dict itself.
+    """
+    DICT = "dict"
+    MODEL = "model"
+    INPUT = "input"
 
 
 class Validation():
     item: Dict[str, Any]
-    errors: Dict[str, List[str]]
     unknowns: Dict[str, Any]
+    violations: Dict[str, List[RuleViolation]]
 
-    def __init__(self, item: dict, errors: dict = None, unknowns: dict = None):
+    def __init__(self, item: dict, errors: dict = None, unknowns: dict = None, violations: dict = None):
         self.item = item
-        self.errors = errors if errors else None
+        self._errors = errors if errors else None
         self.unknowns = unknowns if unknowns else None
+        self.violations = violations if violations else None
+
+    @property
+    def errors(self) -> Dict[str, List[str]]:
+        """Human-readable messages, rendered from the violations the first time they are requested."""
+        if self._errors is None and self.violations:
+            self._errors = {
+                field: [violation.message for violation in violations]
+                for field, violations in self.violations.items()
+            }
+        return self._errors
 
     def to_dict(self) -> dict:
         return {key: value for key in ["item", "errors", "unknowns"] if (value := getattr(self, key))}
 
     @classmethod
-    def validate(cls, PydanticModel: Type[BaseModel], input_item: dict) -> "Validation":
-        model_keys = PydanticModel.model_json_schema()['properties'].keys()
-        item = {key: None for key in model_keys}  # Filling not present values with Nones
-        errors = defaultdict(list)
-        unknowns = {}
-        for key, value in input_item.items():
-            if key in item:
-                item[key] = value
-            else:
-                unknowns[key] = value
+    def validate(
+        cls, PydanticModel: Type[BaseModel], input_item: dict, output: ValidationOutput = ValidationOutput.DICT
+    ) -> "Validation":
+        """
+        Validates an item with the model. With the `model` and `input` outputs
+        the model is not dumped back into a dict, invalid items are always
+        returned as dicts.
+        """
+        item, unknowns = split_item(PydanticModel, input_item)
+        try:
+            model = PydanticModel.model_validate(item)
+        except ValidationError as e:
+            return Validation(item=item, unknowns=unknowns, violations=get_violations(e.errors(include_url=False)))
+        return Validation(item=get_output(model, input_item, output), unknowns=unknowns)
+
+    @classmethod
+    def validate_json(cls, PydanticModel: Type[BaseModel], data: Union[str, bytes]) -> "Validation":
+        """
+        Validates a JSON object parsing it with pydantic-core. The model has to
+        allow extra keys, they are the unknowns. Only invalid items are parsed
+        again to report their input.
+        """
         try:
-            validated = PydanticModel(**item).model_dump()
+            model = PydanticModel.model_validate_json(data)
         except ValidationError as e:
-            validated = item
-            for error in e.errors():
-                field = error['loc'][0]  # Extract the field name
-                msg = error['msg']
-                errors[field].append(msg)
-        return Validation(item=validated, errors=dict(errors), unknowns=unknowns)
+            return cls.from_json_errors(PydanticModel, json.loads(data), e.errors(include_url=False))
+        return Validation(item=dict(model.__dict__), unknowns=model.__pydantic_extra__)
+
+    @classmethod
+    def validate_json_many(
+        cls, PydanticModel: Type[BaseModel], data: Union[str, bytes], ListAdapter: TypeAdapter = None
+    ) -> List["Validation"]:
+        """
+        Validates a JSON array of objects with an adapter of a list of the
+        model. When some item fails, the array is parsed again and the valid
+        items are validated one by one.
+        """
+        ListAdapter = ListAdapter or TypeAdapter(List[PydanticModel])
+        try:
+            models = ListAdapter.validate_json(data)
+        except ValidationError as e:
+            errors = e.errors(include_url=False)
+        else:
+            return [Validation(item=dict(model.__dict__), unknowns=model.__pydantic_extra__) for model in models]
+        input_items = json.loads(data)
+        if not isinstance(input_items, list):
+            raise TypeError(f"A JSON array is expected, got {type(input_items).__name__}.")
+        item_errors = defaultdict(list)
+        for error in errors:
+            row, *loc = error['loc']
+            item_errors[row].append({**error, 'loc': tuple(loc)})
+        return [
+            cls.from_json_errors(PydanticModel, input_item, item_errors[row]) if row in item_errors
+            else cls.validate(PydanticModel, input_item)
+            for row, input_item in enumerate(input_items)
+        ]
+
+    @classmethod
+    def from_json_errors(cls, PydanticModel: Type[BaseModel], input_item: Any, errors: List[dict]) -> "Validation":
+        if not isinstance(input_item, dict):
+            raise TypeError(f"A JSON object is expected, got {type(input_item).__name__}.")
+        item, unknowns = split_item(PydanticModel, input_item)
+        return Validation(item=item, unknowns=unknowns, violations=get_violations(errors))
+
+
+def get_output(model: BaseModel, input_item: dict, output: ValidationOutput) -> Any:
+    if output == ValidationOutput.DICT:
+        return model.model_dump()
+    if output == ValidationOutput.MODEL:
+        return model
+    if output == ValidationOutput.INPUT:
+        return input_item
+    raise ValueError(f"Unknown validation output: '{output}', available: {[o.value for o in ValidationOutput]}")
+
+
+def split_item(PydanticModel: Type[BaseModel], input_item: dict) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """The values of the model fields, filling the missing ones with Nones, and the unknown ones."""
+    item = dict.fromkeys(PydanticModel.model_fields)
+    unknowns = {}
+    for key, value in input_item.items():
+        if key in item:
+            item[key] = value
+        else:
+            unknowns[key] = value
+    return item, unknowns
+
+
+def get_violations(errors: List[dict]) -> Dict[str, List[RuleViolation]]:
+    violations = defaultdict(list)
+    for error in errors:
+        field = error['loc'][0]  # Extract the field name
+        violations[field].extend(RuleViolation.from_pydantic_error(error).expand())
+    return dict(violations)
+
+
+class BatchValidation():
+    """Result of validating a batch of rows column by column."""
+    columns: Dict[str, List[Any]]
+    violations: Dict[int, Dict[str, List[RuleViolation]]]
+    size: int
+
+    def __init__(self, columns: Dict[str, List[Any]], violations: Dict[int, Dict[str, List[RuleViolation]]], size: int):
+        self.columns = columns
+        self.violations = violations
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def invalid_rows(self) -> List[int]:
+        return sorted(self.violations)
+
+    @property
+    def errors(self) -> Dict[int, Dict[str, List[str]]]:
+        return {
+            row: {field: [violation.message for violation in violations] for field, violations in fields.items()}
+            for row, fields in sorted(self.violations.items())
+        }
+
+    def is_valid(self, row: int) -> bool:
+        return row not in self.violations
+
+    def get_item(self, row: int) -> Dict[str, Any]:
+        return {name: column[row] for name, column in self.columns.items()}
+
+    def get_validation(self, row: int) -> Validation:
+        return Validation(item=self.get_item(row), violations=self.violations.get(row))
+
+    def __iter__(self) -> Iterator[Validation]:
+        return (self.get_validation(row) for row in range(self.size))
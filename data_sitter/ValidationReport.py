@@ -0,0 +1,106 @@
+from math import sqrt
+from collections import Counter, defaultdict
+from statistics import NormalDist
+from typing import Dict, Tuple
+
+from .Validation import BatchValidation, Validation
+
+
+DEFAULT_CONFIDENCE = 0.95
+
+
+def wilson_interval(failures: int, total: int, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+    """Wilson score interval of a failure rate, well behaved for small samples and rates near 0 or 1."""
+    if total == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rate = failures / total
+    denominator = 1 + z ** 2 / total
+    centre = (rate + z ** 2 / (2 * total)) / denominator
+    margin = z * sqrt(rate * (1 - rate) / total + z ** 2 / (4 * total ** 2)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+class ValidationReport:
+    """Aggregated counts of the validations of a dataset, per field and rule."""
+    rows: int
+    invalid_rows: int
+    field_failures: Dict[str, int]
+    rule_failures: Dict[str, Dict[str, int]]
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.invalid_rows = 0
+        self.field_failures = Counter()
+        self.rule_failures = defaultdict(Counter)
+
+    def add(self, validation: Validation):
+        self.rows += 1
+        if not validation.violations:
+            return
+        self.invalid_rows += 1
+        for field, violations in validation.violations.items():
+            self.field_failures[field] += 1
+            for violation in violations:
+                self.rule_failures[field][violation.rule_id] += 1
+
+    def add_batch(self, batch_validation: BatchValidation):
+        self.rows += len(batch_validation)
+        self.invalid_rows += len(batch_validation.violations)
+        for fields in batch_validation.violations.values():
+            for field, violations in fields.items():
+                self.field_failures[field] += 1
+                for violation in violations:
+                    self.rule_failures[field][violation.rule_id] += 1
+
+    def merge(self, other: "ValidationReport") -> "ValidationReport":
+        self.rows += other.rows
+        self.invalid_rows += other.invalid_rows
+        self.field_failures.update(other.field_failures)
+        for field, rules in other.rule_failures.items():
+            self.rule_failures[field].update(rules)
+        return self
+
+    def _rate(self, failures: int, confidence: float) -> dict:
+        low, high = wilson_interval(failures, self.rows, confidence)
+        return {
+            "failures": failures,
+            "rate": failures / self.rows if self.rows else 0.0,
+            "interval": [low, high],
+        }
+
+    def failure_rates(self, confidence: float = DEFAULT_CONFIDENCE) -> dict:
+        """Estimated failure rates, with their confidence intervals, of the rows, fields and rules."""
+        return {
+            "rows": self.rows,
+            "confidence": confidence,
+            "invalid_rows": self._rate(self.invalid_rows, confidence),
+            "fields": {
+                field: {
+                    **self._rate(failures, confidence),
+                    "rules": {
+                        rule_id: self._rate(rule_failures, confidence)
+                        for rule_id, rule_failures in self.rule_failures[field].items()
+                    },
+                }
+                for field, failures in self.field_failures.items()
+            },
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "invalid_rows": self.invalid_rows,
+            "field_failures": dict(self.field_failures),
+            "rule_failures": {field: dict(rules) for field, rules in self.rule_failures.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, report_dict: dict) -> "ValidationReport":
+        report = cls()
+        report.rows = report_dict["rows"]
+        report.invalid_rows = report_dict["invalid_rows"]
+        report.field_failures.update(report_dict["field_failures"])
+        for field, rules in report_dict["rule_failures"].items():
+            report.rule_failures[field].update(rules)
+        return report
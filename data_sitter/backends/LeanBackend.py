@@ -0,0 +1,88 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from .ValidationBackend import ValidationBackend, register_backend
+from ..Validation import Validation, ValidationOutput
+from ..field_types import BaseField
+from ..field_types.BaseField import aggregated_validator
+from ..rules import RuleViolation
+
+
+EXACT_TYPES = (int, float, str, bool)
+
+
+def get_coercer(field_validator: BaseField) -> Callable[[Any], Any]:
+    """
+    Coerces a value to the type of the field. Values already of a plain type
+    of the field are returned as they are, the others are coerced by a
+    pydantic adapter of the type alone, with the same result and errors the
+    model of the contract has.
+    """
+    field_type = field_validator.field_type
+    is_optional = field_validator.is_optional
+    adapter = TypeAdapter(Optional[field_type] if is_optional else field_type)
+    exact_type = field_type if field_type in EXACT_TYPES else None
+    validate_python = adapter.validate_python
+
+    def coerce(value):
+        if value.__class__ is exact_type or (value is None and is_optional):
+            return value
+        return validate_python(value)
+    return coerce
+
+
+def to_violations(error: Exception) -> List[RuleViolation]:
+    """The violations pydantic would report for an error raised by a field validator."""
+    if isinstance(error, RuleViolation):
+        return error.expand()
+    if isinstance(error, AssertionError):
+        return [RuleViolation("assertion_error", f"Assertion failed, {error}")]
+    return [RuleViolation("value_error", f"Value error, {error}")]
+
+
+@register_backend
+class LeanBackend(ValidationBackend):
+    """
+    Validates an item running the coercion and the validators of each field
+    directly, without building a pydantic model nor dumping it. The results
+    are the same as the pydantic backend ones.
+    """
+    name = "lean"
+    fields: List[Tuple[str, Callable[[Any], Any], Callable[[Any], Any]]]
+
+    def __init__(self, contract) -> None:
+        super().__init__(contract)
+        self.fields = [
+            (name, get_coercer(field_validator), aggregated_validator(
+                field_validator.validators, field_validator.is_optional, field_validator.cache,
+                field_validator.ordering, field_validator.detailed,
+            ))
+            for name, field_validator in contract.field_validators.items()
+        ]
+        self.names = [name for name, _, _ in self.fields]
+
+    def validate(self, input_item: dict, output: ValidationOutput = ValidationOutput.DICT) -> Validation:
+        item = dict.fromkeys(self.names)
+        unknowns = {}
+        for key, value in input_item.items():
+            if key in item:
+                item[key] = value
+            else:
+                unknowns[key] = value
+        validated = dict.fromkeys(self.names)
+        violations = {}
+        for name, coerce, validator in self.fields:
+            try:
+                validated[name] = validator(coerce(item[name]))
+            except ValidationError as e:
+                violations[name] = [RuleViolation.from_pydantic_error(error) for error in e.errors(include_url=False)]
+            except (ValueError, AssertionError) as e:
+                violations[name] = to_violations(e)
+        if violations or output == ValidationOutput.DICT:
+            return Validation(item=item if violations else validated, unknowns=unknowns, violations=violations)
+        if output == ValidationOutput.MODEL:  # Already validated, the model is only filled
+            return Validation(item=self.contract.pydantic_model.model_construct(**validated), unknowns=unknowns)
+        if output == ValidationOutput.INPUT:
+            return Validation(item=input_item, unknowns=unknowns)
+        raise ValueError(f"Unknown validation output: '{output}', available: {[o.value for o in ValidationOutput]}")
@@ -0,0 +1,11 @@
+from .ValidationBackend import ValidationBackend, register_backend
+from ..Validation import Validation, ValidationOutput
+
+
+@register_backend
+class PydanticBackend(ValidationBackend):
+    """Validates an item building the pydantic model of the contract."""
+    name = "pydantic"
+
+    def validate(self, item: dict, output: ValidationOutput = ValidationOutput.DICT) -> Validation:
+        return Validation.validate(self.contract.pydantic_model, item, output)
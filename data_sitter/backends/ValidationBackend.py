@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, Type, Union
+
+from ..Validation import Validation, ValidationOutput
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..Contract import Contract
+
+
+class BackendNotFound(KeyError):
+    """No backend registered with the given name."""
+
+
+class ValidationBackend(ABC):
+    """Runs the validation of single items of a contract."""
+    name: str
+    contract: "Contract"
+
+    def __init__(self, contract: "Contract") -> None:
+        self.contract = contract
+
+    @abstractmethod
+    def validate(self, item: dict, output: ValidationOutput) -> Validation:
+        pass  # pragma: no cover
+
+
+BACKENDS: Dict[str, Type[ValidationBackend]] = {}
+
+
+def register_backend(backend_class: Type[ValidationBackend]) -> Type[ValidationBackend]:
+    BACKENDS[backend_class.name] = backend_class
+    return backend_class
+
+
+def get_backend(backend: Union[str, Type[ValidationBackend]]) -> Type[ValidationBackend]:
+    if isinstance(backend, type) and issubclass(backend, ValidationBackend):
+        return backend
+    if backend not in BACKENDS:
+        raise BackendNotFound(f"Backend not found: '{backend}', available: {sorted(BACKENDS)}")
+    return BACKENDS[backend]
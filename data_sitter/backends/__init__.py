@@ -0,0 +1,14 @@
+from .ValidationBackend import BACKENDS, BackendNotFound, ValidationBackend, get_backend, register_backend
+from .PydanticBackend import PydanticBackend
+from .LeanBackend import LeanBackend
+
+
+__all__ = [
+    "BACKENDS",
+    "BackendNotFound",
+    "ValidationBackend",
+    "get_backend",
+    "register_backend",
+    "PydanticBackend",
+    "LeanBackend",
+]
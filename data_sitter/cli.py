@@ -1,18 +1,259 @@
-import csv
+import sys
 import json
+import asyncio
 import argparse
 from pathlib import Path
+from itertools import islice
+from contextlib import ExitStack
+from typing import Iterable, Iterator, Optional, Tuple
 
 from .Contract import Contract
+from .backends import BACKENDS
+from .dataset_rules import DatasetValidator
+from .dataset_rules.UniqueKeyTracker import DEFAULT_MAX_KEYS
+from .Validation import BatchValidation, Validation, ValidationOutput
+from .ValidationReport import DEFAULT_CONFIDENCE, ValidationReport
+from .io import read_records, open_writer
+from .io.sampling import sample_records
+from .io.checkpoint import DEFAULT_CHECKPOINT_EVERY, Checkpoint
+from .io.readers import DEFAULT_BUFFER_SIZE, get_data_suffix
+from .io.typed_csv import convert_record, get_field_types, validate_csv_file
+from .io.arrow import DEFAULT_BATCH_SIZE, is_columnar_file, validate_arrow_file
+from .profiling import DataProfile, profile_file
+from .server import ContractPool, ValidationServer
+from .server.MicroBatcher import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_LATENCY
+from .server.ValidationServer import DEFAULT_HOST, DEFAULT_PORT
+from .profiling.ColumnProfile import DEFAULT_TOP_K
 
 
 DEFAULT_ENCODING = "utf8"
 
+
+class TooManyErrors(Exception):
+    """The number of invalid rows reached the configured maximum."""
+
+
+class InvalidRow(Exception):
+    """A row of the file does not pass the contract."""
+
+
+class InvalidDataset(Exception):
+    """The rows do not pass the dataset rules of the contract."""
+
+
+def validate_records(
+    contract: Contract, records: Iterable[dict], csv_cells: bool = False
+) -> Iterator[Tuple[dict, Validation]]:
+    """Validates the records, CSV cells converted as `validate_csv_file` does. The records are yielded as read."""
+    if csv_cells:
+        field_types = get_field_types(contract)
+        for record in records:
+            yield record, contract.validate(convert_record(record, field_types))
+        return
+    for record in records:
+        yield record, contract.validate(record)
+
+
+def validate_batches(batch_validations: Iterable[BatchValidation]) -> Iterator[Tuple[dict, Validation]]:
+    for batch_validation in batch_validations:
+        for validation in batch_validation:
+            yield validation.item, validation
+
+
+def track_validations(
+    contract: Contract, dataset_validator: DatasetValidator, validations: Iterable[Tuple[dict, Validation]]
+) -> Iterator[Tuple[dict, Validation]]:
+    """
+    Adds the coerced values of the rows to the dataset rules, the valid rows
+    already have them. Values that can't be coerced are None and not checked,
+    as in the batches.
+    """
+    for record, validation in validations:
+        dataset_validator.add(contract.coerce(validation.item) if validation.violations else validation.item)
+        yield record, validation
+
+
+def track_batches(
+    dataset_validator: DatasetValidator, batch_validations: Iterable[BatchValidation]
+) -> Iterator[BatchValidation]:
+    for batch_validation in batch_validations:
+        dataset_validator.add_batch(batch_validation.columns, len(batch_validation))
+        yield batch_validation
+
+
+def check_batches(batch_validations: Iterable[BatchValidation]):
+    """Raises on the first invalid row of the batches."""
+    offset = 0
+    for batch_validation in batch_validations:
+        if batch_validation.violations:
+            row = batch_validation.invalid_rows[0]
+            raise InvalidRow(f"Row {offset + row + 1} errors: {batch_validation.errors[row]}")
+        offset += len(batch_validation)
+
+
+def check_validations(validations: Iterable[Tuple[dict, Validation]]):
+    """Raises on the first invalid row of the validations."""
+    for row, (_, validation) in enumerate(validations):
+        if validation.violations:
+            raise InvalidRow(f"Row {row + 1} errors: {validation.errors}")
+
+
+def convert_records(contract: Contract, records: Iterable[dict]) -> Iterator[dict]:
+    """Converts the cells of CSV records to the field types, as the CSV files validated by columns are."""
+    field_types = get_field_types(contract)
+    for record in records:
+        yield convert_record(record, field_types)
+
+
+def sample_report(
+    contract: Contract, records: Iterable[dict], confidence: float = DEFAULT_CONFIDENCE
+) -> dict:
+    """Estimated failure rates per field and rule from a sample of the records."""
+    report = ValidationReport()
+    for record in records:
+        report.add(contract.validate(record, output=ValidationOutput.INPUT))
+    return report.failure_rates(confidence)
+
+
+def quarantine(
+    validations: Iterable[Tuple[dict, Validation]],
+    output: Optional[Path] = None,
+    rejects: Optional[Path] = None,
+    max_errors: Optional[int] = None,
+    encoding: str = DEFAULT_ENCODING,
+    checkpoint: Optional[Checkpoint] = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+) -> ValidationReport:
+    """
+    Routes the validated records in a single pass, valid rows to `output` and
+    invalid rows, with their errors, to `rejects`.
+    With a checkpoint, the validations continue its report and output files
+    and its progress is saved every `checkpoint_every` rows.
+    Returns the report of the validated rows.
+    """
+    report = checkpoint.report if checkpoint else ValidationReport()
+    resume_at = checkpoint.outputs if checkpoint else {}
+    with ExitStack() as stack:
+        writers = {
+            name: stack.enter_context(open_writer(path, encoding, resume_at=resume_at.get(name)))
+            for name, path in (("output", output), ("rejects", rejects)) if path
+        }
+        output_writer, rejects_writer = writers.get("output"), writers.get("rejects")
+        for record, validation in validations:
+            report.add(validation)
+            row = report.rows
+            if validation.errors is None:
+                if output_writer:
+                    output_writer.write(record)
+            else:
+                if rejects_writer:
+                    rejects_writer.write_reject(row, record, validation.errors)
+                if max_errors is not None and report.invalid_rows >= max_errors:
+                    raise TooManyErrors(f"Aborted after {report.invalid_rows} invalid rows (row {row}).")
+            if checkpoint and row % checkpoint_every == 0:
+                checkpoint.save({name: writer.tell() for name, writer in writers.items()})
+    return report
+
+
+def profile_main(argv=None):
+    parser = argparse.ArgumentParser(prog='data-sitter profile', description='Profile the columns of a data file')
+    parser.add_argument('-f', '--file', required=True, help='Path to data file')
+    parser.add_argument('-c', '--contract', help='Path to contract file, only its fields are profiled')
+    parser.add_argument('-e', '--encoding', help='Files Encoding', default=DEFAULT_ENCODING)
+    parser.add_argument('--buffer-size', type=int, default=DEFAULT_BUFFER_SIZE, help='Read buffer size in bytes')
+    parser.add_argument(
+        '--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Rows per record batch for Parquet/Arrow files'
+    )
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP_K, help='Number of most frequent values per column')
+    args = parser.parse_args(argv)
+
+    file_path = Path(args.file)
+    if args.contract:
+        contract_path = Path(args.contract)
+        contract_dict = json.loads(contract_path.read_text(args.encoding))
+        profile = Contract.from_dict(contract_dict, values_dir=contract_path.parent).profile(top_k=args.top)
+    else:
+        profile = DataProfile(top_k=args.top)
+    profile_file(file_path, profile, args.encoding, args.buffer_size, args.batch_size)
+    print(json.dumps(profile.to_dict(), indent=2, default=str))
+
+
+def regex_timeout(args: argparse.Namespace) -> Optional[float]:
+    return args.regex_timeout_ms / 1000 if args.regex_timeout_ms else None
+
+
+def serve_main(argv=None):
+    parser = argparse.ArgumentParser(prog='data-sitter serve', description='Serve contracts over local HTTP')
+    parser.add_argument(
+        '-c', '--contract', required=True, action='append', help='Path to contract file, can be repeated'
+    )
+    parser.add_argument('-e', '--encoding', help='Files Encoding', default=DEFAULT_ENCODING)
+    parser.add_argument('--host', default=DEFAULT_HOST, help='Host to listen on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port to listen on')
+    parser.add_argument(
+        '--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE, help='Records per micro-batch'
+    )
+    parser.add_argument(
+        '--max-latency-ms', type=float, default=DEFAULT_MAX_LATENCY * 1000,
+        help='Time a micro-batch waits for more records'
+    )
+    parser.add_argument('--cache-size', type=int, help='Memoize the validation of up to this number of values per field')
+    parser.add_argument(
+        '--adaptive-order', action='store_true', help='Run first the rules rejecting the most values for their cost'
+    )
+    parser.add_argument('--all-errors', action='store_true', help='Report all the failing rules of each value')
+    parser.add_argument('--regex-timeout-ms', type=float, help='Time budget of the regex rules per value')
+    args = parser.parse_args(argv)
+
+    pool = ContractPool.from_files(
+        args.contract, args.encoding, cache_size=args.cache_size,
+        adaptive_order=args.adaptive_order, detailed=args.all_errors, regex_timeout=regex_timeout(args),
+    )
+    server = ValidationServer(pool, args.host, args.port, args.max_batch_size, args.max_latency_ms / 1000)
+    print(f"Serving {pool.names} on http://{args.host}:{args.port}")
+    asyncio.run(server.serve_forever())
+
+
 def main():
+    if sys.argv[1:2] == ['profile']:
+        return profile_main(sys.argv[2:])
+    if sys.argv[1:2] == ['serve']:
+        return serve_main(sys.argv[2:])
     parser = argparse.ArgumentParser(description='Data Sitter CLI')
     parser.add_argument('-c', '--contract', required=True, help='Path to contract file')
     parser.add_argument('-f', '--file', required=True, help='Path to data file')
     parser.add_argument('-e', '--encoding', help='Files Encoding', default=DEFAULT_ENCODING)
+    parser.add_argument('--buffer-size', type=int, default=DEFAULT_BUFFER_SIZE, help='Read buffer size in bytes')
+    parser.add_argument(
+        '--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Rows per batch for Parquet/Arrow and CSV files'
+    )
+    parser.add_argument('-o', '--output', help='Path to write the valid rows to (CSV/NDJSON)')
+    parser.add_argument('-r', '--rejects', help='Path to write the invalid rows and their errors to (CSV/NDJSON)')
+    parser.add_argument('--max-errors', type=int, help='Abort after this number of invalid rows')
+    sampling = parser.add_mutually_exclusive_group()
+    sampling.add_argument('--sample', type=int, help='Validate only a random sample of this number of rows')
+    sampling.add_argument('--sample-fraction', type=float, help='Validate only a random fraction of the rows')
+    parser.add_argument('--seed', type=int, help='Seed of the random sample')
+    parser.add_argument(
+        '--confidence', type=float, default=DEFAULT_CONFIDENCE, help='Confidence level of the sampled failure rates'
+    )
+    parser.add_argument('--cache-size', type=int, help='Memoize the validation of up to this number of values per field')
+    parser.add_argument(
+        '--adaptive-order', action='store_true', help='Run first the rules rejecting the most values for their cost'
+    )
+    parser.add_argument('--all-errors', action='store_true', help='Report all the failing rules of each value')
+    parser.add_argument('--regex-timeout-ms', type=float, help='Time budget of the regex rules per value')
+    parser.add_argument(
+        '--backend', default='pydantic', choices=sorted(BACKENDS), help='Backend validating the rows one by one (JSON files, --sample and quarantine)'
+    )
+    parser.add_argument('--checkpoint', help='Path of the checkpoint file to save the progress to and resume from')
+    parser.add_argument(
+        '--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY, help='Rows between checkpoints'
+    )
+    parser.add_argument(
+        '--max-keys', type=int, default=DEFAULT_MAX_KEYS,
+        help='Keys kept in memory per uniqueness rule before spilling them to disk'
+    )
 
     args = parser.parse_args()
     # Add your logic here using args.contract and args.file
@@ -22,25 +263,68 @@ def main():
     encoding = args.encoding
     contract_path = Path(args.contract)
     contract_dict = json.loads(contract_path.read_text(encoding))
-    contract = Contract.from_dict(contract_dict)
-    pydantic_contract = contract.pydantic_model
-
-    if file_path.suffix == '.csv':
-        with open(file_path, encoding=encoding) as f:
-            reader = csv.DictReader(f)
-            reader.fieldnames = [name.strip() for name in reader.fieldnames]
-            records = [{k: v.strip() for k, v in row.items()} for row in reader]
-
-    elif file_path.suffix == '.json':
-        file_data = json.loads(file_path.read_text(encoding))
-        if isinstance(file_data, dict):
-            records = [file_data]
+    contract = Contract.from_dict(
+        contract_dict, cache_size=args.cache_size, values_dir=contract_path.parent,
+        adaptive_order=args.adaptive_order, detailed=args.all_errors, regex_timeout=regex_timeout(args),
+        backend=args.backend,
+    )
+    columnar = is_columnar_file(file_path)
+    if args.sample is not None or args.sample_fraction is not None:
+        if columnar:
+            parser.error("--sample and --sample-fraction are only implemented for CSV and JSON files")
+        records = sample_records(
+            file_path, args.sample, args.sample_fraction, encoding, args.buffer_size, args.seed
+        )
+        if get_data_suffix(file_path) == '.csv':
+            records = convert_records(contract, records)
+        print(json.dumps(sample_report(contract, records, args.confidence), indent=2))
+        return
+
+    if args.checkpoint and contract.dataset_rules:
+        parser.error("--checkpoint can't be used with a contract with dataset rules")
+    dataset_validator = contract.dataset_validator(args.max_keys) if contract.dataset_rules else None
+    checkpoint = Checkpoint.open(args.checkpoint, contract, file_path) if args.checkpoint else None
+    skip_rows = checkpoint.rows if checkpoint else 0
+    if columnar:
+        batch_validations = validate_arrow_file(contract, file_path, args.batch_size, skip_rows)
+    else:
+        records = islice(read_records(file_path, encoding, args.buffer_size), skip_rows, None)
+
+    quarantining = args.output or args.rejects or args.max_errors is not None or checkpoint
+    if quarantining:
+        if columnar:
+            validations = validate_batches(batch_validations)
         else:
-            records = file_data
+            validations = validate_records(contract, records, csv_cells=get_data_suffix(file_path) == '.csv')
+        if dataset_validator:
+            validations = track_validations(contract, dataset_validator, validations)
+        report = quarantine(
+            validations, args.output, args.rejects, args.max_errors, encoding, checkpoint, args.checkpoint_every
+        )
+        if checkpoint:
+            checkpoint.remove()
+        print(f"{report.rows - report.invalid_rows} valid and {report.invalid_rows} invalid rows in {args.file}")
+    elif columnar or get_data_suffix(file_path) == '.csv':
+        if not columnar:
+            batch_validations = validate_csv_file(contract, file_path, encoding, args.buffer_size, args.batch_size)
+        if dataset_validator:
+            batch_validations = track_batches(dataset_validator, batch_validations)
+        check_batches(batch_validations)
     else:
-        raise NotImplementedError(f"Type {file_path.suffix} not implemented.")
+        validations = validate_records(contract, records)
+        if dataset_validator:
+            validations = track_validations(contract, dataset_validator, validations)
+        check_validations(validations)
 
-    _ = [pydantic_contract.model_validate(row) for row in records]
+    dataset_violations = dataset_validator.violations() if dataset_validator else {}
+    for rule, violations in dataset_violations.items():
+        print(f"{rule}: {len(violations)} failures")
+        for violation in violations:
+            print(f"  {violation}")
+    if quarantining and (report.invalid_rows or dataset_violations):
+        return
+    if dataset_violations:
+        raise InvalidDataset(f"Dataset rules failing: {list(dataset_violations)}")
     print(f"The file {args.file} pass the contract {args.contract}")
 
 
@@ -0,0 +1,106 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .UniqueKeyTracker import DEFAULT_MAX_KEYS, DEFAULT_MAX_ROWS_PER_KEY, Duplicate, UniqueKeyTracker
+from ..rules import RuleViolation, register_rule, register_dataset_rules
+
+
+class UnknownDatasetField(Exception):
+    """A dataset rule references a field not in the contract."""
+
+
+class UniqueCheck:
+    """Checks a key of one or more fields is unique across the dataset, nulls excluded."""
+    fields: Tuple[str, ...]
+    tracker: UniqueKeyTracker
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        max_keys: int = DEFAULT_MAX_KEYS,
+        tmp_dir: Optional[str] = None,
+        max_rows_per_key: int = DEFAULT_MAX_ROWS_PER_KEY,
+    ):
+        self.fields = tuple(fields)
+        self.tracker = UniqueKeyTracker(max_keys, tmp_dir, max_rows_per_key)
+
+    def add(self, item: Mapping[str, Any], row: int):
+        key = tuple(item.get(field) for field in self.fields)
+        if None not in key:
+            self.tracker.add(key, row)
+
+    def add_batch(self, columns: Mapping[str, Sequence], size: int, first_row: int):
+        keys = zip(*(columns.get(field) or [None] * size for field in self.fields))
+        add = self.tracker.add
+        for row, key in enumerate(keys, first_row):
+            if None not in key:
+                add(key, row)
+
+    def violations(self) -> Iterable[Tuple[Duplicate, RuleViolation]]:
+        for duplicate in self.tracker.duplicates():
+            if duplicate.count > len(duplicate.rows):  # Only the first rows were kept
+                yield duplicate, RuleViolation(
+                    "unique", "Key {key} is repeated {count} times, first at rows {rows}.",
+                    key=duplicate.key, rows=duplicate.rows, count=duplicate.count,
+                )
+            else:
+                yield duplicate, RuleViolation(
+                    "unique", "Key {key} is repeated at rows {rows}.", key=duplicate.key, rows=duplicate.rows
+                )
+
+
+@register_dataset_rules
+class DatasetRules:
+    """The rules checking the dataset as a whole, they can reference any field of the contract."""
+    field_names: List[str]
+    max_keys: int
+    tmp_dir: Optional[str]
+
+    def __init__(self, field_names: Iterable[str], max_keys: int = DEFAULT_MAX_KEYS, tmp_dir: Optional[str] = None):
+        self.field_names = list(field_names)
+        self.max_keys = max_keys
+        self.tmp_dir = tmp_dir
+
+    def check_fields(self, fields: Sequence[str]):
+        if unknown := [field for field in fields if field not in self.field_names]:
+            raise UnknownDatasetField(f"Fields not in the contract: {unknown}")
+
+    @register_rule("Column {field:String} is unique")
+    def validate_unique_column(self, field: str):
+        self.check_fields([field])
+        return UniqueCheck([field], self.max_keys, self.tmp_dir)
+
+    @register_rule("Columns {fields:Strings} are unique")
+    def validate_unique_columns(self, fields: List[str]):
+        self.check_fields(fields)
+        return UniqueCheck(fields, self.max_keys, self.tmp_dir)
+
+
+class DatasetValidator:
+    """
+    Runs the dataset rules of a contract over all the rows of a dataset, fed
+    one item or one batch at a time. Rows are numbered from 1.
+    """
+    checks: Dict[str, UniqueCheck]
+    rows: int
+
+    def __init__(self, checks: Dict[str, UniqueCheck]) -> None:
+        self.checks = checks
+        self.rows = 0
+
+    def add(self, item: Mapping[str, Any]):
+        self.rows += 1
+        for check in self.checks.values():
+            check.add(item, self.rows)
+
+    def add_batch(self, columns: Mapping[str, Sequence], size: int):
+        for check in self.checks.values():
+            check.add_batch(columns, size, self.rows + 1)
+        self.rows += size
+
+    def violations(self) -> Dict[str, List[RuleViolation]]:
+        """The violations of each dataset rule, only for the rules failing."""
+        violations = {}
+        for rule, check in self.checks.items():
+            if rule_violations := [violation for _, violation in check.violations()]:
+                violations[rule] = rule_violations
+        return violations
@@ -0,0 +1,110 @@
+import json
+import heapq
+import tempfile
+from itertools import groupby
+from operator import itemgetter
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+DEFAULT_MAX_KEYS = 1_000_000
+DEFAULT_MAX_ROWS_PER_KEY = 100
+
+
+class Duplicate(NamedTuple):
+    key: Tuple[Any, ...]
+    rows: List[int]
+    count: int
+
+
+def encode_key(key: Tuple[Any, ...]) -> str:
+    return json.dumps(key, default=str, separators=(",", ":"))
+
+
+def read_run(run: IO[str]) -> Iterator[Tuple[str, List[int], int]]:
+    run.seek(0)
+    for line in run:
+        yield tuple(json.loads(line))
+
+
+class UniqueKeyTracker:
+    """
+    Finds the keys seen more than once, the first rows they were seen at and
+    how many times.
+
+    Up to `max_keys` distinct keys are kept in memory, once the cap is exceeded
+    they are spilled to a temporary file as a sorted run. The runs are merged
+    at the end to find the keys repeated across them. Only the first
+    `max_rows_per_key` rows of a key are kept, the others are only counted.
+    """
+    max_keys: int
+    max_rows_per_key: int
+    keys: Dict[str, List[int]]
+    extra_rows: Dict[str, int]
+    runs: List[IO[str]]
+
+    def __init__(
+        self,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        tmp_dir: Optional[str] = None,
+        max_rows_per_key: int = DEFAULT_MAX_ROWS_PER_KEY,
+    ) -> None:
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1.")
+        if max_rows_per_key < 2:
+            raise ValueError("max_rows_per_key must be at least 2.")
+        self.max_keys = max_keys
+        self.max_rows_per_key = max_rows_per_key
+        self.tmp_dir = tmp_dir
+        self.keys = {}
+        self.extra_rows = {}
+        self.runs = []
+
+    def add(self, key: Tuple[Any, ...], row: int):
+        rows = self.keys.get(encoded := encode_key(key))
+        if rows is None:
+            self.keys[encoded] = [row]
+            if len(self.keys) > self.max_keys:
+                self.spill()
+        elif len(rows) < self.max_rows_per_key:
+            rows.append(row)
+        else:
+            self.extra_rows[encoded] = self.extra_rows.get(encoded, 0) + 1
+
+    def spill(self):
+        run = tempfile.TemporaryFile("w+", encoding="utf8", dir=self.tmp_dir)
+        for encoded, rows in sorted(self.keys.items()):
+            run.write(json.dumps([encoded, rows, self.extra_rows.get(encoded, 0)], separators=(",", ":")))
+            run.write("\n")
+        self.runs.append(run)
+        self.keys = {}
+        self.extra_rows = {}
+
+    def merged_keys(self) -> Iterator[Tuple[str, List[int], int]]:
+        """The keys with their first rows and the number of the other rows, from the oldest run to the newest."""
+        if not self.runs:
+            return ((encoded, rows, self.extra_rows.get(encoded, 0)) for encoded, rows in self.keys.items())
+        if self.keys:
+            self.spill()
+        runs = heapq.merge(*(read_run(run) for run in self.runs), key=itemgetter(0))
+        return (self.merge_group(encoded, list(group)) for encoded, group in groupby(runs, key=itemgetter(0)))
+
+    def merge_group(self, encoded: str, group: List[Tuple[str, List[int], int]]) -> Tuple[str, List[int], int]:
+        rows = [row for _, run_rows, _ in group for row in run_rows]
+        extra = sum(run_extra for _, _, run_extra in group) + max(len(rows) - self.max_rows_per_key, 0)
+        return encoded, rows[:self.max_rows_per_key], extra
+
+    def duplicates(self) -> Iterator[Duplicate]:
+        """The repeated keys, found with an external merge when keys were spilled to disk."""
+        try:
+            for encoded, rows, extra in self.merged_keys():
+                if len(rows) > 1:
+                    yield Duplicate(tuple(json.loads(encoded)), sorted(rows), len(rows) + extra)
+        finally:
+            self.close()
+
+    def close(self):
+        for run in self.runs:
+            run.close()
+        self.runs = []
+        self.keys = {}
+        self.extra_rows = {}
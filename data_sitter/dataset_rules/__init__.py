@@ -0,0 +1,12 @@
+from .UniqueKeyTracker import Duplicate, UniqueKeyTracker
+from .DatasetRules import DatasetRules, DatasetValidator, UniqueCheck, UnknownDatasetField
+
+
+__all__ = [
+    "Duplicate",
+    "UniqueKeyTracker",
+    "DatasetRules",
+    "DatasetValidator",
+    "UniqueCheck",
+    "UnknownDatasetField",
+]
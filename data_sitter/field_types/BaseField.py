@@ -1,31 +1,142 @@
 from abc import ABC
-from typing import Annotated, Callable, List, Optional, Type
+from time import perf_counter
+from collections import defaultdict
+from typing import Annotated, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
 
-from pydantic import AfterValidator, Field
+from pydantic import AfterValidator, Field, TypeAdapter, ValidationError
 
 from .FieldTypes import FieldTypes
-from ..rules import register_rule, register_field
+from .EncodedColumn import DICTIONARY_RATIO, EncodedColumn, factorize
+from .RuleOrdering import RuleOrdering
+from .ValidationCache import DEFAULT_CACHE_SIZE, MISSING, ValidationCache
+from .safe_regex import alarm_handler
+from ..rules import RuleViolation, RuleViolations, register_rule, register_field
 
 
 class NotInitialisedError(Exception):
     """The field instance is initialised without validators"""
 
 
-def aggregated_validator(validators: List[Callable], is_optional: bool):
-    def validator(value):
-        if is_optional and value is None:
+def aggregated_validator(
+    validators: List[Callable],
+    is_optional: bool,
+    cache: Optional[ValidationCache] = None,
+    ordering: Optional[RuleOrdering] = None,
+    detailed: bool = False,
+):
+    """
+    Runs the validators of a field on a value. By default it stops at the first
+    failure, in the order of the `ordering` when given. When `detailed`, every
+    validator runs and all the failures are raised, in the contract order.
+    """
+    if detailed:
+        def validator(value):
+            if is_optional and value is None:
+                return value
+            violations = [
+                violation for validator_func in validators
+                if (violation := get_violation(validator_func, value)) is not None
+            ]
+            if violations:
+                raise RuleViolations.group(violations)
+            return value
+    elif ordering is not None:
+        def validator(value):
+            if is_optional and value is None:
+                return value
+            if ordering.should_sample():
+                return sampled_validation(validators, ordering, value)
+            for index in ordering.order:
+                validators[index](value)
+            return value
+    else:
+        def validator(value):
+            if is_optional and value is None:
+                return value
+            for validator_func in validators:
+                validator_func(value)
             return value
-        for validator_func in validators:
-            validator_func(value)
+
+    if cache is None:
+        return validator
+
+    def cached_validator(value):
+        if not cache.enabled:
+            return validator(value)
+        outcome = cache.get(value)
+        if outcome is MISSING:
+            try:
+                validator(value)
+            except (ValueError, AssertionError) as e:
+                cache.put(value, e)
+                raise
+            cache.put(value, None)
+        elif outcome is not None:
+            raise outcome.with_traceback(None)
         return value
+    return cached_validator
+
+
+def sampled_validation(validators: List[Callable], ordering: RuleOrdering, value):
+    """Runs every validator timing it, raising the first failure in the current order."""
+    failure = None
+    for index in ordering.order:
+        start = perf_counter()
+        try:
+            validators[index](value)
+            rejected = False
+        except (ValueError, AssertionError) as e:
+            rejected = True
+            failure = failure or e
+        ordering.record(index, perf_counter() - start, rejections=rejected)
+    if failure is not None:
+        raise failure
+    return value
+
+
+ColumnKernel = Callable[[List[Any]], Iterable[int]]
+
+
+def with_column_kernel(validator: Callable, kernel: ColumnKernel) -> Callable:
+    """
+    Attaches a kernel to a validator, it receives a list of non-null values and
+    returns the positions of the ones failing the validator.
+    """
+    validator.column_kernel = kernel
     return validator
 
+
+def get_violation(validator: Callable, value) -> Optional[RuleViolation]:
+    try:
+        validator(value)
+    except RuleViolation as e:
+        return e
+    except (ValueError, AssertionError) as e:  # The errors pydantic handles as validation errors
+        return RuleViolation("value_error", str(e))
+    return None
+
+
+def column_violations(validator: Callable, column: List[Any]) -> Dict[int, RuleViolation]:
+    """Runs a validator over a column, using its kernel when it has one."""
+    kernel = getattr(validator, "column_kernel", None)
+    positions = kernel(column) if kernel is not None else range(len(column))
+    violations = {}
+    for position in positions:
+        if (violation := get_violation(validator, column[position])) is not None:
+            violations[position] = violation
+    return violations
+
+
 @register_field
 class BaseField(ABC):
     name: str
     description: str
     is_optional: bool
     validators = None
+    cache: Optional[ValidationCache] = None
+    ordering: Optional[RuleOrdering] = None
+    detailed: bool = False
+    regex_timeout: Optional[float] = None
     field_type = None
     type_name = FieldTypes.BASE
 
@@ -34,12 +145,17 @@ class BaseField(ABC):
         self.description = description
         self.is_optional = True
         self.validators = None
+        self._column_adapter = None
+        self.cache = None
+        self.ordering = None
+        self.detailed = False
+        self.regex_timeout = None
 
     @register_rule("Is not null")
     def validator_not_null(self):
         def validator(value):
             if value is None:
-                raise ValueError("Value cannot be null.")
+                raise RuleViolation("not_null", "Value cannot be null.")
             return value
 
         self.is_optional = False
@@ -51,6 +167,19 @@ class BaseField(ABC):
         for validator in self.validators:
             validator(value)
 
+    def enable_cache(self, maxsize: int = DEFAULT_CACHE_SIZE, **kwargs):
+        """Memoizes the outcome of the validators per value, worth it on low-cardinality fields."""
+        self.cache = ValidationCache(maxsize, **kwargs)
+
+    def enable_adaptive_order(self, **kwargs):
+        """
+        Reorders the validators online so the ones rejecting the most values for
+        their cost run first. Only the failure reported first may change.
+        """
+        if self.validators is None:
+            raise NotInitialisedError()
+        self.ordering = RuleOrdering(len(self.validators), **kwargs)
+
     def get_annotation(self):
         if self.validators is None:
             raise NotInitialisedError()
@@ -58,8 +187,90 @@ class BaseField(ABC):
         return Annotated[
             field_type,
             Field(description=self.description),
-            AfterValidator(aggregated_validator(self.validators, self.is_optional))
+            AfterValidator(aggregated_validator(
+                self.validators, self.is_optional, self.cache, self.ordering, self.detailed
+            ))
+        ]
+
+    def get_column_adapter(self) -> TypeAdapter:
+        """Adapter checking and coercing the type of a whole column at once."""
+        if self.validators is None:
+            raise NotInitialisedError()
+        if self._column_adapter is None:
+            field_type = Optional[self.field_type] if self.is_optional else self.field_type
+            self._column_adapter = TypeAdapter(List[field_type])
+        return self._column_adapter
+
+    def coerce_column(self, values: Sequence) -> Tuple[List[Any], Dict[int, RuleViolation]]:
+        adapter = self.get_column_adapter()
+        try:
+            return adapter.validate_python(values), {}
+        except ValidationError as e:
+            row_errors = defaultdict(list)
+            for error in e.errors(include_url=False):
+                row_errors[error['loc'][0]].append(RuleViolation.from_pydantic_error(error))
+            violations = {position: RuleViolations.group(errors) for position, errors in row_errors.items()}
+        # Coercing again only the values that passed the type check
+        coerced = [None] * len(values)
+        positions = [position for position in range(len(values)) if position not in violations]
+        for position, value in zip(positions, adapter.validate_python([values[i] for i in positions])):
+            coerced[position] = value
+        return coerced, violations
+
+    def coerce_value(self, value: Any) -> Any:
+        """The value coerced to the field type, None when it can't be, as `coerce_column` leaves it."""
+        coerced, violations = self.coerce_column([value])
+        return None if violations else coerced[0]
+
+    def validate_column(self, values: Union[Sequence, EncodedColumn]) -> Tuple[List[Any], Dict[int, RuleViolation]]:
+        """
+        Validates a whole column, returning the coerced values and the first
+        violation of each failing row, as the row by row validation would do.
+        Low-cardinality columns are dictionary-encoded so each distinct value
+        is only validated once.
+        """
+        if isinstance(values, EncodedColumn):
+            encoded = values
+        else:  # Given up once there are too many distinct values to pay off
+            encoded = factorize(values, max_uniques=int(len(values) * DICTIONARY_RATIO))
+        with alarm_handler(self.regex_timeout):  # Installed once for the budgets of all the values
+            if encoded is None or encoded.cardinality_ratio > DICTIONARY_RATIO:
+                return self._validate_values(values if encoded is None else list(values))
+            unique_values, unique_violations = self._validate_values(encoded.uniques)
+        return encoded.decode(unique_values), encoded.broadcast(unique_violations)
+
+    def _validate_values(self, values: Sequence) -> Tuple[List[Any], Dict[int, RuleViolation]]:
+        coerced, violations = self.coerce_column(values)
+        positions = [
+            position for position, value in enumerate(coerced)
+            if value is not None and position not in violations
         ]
+        if self.detailed:
+            return coerced, {**violations, **self._detailed_violations(coerced, positions)}
+        order = self.ordering.order if self.ordering is not None else range(len(self.validators))
+        for index in order:
+            if not positions:
+                break
+            validator = self.validators[index]
+            start = perf_counter()
+            failures = column_violations(validator, [coerced[position] for position in positions])
+            if self.ordering is not None:
+                self.ordering.record(index, perf_counter() - start, len(positions), len(failures))
+            if not failures:
+                continue
+            for local_position, violation in failures.items():
+                violations[positions[local_position]] = violation
+            positions = [position for i, position in enumerate(positions) if i not in failures]
+        return coerced, violations
+
+    def _detailed_violations(self, coerced: List[Any], positions: List[int]) -> Dict[int, RuleViolation]:
+        """Runs every validator over the values, grouping all the failures of each row."""
+        column = [coerced[position] for position in positions]
+        row_violations = defaultdict(list)
+        for validator in self.validators:
+            for local_position, violation in column_violations(validator, column).items():
+                row_violations[positions[local_position]].append(violation)
+        return {position: RuleViolations.group(violations) for position, violations in row_violations.items()}
 
     @classmethod
     def get_parents(cls: Type["BaseField"]) -> List[Type["BaseField"]]:
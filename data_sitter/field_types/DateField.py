@@ -0,0 +1,26 @@
+from datetime import date, datetime, timezone
+from typing import Annotated, List
+
+from pydantic import BeforeValidator
+
+from .FieldTypes import FieldTypes
+from .TemporalField import TemporalField, iso_parser
+from ..rules import register_field
+
+
+@register_field
+class DateField(TemporalField):
+    field_type = Annotated[date, BeforeValidator(iso_parser(date.fromisoformat))]
+    type_name = FieldTypes.DATE
+    datetime64_unit = "D"
+
+    @staticmethod
+    def parse_bound(text: str) -> date:
+        return date.fromisoformat(text)
+
+    @staticmethod
+    def now() -> date:
+        return datetime.now(timezone.utc).date()  # Today in UTC, as the datetimes are compared
+
+    def comparable_column(self, values: List[date]) -> List[date]:
+        return values
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Annotated, List
+
+from pydantic import BeforeValidator
+
+from .FieldTypes import FieldTypes
+from .TemporalField import TemporalField, comparable, iso_parser
+from ..rules import register_field
+
+
+@register_field
+class DatetimeField(TemporalField):
+    field_type = Annotated[datetime, BeforeValidator(iso_parser(datetime.fromisoformat))]
+    type_name = FieldTypes.DATETIME
+
+    def comparable_column(self, values: List[datetime]) -> List[datetime]:
+        if all(value.tzinfo is None for value in values):
+            return values
+        return [comparable(value) for value in values]
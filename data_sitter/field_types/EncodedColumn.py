@@ -0,0 +1,65 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+
+DICTIONARY_RATIO = 0.5
+FACTORIZE_CHUNK_SIZE = 4096
+
+
+class EncodedColumn:
+    """
+    A column factorised into its distinct values (`uniques`) and, for every
+    row, the position of its value in them (`codes`).
+    """
+    uniques: List[Any]
+    codes: List[int]
+
+    def __init__(self, uniques: List[Any], codes: List[int]) -> None:
+        self.uniques = uniques
+        self.codes = codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Any:
+        return self.uniques[self.codes[row]]
+
+    def __iter__(self) -> Iterator[Any]:
+        uniques = self.uniques
+        return (uniques[code] for code in self.codes)
+
+    @property
+    def cardinality_ratio(self) -> float:
+        return len(self.uniques) / len(self.codes) if self.codes else 1.0
+
+    def decode(self, unique_values: List[Any]) -> List[Any]:
+        """Broadcasts a value per unique back to every row."""
+        return [unique_values[code] for code in self.codes]
+
+    def broadcast(self, unique_results: Dict[int, Any]) -> Dict[int, Any]:
+        """Broadcasts sparse results per unique, keyed by their position, back to the rows."""
+        if not unique_results:
+            return {}
+        return {row: unique_results[code] for row, code in enumerate(self.codes) if code in unique_results}
+
+
+def factorize(values: Sequence, max_uniques: Optional[int] = None) -> Optional[EncodedColumn]:
+    """
+    Dictionary-encodes a column, returns None when its values are not hashable
+    or have more than `max_uniques` distinct values. The count is checked
+    every chunk of rows, so high-cardinality columns are not encoded in full.
+    """
+    index = {}
+    setdefault = index.setdefault
+    codes = []
+    try:
+        for start in range(0, len(values), FACTORIZE_CHUNK_SIZE):
+            # Keyed by type too: 1, 1.0 and True are equal but may not validate the same
+            codes.extend([
+                setdefault((value.__class__, value), len(index))
+                for value in values[start:start + FACTORIZE_CHUNK_SIZE]
+            ])
+            if max_uniques is not None and len(index) > max_uniques:
+                return None
+    except TypeError:
+        return None
+    return EncodedColumn([value for _, value in index], codes)
@@ -7,3 +7,10 @@ class FieldTypes(StrEnum):
     FLOAT = "Float"
     STRING = "String"
     NUMERIC = "Numeric"
+    LIST = "List"
+    LIST_INT = "List[Integer]"
+    LIST_FLOAT = "List[Float]"
+    LIST_STRING = "List[String]"
+    TEMPORAL = "Temporal"
+    DATE = "Date"
+    DATETIME = "Datetime"
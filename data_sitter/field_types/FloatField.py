@@ -1,7 +1,10 @@
+from typing import List
+
+from .BaseField import with_column_kernel
 from .FieldTypes import FieldTypes
 from .NumericField import NumericField
-from ..rules import register_field, register_rule
-from decimal import Decimal
+from .decimal_places import exceeding_positions, has_decimal_places
+from ..rules import RuleViolation, register_field, register_rule
 
 
 @register_field
@@ -13,14 +16,13 @@ class FloatField(NumericField):
     @register_rule("Has at most {decimal_places:Integer} decimal places")
     def validate_max_decimal_places(self, decimal_places: int):
         def validator(value):
-            decimal_str = str(Decimal(str(value)).normalize())
-            # If no decimal point or only zeros after decimal, it has 0 decimal places
-            if '.' not in decimal_str:
-                decimal_places_count = 0
-            else:
-                decimal_places_count = len(decimal_str.split('.')[1])
-
-            if decimal_places_count > decimal_places:
-                raise ValueError(f"Value must have at most {decimal_places} decimal places.")
+            if not has_decimal_places(value, decimal_places):
+                raise RuleViolation(
+                    "max_decimal_places", "Value must have at most {decimal_places} decimal places.",
+                    decimal_places=decimal_places
+                )
             return value
-        return validator
+
+        def kernel(values: List[float]):
+            return exceeding_positions(values, decimal_places)
+        return with_column_kernel(validator, kernel)
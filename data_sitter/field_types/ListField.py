@@ -0,0 +1,119 @@
+from inspect import signature
+from typing import Callable, List, Optional, Type
+
+from .BaseField import BaseField, column_violations
+from .FieldTypes import FieldTypes
+from .FloatField import FloatField
+from .IntegerField import IntegerField
+from .StringField import StringField
+from ..rules import Rule, RuleRegistry, RuleViolation, register_rule, register_field
+
+
+@register_field
+class ListField(BaseField):
+    """
+    A list of values. The length rules apply to the list, the subclasses made
+    by `list_field` also take the rules of their element field, checked on
+    every element at once with the column kernels of the rules.
+    """
+    field_type = list
+    type_name = FieldTypes.LIST
+    element_class: Optional[Type[BaseField]] = None
+    element: Optional[BaseField]
+
+    def __init__(self, name: str, description: str = None) -> None:
+        super().__init__(name, description)
+        self.element = self.element_class(name) if self.element_class is not None else None
+
+    @property
+    def regex_timeout(self) -> Optional[float]:
+        """The regex rules are the element's, so is their time budget."""
+        return self.element.regex_timeout if self.element is not None else None
+
+    @regex_timeout.setter
+    def regex_timeout(self, regex_timeout: Optional[float]):
+        if getattr(self, "element", None) is not None:  # Not set yet while initialising
+            self.element.regex_timeout = regex_timeout
+
+    def each(self, element_validator: Callable) -> Callable:
+        """Validator of a list checking every element with the validator of an element."""
+        def validator(values: list):
+            if failures := column_violations(element_validator, values):
+                index = min(failures)
+                violation = failures[index]
+                raise RuleViolation(
+                    violation.rule_id, "Item {index}: " + violation.template, index=index, **violation.params
+                )
+            return values
+        return validator
+
+    @register_rule("Is not empty")
+    def validate_not_empty(self):
+        def validator(values: list):
+            if not values:
+                raise RuleViolation("not_empty", "List cannot be empty.")
+            return values
+        return validator
+
+    @register_rule("Has length between {min_val:Integer} and {max_val:Integer}")
+    def validate_length_between(self, min_val: int, max_val: int):
+        def validator(values: list):
+            if not (min_val < len(values) < max_val):
+                raise RuleViolation(
+                    "length_between", "Length must be between {min_val} and {max_val} items.",
+                    min_val=min_val, max_val=max_val
+                )
+            return values
+        return validator
+
+    @register_rule("Has maximum length {max_len:Integer}")
+    def validate_max_length(self, max_len: int):
+        def validator(values: list):
+            if len(values) > max_len:
+                raise RuleViolation("max_length", "Length must not exceed {max_len} items.", max_len=max_len)
+            return values
+        return validator
+
+    @register_rule("Has minimum length {min_len:Integer}")
+    def validate_min_length(self, min_len: int):
+        def validator(values: list):
+            if len(values) < min_len:
+                raise RuleViolation("min_length", "Length must be at least {min_len} items.", min_len=min_len)
+            return values
+        return validator
+
+
+def element_rule(rule: Rule) -> Callable:
+    """A rule setter applying a rule of the element field to every element of the list."""
+    def rule_setter(self: ListField, **params):
+        return self.each(rule.rule_setter(self=self.element, **params))
+
+    setter_signature = signature(rule.rule_setter)
+    rule_setter.__signature__ = setter_signature.replace(parameters=[
+        param for name, param in setter_signature.parameters.items() if name not in rule.fixed_params
+    ])
+    return register_rule(rule.field_rule)(rule_setter)
+
+
+def list_field(element_class: Type[BaseField], type_name: FieldTypes) -> Type[ListField]:
+    """
+    Registers the list field of an element field. The rules of the element
+    field not defined by the lists are applied to every element.
+    """
+    list_rules = {rule.field_rule for rule in RuleRegistry.get_rules_for(ListField)}
+    namespace = {
+        "__doc__": f"A list of {element_class.type_name.value} values.",
+        "__module__": __name__,
+        "field_type": List[element_class.field_type],
+        "type_name": type_name,
+        "element_class": element_class,
+    }
+    for index, rule in enumerate(RuleRegistry.get_rules_for(element_class)):
+        if rule.field_rule not in list_rules:
+            namespace[f"validate_each_{index}"] = element_rule(rule)
+    return register_field(type(f"List{element_class.__name__}", (ListField,), namespace))
+
+
+ListIntegerField = list_field(IntegerField, FieldTypes.LIST_INT)
+ListFloatField = list_field(FloatField, FieldTypes.LIST_FLOAT)
+ListStringField = list_field(StringField, FieldTypes.LIST_STRING)
@@ -1,8 +1,8 @@
-from typing import Union
+from typing import List, Union
 
-from .BaseField import BaseField
+from .BaseField import BaseField, with_column_kernel
 from .FieldTypes import FieldTypes
-from ..rules import register_rule, register_field
+from ..rules import RuleViolation, register_rule, register_field
 
 Numeric = Union[int, float]
 
@@ -16,57 +16,78 @@ class NumericField(BaseField):
     def validate_non_zero(self):
         def validator(value: Numeric):
             if value == 0:
-                raise ValueError("Value cannot be zero.")
+                raise RuleViolation("not_zero", "Value cannot be zero.")
             return value
-        return validator
+
+        def kernel(values: List[Numeric]):
+            return [i for i, value in enumerate(values) if value == 0]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is positive")
     def validate_positive(self):
         def validator(value: Numeric):
             if value <= 0:
-                raise ValueError("Value must be positive.")
+                raise RuleViolation("positive", "Value must be positive.")
             return value
-        return validator
+
+        def kernel(values: List[Numeric]):
+            return [i for i, value in enumerate(values) if value <= 0]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is negative")
     def validate_negative(self):
         def validator(value: Numeric):
             if value >= 0:
-                raise ValueError("Value must be less than zero.")
+                raise RuleViolation("negative", "Value must be less than zero.")
             return value
-        return validator
+
+        def kernel(values: List[Numeric]):
+            return [i for i, value in enumerate(values) if value >= 0]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is at least {min_val:Number}")
     def validate_min(self, min_val: Numeric):
         def validator(value: Numeric):
             if value < min_val:
-                raise ValueError(f"Value must be at least {min_val}.")
+                raise RuleViolation("at_least", "Value must be at least {min_val}.", min_val=min_val)
             return value
-        return validator
+
+        def kernel(values: List[Numeric]):
+            return [i for i, value in enumerate(values) if value < min_val]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is at most {max_val:Number}")
     def validate_max(self, max_val: Numeric):
         def validator(value: Numeric):
             if value > max_val:
-                raise ValueError(f"Value must not exceed {max_val}.")
+                raise RuleViolation("at_most", "Value must not exceed {max_val}.", max_val=max_val)
             return value
-        return validator
+
+        def kernel(values: List[Numeric]):
+            return [i for i, value in enumerate(values) if value > max_val]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is greater than {threshold:Number}")
     def validate_greater_than(self, threshold: Numeric):
         def validator(value: Numeric):
             if value <= threshold:
-                raise ValueError(f"Value must be greater than {threshold}.")
+                raise RuleViolation("greater_than", "Value must be greater than {threshold}.", threshold=threshold)
             return value
-        return validator
+
+        def kernel(values: List[Numeric]):
+            return [i for i, value in enumerate(values) if value <= threshold]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is less than {threshold:Number}")
     def validate_less_than(self, threshold: Numeric):
         def validator(value: Numeric):
             if value >= threshold:
-                raise ValueError(f"Value must be less than {threshold}.")
+                raise RuleViolation("less_than", "Value must be less than {threshold}.", threshold=threshold)
             return value
-        return validator
+
+        def kernel(values: List[Numeric]):
+            return [i for i, value in enumerate(values) if value >= threshold]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is between {min_val:Number} and {max_val:Number}", fixed_params={"negative": False})
     @register_rule("Is not between {min_val:Number} and {max_val:Number}", fixed_params={"negative": True})
@@ -74,8 +95,15 @@ class NumericField(BaseField):
         def validator(value: Numeric):
             condition = (min_val < value < max_val)
             if condition and negative:
-                raise ValueError(f"Value must not be between {min_val} and {max_val}.")
+                raise RuleViolation(
+                    "not_between", "Value must not be between {min_val} and {max_val}.", min_val=min_val, max_val=max_val
+                )
             if not condition and not negative:
-                raise ValueError(f"Value must be between {min_val} and {max_val}.")
+                raise RuleViolation(
+                    "between", "Value must be between {min_val} and {max_val}.", min_val=min_val, max_val=max_val
+                )
             return value
-        return validator
+
+        def kernel(values: List[Numeric]):
+            return [i for i, value in enumerate(values) if (min_val < value < max_val) == negative]
+        return with_column_kernel(validator, kernel)
@@ -0,0 +1,64 @@
+from math import inf
+from typing import List
+
+
+DEFAULT_SAMPLE_EVERY = 64
+DEFAULT_REORDER_EVERY = 1024
+
+
+class RuleOrdering:
+    """
+    Online statistics of the cost and the rejection rate of the rules of a
+    field. The rules are independent checks of the same value, so the order
+    stopping at the first failure soonest on average runs first the rules with
+    the lowest cost per rejection. It's recomputed every `reorder_every`
+    recorded checks.
+    """
+    order: List[int]
+    checks: List[int]
+    rejections: List[int]
+    costs: List[float]
+    sample_every: int
+    reorder_every: int
+
+    def __init__(
+        self,
+        size: int,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+        reorder_every: int = DEFAULT_REORDER_EVERY,
+    ) -> None:
+        self.order = list(range(size))
+        self.checks = [0] * size
+        self.rejections = [0] * size
+        self.costs = [0.0] * size
+        self.sample_every = sample_every
+        self.reorder_every = reorder_every
+        self._values = 0
+        self._pending = 0
+
+    def should_sample(self) -> bool:
+        """
+        Whether to time every rule on the next value. Sampled values run all
+        the rules, so the rejection rates are not biased by the current order.
+        """
+        sampled = self._values % self.sample_every == 0
+        self._values += 1
+        return sampled
+
+    def record(self, index: int, cost: float, checks: int = 1, rejections: int = 0):
+        self.checks[index] += checks
+        self.rejections[index] += rejections
+        self.costs[index] += cost
+        self._pending += checks
+        if self._pending >= self.reorder_every:
+            self.reorder()
+
+    def rank(self, index: int) -> float:
+        """Expected cost paid per value rejected by the rule, the lower the sooner it should run."""
+        if not self.rejections[index]:
+            return inf
+        return self.costs[index] / self.rejections[index]
+
+    def reorder(self):
+        self._pending = 0
+        self.order = sorted(self.order, key=lambda index: (self.rank(index), index))  # Swapped at once
@@ -1,9 +1,27 @@
 import re
 from typing import List
 
-from .BaseField import BaseField
+from .BaseField import BaseField, with_column_kernel
 from .FieldTypes import FieldTypes
-from ..rules import register_rule, register_field
+from .safe_regex import RegexTimeout, compile_pattern, time_budget
+from ..rules import RuleViolation, register_rule, register_field
+
+
+EMAIL_PATTERN = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+URL_PATTERN = re.compile(r"^(https?|ftp):\/\/[^\s/$.?#].[^\s]*$")
+ASCII_DIGIT_PATTERN = re.compile(r"[0-9]")
+
+
+def has_digits(value: str) -> bool:
+    return any(map(str.isdigit, value))
+
+
+def digits_kernel(values: List[str]) -> List[int]:
+    """Positions of the values with digits, searched with a regex when the column is ASCII."""
+    if "".join(values).isascii():  # Outside ASCII, str.isdigit has more digits than the regex
+        search = ASCII_DIGIT_PATTERN.search
+        return [i for i, value in enumerate(values) if search(value)]
+    return [i for i, value in enumerate(values) if has_digits(value)]
 
 
 @register_field
@@ -15,110 +33,167 @@ class StringField(BaseField):
     def validate_not_empty(self):
         def validator(value: str):
             if value == "":
-                raise ValueError("String cannot be empty.")
+                raise RuleViolation("not_empty", "String cannot be empty.")
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, value in enumerate(values) if value == ""]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Starts with {prefix:String}")
     def validate_starts_with(self, prefix: List[str]):
         def validator(value: str):
             if not value.startswith(prefix):
-                raise ValueError(f"Value must start with '{prefix}'.")
+                raise RuleViolation("starts_with", "Value must start with '{prefix}'.", prefix=prefix)
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, value in enumerate(values) if not value.startswith(prefix)]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Ends with {suffix:String}")
     def validate_ends_with(self, suffix: List[str]):
         def validator(value: str):
             if not value.endswith(suffix):
-                raise ValueError(f"Value must end with '{suffix}'.")
+                raise RuleViolation("ends_with", "Value must end with '{suffix}'.", suffix=suffix)
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, value in enumerate(values) if not value.endswith(suffix)]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is one of {possible_values:Strings}", fixed_params={"negative": False})
     @register_rule("Is not one of {possible_values:Strings}", fixed_params={"negative": True})
     def validate_in(self, possible_values: List[str], negative: bool):
+        if isinstance(possible_values, list):
+            possible_values = frozenset(possible_values)
+
         def validator(value: str):
             condition = value in possible_values
             if condition and negative:
-                raise ValueError(f"Value '{value}' is not allowed.")
+                raise RuleViolation("not_one_of", "Value '{value}' is not allowed.", value=value)
             if not condition and not negative:
-                raise ValueError(f"Value '{value}' must be one of the possible values.")
+                raise RuleViolation("one_of", "Value '{value}' must be one of the possible values.", value=value)
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, value in enumerate(values) if (value in possible_values) == negative]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Has length between {min_val:Integer} and {max_val:Integer}")
     def validate_length_between(self, min_val: int, max_val: int):
         def validator(value: str):
             if not (min_val < len(value) < max_val):
-                raise ValueError(f"Length must be between {min_val} and {max_val} characters.")
+                raise RuleViolation(
+                    "length_between", "Length must be between {min_val} and {max_val} characters.",
+                    min_val=min_val, max_val=max_val
+                )
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, length in enumerate(map(len, values)) if not (min_val < length < max_val)]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Has maximum length {max_len:Integer}")
     def validate_max_length(self, max_len: int):
         def validator(value: str):
             if len(value) > max_len:
-                raise ValueError(f"Length must not exceed {max_len} characters.")
+                raise RuleViolation("max_length", "Length must not exceed {max_len} characters.", max_len=max_len)
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, length in enumerate(map(len, values)) if length > max_len]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Has minimum length {min_len:Integer}")
     def validate_min_length(self, min_len: int):
         def validator(value: str):
             if len(value) < min_len:
-                raise ValueError(f"Length must be at least {min_len} characters.")
+                raise RuleViolation("min_length", "Length must be at least {min_len} characters.", min_len=min_len)
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, length in enumerate(map(len, values)) if length < min_len]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is uppercase")
     def validate_uppercase(self):
         def validator(value: str):
             if not value.isupper():
-                raise ValueError("Value must be in uppercase.")
+                raise RuleViolation("uppercase", "Value must be in uppercase.")
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, value in enumerate(values) if not value.isupper()]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is lowercase")
     def validate_lowercase(self):
         def validator(value: str):
             if not value.islower():
-                raise ValueError("Value must be in lowercase.")
+                raise RuleViolation("lowercase", "Value must be in lowercase.")
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, value in enumerate(values) if not value.islower()]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Matches regex {pattern:String}")
     def validate_matches_regex(self, pattern: str):
+        match = compile_pattern(pattern, allow_unsafe=self.regex_timeout is not None).match
+
         def validator(value: str):
-            if not re.match(pattern, value):
-                raise ValueError(f"Value does not match the required pattern {pattern}.")
+            try:
+                with time_budget(self.regex_timeout):
+                    matched = match(value)
+            except RegexTimeout:
+                matched = None
+            if not matched:
+                raise RuleViolation(
+                    "matches_regex", "Value does not match the required pattern {pattern}.", pattern=pattern
+                )
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            if not self.regex_timeout:
+                return [i for i, value in enumerate(values) if not match(value)]
+            try:
+                with time_budget(self.regex_timeout * len(values)):
+                    return [i for i, value in enumerate(values) if not match(value)]
+            except RegexTimeout:  # Matched again one by one to find the values running out of time
+                return list(range(len(values)))
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is valid email")
     def validate_email(self):
-        EMAIL_REGEX = r"^[\w\.-]+@[\w\.-]+\.\w+$"
+        match = EMAIL_PATTERN.match
 
         def validator(value: str):
-            if not re.match(EMAIL_REGEX, value):
-                raise ValueError("Invalid email format.")
+            if not match(value):
+                raise RuleViolation("email", "Invalid email format.")
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, value in enumerate(values) if not match(value)]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Is valid URL")
     def validate_url(self):
-        URL_REGEX = r"^(https?|ftp):\/\/[^\s/$.?#].[^\s]*$"
+        match = URL_PATTERN.match
 
         def validator(value: str):
-            if not re.match(URL_REGEX, value):
-                raise ValueError("Invalid URL format.")
+            if not match(value):
+                raise RuleViolation("url", "Invalid URL format.")
             return value
-        return validator
+
+        def kernel(values: List[str]):
+            return [i for i, value in enumerate(values) if not match(value)]
+        return with_column_kernel(validator, kernel)
 
     @register_rule("Has no digits")
     def validate_no_digits(self):
         def validator(value: str):
-            if any(char.isdigit() for char in value):
-                raise ValueError("Value must not contain any digits.")
+            if has_digits(value):
+                raise RuleViolation("no_digits", "Value must not contain any digits.")
             return value
-        return validator
+        return with_column_kernel(validator, digits_kernel)
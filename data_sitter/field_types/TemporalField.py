@@ -0,0 +1,129 @@
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Union
+
+from .BaseField import BaseField, with_column_kernel
+from .FieldTypes import FieldTypes
+from ..rules import RuleViolation, register_rule, register_field
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+Temporal = Union[datetime, date]
+
+PARSE_CACHE_SIZE = 4096
+NUMPY_MIN_SIZE = 64  # Below it, building the array costs more than the comparisons it saves
+
+
+def iso_parser(parse: Callable[[str], Temporal]) -> Callable[[Any], Any]:
+    """
+    Before validator parsing ISO strings with `parse`, memoized as the same
+    timestamps tend to repeat. Values that can't be parsed are left for
+    pydantic to coerce or report.
+    """
+    @lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def parse_text(text: str):
+        try:
+            return parse(text.strip())
+        except ValueError:
+            return text
+
+    def parser(value):
+        return parse_text(value) if isinstance(value, str) else value
+    return parser
+
+
+def comparable(value: Temporal) -> Temporal:
+    """Aware datetimes are compared as naive UTC ones, naive datetimes are taken as UTC."""
+    if getattr(value, "tzinfo", None) is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@register_field
+class TemporalField(BaseField):
+    field_type = Temporal
+    type_name = FieldTypes.TEMPORAL
+    datetime64_unit = "us"
+
+    @staticmethod
+    def parse_bound(text: str) -> Temporal:
+        return comparable(datetime.fromisoformat(text))
+
+    @staticmethod
+    def now() -> Temporal:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def comparable_column(self, values: List[Temporal]) -> List[Temporal]:
+        return [comparable(value) for value in values]
+
+    def range_kernel(self, lower: Optional[Temporal], upper: Optional[Temporal], include_upper: bool = False):
+        """
+        Kernel returning the positions of the values not after `lower` or not
+        before `upper`, compared as datetime64 arrays when NumPy is installed.
+        """
+        def fails(value: Temporal) -> bool:
+            value = comparable(value)
+            if lower is not None and not value > lower:
+                return True
+            if upper is not None:
+                return value > upper if include_upper else not value < upper
+            return False
+
+        def kernel(values: List[Temporal]):
+            if np is None or len(values) < NUMPY_MIN_SIZE:
+                return [i for i, value in enumerate(values) if fails(value)]
+            array = np.array(self.comparable_column(values), dtype=f"datetime64[{self.datetime64_unit}]")
+            failing = np.zeros(len(array), dtype=bool)
+            if lower is not None:
+                failing |= array <= np.datetime64(lower, self.datetime64_unit)
+            if upper is not None:
+                upper64 = np.datetime64(upper, self.datetime64_unit)
+                failing |= array > upper64 if include_upper else array >= upper64
+            return np.flatnonzero(failing).tolist()
+        return kernel, fails
+
+    @register_rule("Is after {start:String}")
+    def validate_after(self, start: str):
+        kernel, fails = self.range_kernel(self.parse_bound(start), None)
+
+        def validator(value: Temporal):
+            if fails(value):
+                raise RuleViolation("after", "Value must be after {start}.", start=start)
+            return value
+        return with_column_kernel(validator, kernel)
+
+    @register_rule("Is before {end:String}")
+    def validate_before(self, end: str):
+        kernel, fails = self.range_kernel(None, self.parse_bound(end))
+
+        def validator(value: Temporal):
+            if fails(value):
+                raise RuleViolation("before", "Value must be before {end}.", end=end)
+            return value
+        return with_column_kernel(validator, kernel)
+
+    @register_rule("Is between {start:String} and {end:String}")
+    def validate_between(self, start: str, end: str):
+        kernel, fails = self.range_kernel(self.parse_bound(start), self.parse_bound(end))
+
+        def validator(value: Temporal):
+            if fails(value):
+                raise RuleViolation("between", "Value must be between {start} and {end}.", start=start, end=end)
+            return value
+        return with_column_kernel(validator, kernel)
+
+    @register_rule("Is not in the future")
+    def validate_not_in_future(self):
+        def validator(value: Temporal):
+            if comparable(value) > self.now():
+                raise RuleViolation("not_in_future", "Value cannot be in the future.")
+            return value
+
+        def kernel(values: List[Temporal]):
+            column_kernel, _ = self.range_kernel(None, self.now(), include_upper=True)
+            return column_kernel(values)
+        return with_column_kernel(validator, kernel)
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_MIN_HIT_RATE = 0.5
+DEFAULT_WARMUP = 10_000
+
+MISSING = object()
+
+
+class ValidationCache:
+    """
+    Size-bounded LRU cache of the outcome of validating each value: None when it
+    passed, or the exception it raised. Once `warmup` lookups were done, the
+    cache disables itself for good when its hit rate drops below `min_hit_rate`.
+    """
+    maxsize: int
+    min_hit_rate: float
+    warmup: int
+    enabled: bool
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        min_hit_rate: float = DEFAULT_MIN_HIT_RATE,
+        warmup: int = DEFAULT_WARMUP,
+    ) -> None:
+        self.maxsize = maxsize
+        self.min_hit_rate = min_hit_rate
+        self.warmup = warmup
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Optional[Exception]]" = OrderedDict()
+
+    @staticmethod
+    def _key(value: Any) -> Tuple[type, Any]:
+        return value.__class__, value  # 1, 1.0 and True are equal but may not validate the same
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, value: Any):
+        """Returns the cached outcome of the value, or MISSING."""
+        try:
+            key = self._key(value)
+            outcome = self._entries.get(key, MISSING)
+        except TypeError:  # Unhashable values are not cached
+            return MISSING
+        if outcome is MISSING:
+            self.misses += 1
+            if self.misses + self.hits >= self.warmup and self.hit_rate < self.min_hit_rate:
+                self.disable()
+            return MISSING
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return outcome
+
+    def put(self, value: Any, outcome: Optional[Exception]):
+        if not self.enabled:
+            return
+        try:
+            self._entries[self._key(value)] = outcome
+        except TypeError:
+            return
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def disable(self):
+        self.enabled = False
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,6 +3,10 @@ from .StringField import StringField
 from .NumericField import NumericField
 from .IntegerField import IntegerField
 from .FloatField import FloatField
+from .TemporalField import TemporalField
+from .DateField import DateField
+from .DatetimeField import DatetimeField
+from .ListField import ListField, ListIntegerField, ListFloatField, ListStringField, list_field
 
 
 __all__ = [
@@ -11,4 +15,12 @@ __all__ = [
     "NumericField",
     "IntegerField",
     "FloatField",
+    "TemporalField",
+    "DateField",
+    "DatetimeField",
+    "ListField",
+    "ListIntegerField",
+    "ListFloatField",
+    "ListStringField",
+    "list_field",
 ]
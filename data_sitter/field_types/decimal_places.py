@@ -0,0 +1,79 @@
+from decimal import Decimal
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+MIN_MAGNITUDE = 1e-6  # Below it, Decimal renders the value with an exponent
+MAX_SCALED = 2.0 ** 52  # Scaled values beyond it can't be told apart from their neighbours
+MAX_PLACES = 22  # Largest power of ten exactly representable as a float
+NUMPY_MIN_SIZE = 64
+
+
+def decimal_places(value: float) -> int:
+    """Decimal places of the shortest representation of the value, as written by Decimal once normalised."""
+    decimal_str = str(Decimal(str(value)).normalize())
+    # If no decimal point or only zeros after decimal, it has 0 decimal places
+    if '.' not in decimal_str:
+        return 0
+    return len(decimal_str.split('.')[1])
+
+
+def fast_has_decimal_places(value: float, places: int) -> Optional[bool]:
+    """
+    Whether the value has at most `places` decimal places, checking that a
+    scaled integer `c` exists with `c / 10**places == value`. The product is
+    rounded, so `c` may be off by one and its neighbours are checked too.
+    Returns None for the values the arithmetic can't answer like Decimal does:
+    tiny, huge or non finite values and integers ending in zeros.
+    """
+    if isinstance(value, int):  # Float fields get ints too, without `is_integer` before Python 3.12
+        return True
+    if not 0 <= places <= MAX_PLACES:
+        return None
+    scale = 10.0 ** places
+    scaled = value * scale
+    if not (abs(value) >= MIN_MAGNITUDE and abs(scaled) < MAX_SCALED):  # NaN fails both
+        return None
+    if value.is_integer():
+        return True if int(value) % 10 else None
+    candidate = round(scaled)
+    return candidate / scale == value or (candidate - 1) / scale == value or (candidate + 1) / scale == value
+
+
+def has_decimal_places(value: float, places: int) -> bool:
+    """Whether the value has at most `places` decimal places."""
+    fast = fast_has_decimal_places(value, places)
+    return decimal_places(value) <= places if fast is None else fast
+
+
+def exceeding_positions(values: Sequence[float], places: int) -> List[int]:
+    """
+    Positions of the values with more than `places` decimal places, checked
+    as arrays with NumPy when it's installed.
+    """
+    if np is None or len(values) < NUMPY_MIN_SIZE or not 0 <= places <= MAX_PLACES:
+        return [i for i, value in enumerate(values) if not has_decimal_places(value, places)]
+    array = np.asarray(values, dtype=np.float64)
+    scale = 10.0 ** places
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = array * scale
+        magnitude = np.abs(array)
+        integral = np.trunc(array) == array
+        fast = (magnitude >= MIN_MAGNITUDE) & (np.abs(scaled) < MAX_SCALED)
+        candidate = np.rint(np.where(fast, scaled, 0.0))
+        exact = (
+            (candidate / scale == array) | ((candidate - 1) / scale == array) | ((candidate + 1) / scale == array)
+        )
+    exceeding = fast & ~integral & ~exact
+    # Integers ending in zeros and the values out of the fast range are checked one by one
+    slow = ~fast | (integral & (np.fmod(np.where(fast, array, 0.0), 10.0) == 0))
+    positions = set(np.flatnonzero(exceeding).tolist())
+    positions.update(
+        position for position in np.flatnonzero(slow).tolist()
+        if decimal_places(values[position]) > places
+    )
+    return sorted(positions)
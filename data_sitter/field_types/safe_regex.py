@@ -0,0 +1,320 @@
+import re
+import signal
+import threading
+import warnings
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # pragma: no cover
+    import sre_constants
+    import sre_parse
+
+
+PATTERN_CACHE_SIZE = 1024
+
+REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+ATOMIC_GROUP = getattr(sre_constants, "ATOMIC_GROUP", None)  # Python 3.11+
+POSSESSIVE_REPEAT = getattr(sre_constants, "POSSESSIVE_REPEAT", None)
+LOOKAROUNDS = (sre_constants.ASSERT, sre_constants.ASSERT_NOT)
+SINGLE_CHARS = (sre_constants.LITERAL, sre_constants.NOT_LITERAL, sre_constants.ANY, sre_constants.IN)
+
+# Characters the character sets of a pattern are compared on, with the literals and ranges of the pattern
+PROBES = frozenset(map(chr, range(128))) | frozenset("\u00a0\u00c9\u00df\u00e9\u0416\u0436\u0661\u2028\u4e2d")
+CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: r"\d", sre_constants.CATEGORY_NOT_DIGIT: r"\D",
+    sre_constants.CATEGORY_SPACE: r"\s", sre_constants.CATEGORY_NOT_SPACE: r"\S",
+    sre_constants.CATEGORY_WORD: r"\w", sre_constants.CATEGORY_NOT_WORD: r"\W",
+}
+
+
+class UnsafeRegexError(ValueError):
+    """The pattern can backtrack catastrophically."""
+
+
+class UnsafeRegexWarning(UserWarning):
+    """The pattern can backtrack catastrophically, only its time budget bounds it."""
+
+
+class RegexTimeout(Exception):
+    """The match took longer than its time budget."""
+
+
+class PatternAnalysis:
+    """
+    Finds the repetitions of a parsed pattern that can match the same text in
+    exponentially many ways, which the regex engine tries one by one before
+    failing: a variable repetition inside them not followed, before
+    the next one, by a mandatory part it can't match, like `(a+)+` or
+    `(\\w+\\s?)+`, and alternatives starting alike, like `(a|a)*`. Sets of
+    characters are compared on a sample of them. Possessive quantifiers and
+    atomic groups don't backtrack, so they are not looked into.
+    """
+
+    def __init__(self, parsed) -> None:
+        self.probes = PROBES | frozenset(pattern_chars(parsed))
+
+    def char_set(self, op, av) -> frozenset:
+        if op is sre_constants.LITERAL:
+            return frozenset((chr(av),))
+        if op is sre_constants.NOT_LITERAL:
+            return self.probes - {chr(av)}
+        if op is sre_constants.ANY:
+            return self.probes - {"\n"}
+        chars, negate = set(), False
+        for item_op, item_av in av:
+            if item_op is sre_constants.NEGATE:
+                negate = True
+            elif item_op is sre_constants.LITERAL:
+                chars.add(chr(item_av))
+            elif item_op is sre_constants.RANGE:
+                chars.update(c for c in self.probes if item_av[0] <= ord(c) <= item_av[1])
+            elif item_op is sre_constants.CATEGORY and item_av in CATEGORIES:
+                chars.update(c for c in self.probes if re.match(CATEGORIES[item_av], c))
+            else:
+                return self.probes
+        return self.probes - chars if negate else frozenset(chars)
+
+    def first(self, subpattern) -> Tuple[frozenset, bool]:
+        """The characters a subpattern can start with and whether it can match the empty string."""
+        chars = frozenset()
+        for op, av in subpattern:
+            item_chars, nullable = self.first_item(op, av)
+            chars |= item_chars
+            if not nullable:
+                return chars, False
+        return chars, True
+
+    def first_item(self, op, av) -> Tuple[frozenset, bool]:
+        if op in SINGLE_CHARS:
+            return self.char_set(op, av), False
+        if op in REPEATS or op is POSSESSIVE_REPEAT:
+            chars, nullable = self.first(av[2])
+            return chars, nullable or av[0] == 0
+        if op is sre_constants.SUBPATTERN:
+            return self.first(av[-1])
+        if op is ATOMIC_GROUP:
+            return self.first(av)
+        if op is sre_constants.BRANCH:
+            firsts = [self.first(branch) for branch in av[1]]
+            return frozenset().union(*(chars for chars, _ in firsts)), any(nullable for _, nullable in firsts)
+        if op is sre_constants.AT or op in LOOKAROUNDS:
+            return frozenset(), True
+        return self.probes, True
+
+    def chars(self, op, av) -> frozenset:
+        """All the characters an item can match."""
+        if op in SINGLE_CHARS:
+            return self.char_set(op, av)
+        if op in REPEATS or op is POSSESSIVE_REPEAT:
+            return self.subpattern_chars(av[2])
+        if op is sre_constants.SUBPATTERN:
+            return self.subpattern_chars(av[-1])
+        if op is ATOMIC_GROUP:
+            return self.subpattern_chars(av)
+        if op is sre_constants.BRANCH:
+            return frozenset().union(*map(self.subpattern_chars, av[1]))
+        if op is sre_constants.AT or op in LOOKAROUNDS:
+            return frozenset()
+        return self.probes
+
+    def subpattern_chars(self, subpattern) -> frozenset:
+        return frozenset().union(*(self.chars(op, av) for op, av in subpattern))
+
+    def is_unsafe(self, subpattern) -> bool:
+        for op, av in subpattern:
+            if op in REPEATS:
+                if av[1] > 1 and self.is_ambiguous_loop(av[2]):
+                    return True
+                if self.is_unsafe(av[2]):
+                    return True
+            elif op is sre_constants.SUBPATTERN:
+                if self.is_unsafe(av[-1]):
+                    return True
+            elif op is sre_constants.BRANCH:
+                if any(self.is_unsafe(branch) for branch in av[1]):
+                    return True
+            elif op in LOOKAROUNDS:
+                if self.is_unsafe(av[1]):
+                    return True
+            elif op is sre_constants.GROUPREF_EXISTS:
+                if any(self.is_unsafe(branch) for branch in av[1:] if branch):
+                    return True
+        return False
+
+    def is_ambiguous_loop(self, body) -> bool:
+        """
+        Whether the body of a repetition can split the same text between its
+        iterations in many ways, exponentially in the length of the text when
+        unbounded and in the count of the repetition when counted.
+        """
+        sequence = flatten(body)
+        loop_first, _ = self.first(sequence)
+        for index, (op, av) in enumerate(sequence):
+            if backtracks(op, av) and not self.is_delimited(sequence, index):
+                return True
+        return self.has_overlapping_branch(sequence, loop_first)
+
+    def is_delimited(self, sequence, index: int) -> bool:
+        """
+        Whether the first mandatory item after the one at `index`, going
+        round the body of the loop, can't match any of the item characters.
+        """
+        chars = self.chars(*sequence[index])
+        for offset in range(1, len(sequence)):
+            item_first, nullable = self.first_item(*sequence[(index + offset) % len(sequence)])
+            if not nullable:
+                return not item_first & chars
+        return False
+
+    def has_overlapping_branch(self, sequence, follow: frozenset) -> bool:
+        """
+        Whether an alternation has alternatives starting with the same
+        characters, or with what `follow`s it when they can be empty.
+        """
+        for index, (op, av) in enumerate(sequence):
+            rest_first, rest_nullable = self.first(sequence[index + 1:])
+            after = rest_first | follow if rest_nullable else rest_first
+            if op is sre_constants.BRANCH:
+                firsts = [self.first(branch) for branch in av[1]]
+                if sum(nullable for _, nullable in firsts) > 1:
+                    return True
+                effective = [chars | after if nullable else chars for chars, nullable in firsts]
+                if any(a & b for i, a in enumerate(effective) for b in effective[i + 1:]):
+                    return True
+                if any(self.has_overlapping_branch(branch, after) for branch in av[1]):
+                    return True
+            elif op is sre_constants.SUBPATTERN:
+                if self.has_overlapping_branch(av[-1], after):
+                    return True
+            elif op in REPEATS:
+                if self.has_overlapping_branch(av[2], self.first(av[2])[0] | after):
+                    return True
+        return False
+
+
+def pattern_chars(subpattern) -> Iterator[str]:
+    """The literals and range bounds of a parsed pattern."""
+    for op, av in subpattern:
+        if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL):
+            yield chr(av)
+        elif op is sre_constants.IN:
+            for item_op, item_av in av:
+                if item_op is sre_constants.LITERAL:
+                    yield chr(item_av)
+                elif item_op is sre_constants.RANGE:
+                    yield from map(chr, item_av)
+        elif op in REPEATS or op is POSSESSIVE_REPEAT:
+            yield from pattern_chars(av[2])
+        elif op is sre_constants.SUBPATTERN:
+            yield from pattern_chars(av[-1])
+        elif op is ATOMIC_GROUP:
+            yield from pattern_chars(av)
+        elif op in LOOKAROUNDS:
+            yield from pattern_chars(av[1])
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                yield from pattern_chars(branch)
+        elif op is sre_constants.GROUPREF_EXISTS:
+            for branch in av[1:]:
+                if branch:
+                    yield from pattern_chars(branch)
+
+
+def flatten(subpattern) -> list:
+    """The items of a subpattern with its groups expanded, they don't change what matches after what."""
+    items = []
+    for op, av in subpattern:
+        if op is sre_constants.SUBPATTERN:
+            items.extend(flatten(av[-1]))
+        else:
+            items.append((op, av))
+    return items
+
+
+def backtracks(op, av) -> bool:
+    """Whether an item has a variable repetition the engine can backtrack into."""
+    if op in REPEATS:
+        return av[0] != av[1] or backtracks_in(av[2])
+    if op is sre_constants.SUBPATTERN:
+        return backtracks_in(av[-1])
+    if op is sre_constants.BRANCH:
+        return any(backtracks_in(branch) for branch in av[1])
+    if op is sre_constants.GROUPREF_EXISTS:
+        return any(backtracks_in(branch) for branch in av[1:] if branch)
+    return False
+
+
+def backtracks_in(subpattern) -> bool:
+    return any(backtracks(op, av) for op, av in subpattern)
+
+
+def has_nested_quantifier(subpattern) -> bool:
+    """Whether a parsed pattern can backtrack catastrophically, see `PatternAnalysis`."""
+    return PatternAnalysis(subpattern).is_unsafe(subpattern)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def analyze_pattern(pattern: str) -> Tuple[re.Pattern, bool]:
+    """The compiled pattern and whether it can backtrack catastrophically."""
+    return re.compile(pattern), has_nested_quantifier(sre_parse.parse(pattern))
+
+
+def compile_pattern(pattern: str, allow_unsafe: bool = False) -> re.Pattern:
+    """
+    Compiles a pattern of a contract once, rejecting the ones with nested
+    quantifiers unless `allow_unsafe`, when they only get a warning, every
+    time they are used.
+    """
+    compiled, unsafe = analyze_pattern(pattern)
+    if unsafe:
+        message = (
+            f"The pattern {pattern!r} has nested quantifiers and can backtrack catastrophically, "
+            "use a possessive quantifier or an atomic group instead"
+        )
+        if not allow_unsafe:
+            raise UnsafeRegexError(f"{message}, or set a regex timeout.")
+        warnings.warn(f"{message}, only the regex timeout bounds it.", UnsafeRegexWarning, stacklevel=2)
+    return compiled
+
+
+def _raise_timeout(signum, frame):
+    raise RegexTimeout()
+
+
+def can_time_out() -> bool:
+    """Budgets are enforced with SIGALRM, which only the main thread of Unix processes can handle."""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def alarm_handler(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Installs the handler of the time budgets for the block, so the budgets of
+    the values of a whole column only set the timer. Nothing is done without
+    budget or when the handler is already installed.
+    """
+    if not seconds or not can_time_out() or signal.getsignal(signal.SIGALRM) is _raise_timeout:
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGALRM, previous)
+
+
+@contextmanager
+def time_budget(seconds: Optional[float]) -> Iterator[None]:
+    """Raises RegexTimeout in the block once `seconds` passed, the regex engine checks for signals while matching."""
+    if not seconds or not can_time_out():
+        yield
+        return
+    with alarm_handler(seconds):
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
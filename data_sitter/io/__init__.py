@@ -0,0 +1,12 @@
+from .readers import open_text, read_records
+from .writers import RecordWriter, CsvRecordWriter, NdjsonRecordWriter, open_writer
+
+
+__all__ = [
+    "open_text",
+    "read_records",
+    "RecordWriter",
+    "CsvRecordWriter",
+    "NdjsonRecordWriter",
+    "open_writer",
+]
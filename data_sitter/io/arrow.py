@@ -0,0 +1,124 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union
+
+from ..Validation import BatchValidation
+from ..field_types.EncodedColumn import DICTIONARY_RATIO, EncodedColumn
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..Contract import Contract
+
+
+DEFAULT_BATCH_SIZE = 64 * 1024
+PARQUET_SUFFIXES = (".parquet", ".pq")
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc", ".arrows")
+PARQUET_MAGIC = b"PAR1"
+ARROW_FILE_MAGIC = b"ARROW1"
+
+
+class ArrowNotInstalled(ImportError):
+    def __init__(self):
+        super().__init__("pyarrow is required to read Parquet/Arrow files: pip install 'data-sitter[arrow]'")
+
+
+def is_columnar_file(file_path: Path) -> bool:
+    return Path(file_path).suffix in PARQUET_SUFFIXES + ARROW_SUFFIXES
+
+
+def _projection(columns: Optional[List[str]], names: List[str]) -> List[str]:
+    return names if columns is None else [name for name in columns if name in names]
+
+
+def _iter_parquet_batches(
+    file_path: Path, columns: Optional[List[str]], batch_size: int
+) -> Iterator["pa.RecordBatch"]:
+    parquet_file = pq.ParquetFile(file_path)
+    projection = _projection(columns, parquet_file.schema_arrow.names)
+    yield from parquet_file.iter_batches(batch_size=batch_size, columns=projection)
+
+
+def _iter_ipc_batches(file_path: Path, columns: Optional[List[str]]) -> Iterator["pa.RecordBatch"]:
+    with pa.memory_map(str(file_path)) as source:
+        if source.read(len(ARROW_FILE_MAGIC)) == ARROW_FILE_MAGIC:
+            source.seek(0)
+            reader = ipc.open_file(source)
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        else:
+            source.seek(0)
+            reader = ipc.open_stream(source)
+            batches = iter(reader)
+        projection = _projection(columns, reader.schema.names)
+        for batch in batches:
+            yield batch.select(projection)
+
+
+def iter_record_batches(
+    file_path: Path, columns: Optional[List[str]], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Streams the record batches of a Parquet or Arrow IPC file, reading only
+    the given columns (all of them when None).
+    """
+    if pa is None:  # pragma: no cover
+        raise ArrowNotInstalled()
+    file_path = Path(file_path)
+    with open(file_path, "rb") as f:
+        is_parquet = f.read(len(PARQUET_MAGIC)) == PARQUET_MAGIC
+    if is_parquet:
+        return _iter_parquet_batches(file_path, columns, batch_size)
+    return _iter_ipc_batches(file_path, columns)
+
+
+def encode_column(column: "pa.Array") -> Union[EncodedColumn, list]:
+    """
+    Converts an arrow column to Python values, keeping dictionary-encoded and
+    low-cardinality columns encoded so only their distinct values are validated.
+    """
+    if not pa.types.is_dictionary(column.type):
+        if pa.types.is_nested(column.type) or len(column) == 0:
+            return column.to_pylist()
+        try:
+            encoded = column.dictionary_encode()
+        except pa.ArrowNotImplementedError:
+            return column.to_pylist()
+        if len(encoded.dictionary) > len(column) * DICTIONARY_RATIO:
+            return column.to_pylist()
+        column = encoded
+    uniques = column.dictionary.to_pylist()
+    indices = column.indices
+    if indices.null_count:
+        indices = indices.fill_null(len(uniques))
+        uniques.append(None)
+    return EncodedColumn(uniques, indices.to_pylist())
+
+
+def record_batch_columns(batch: "pa.RecordBatch") -> Dict[str, Union[EncodedColumn, list]]:
+    return {name: encode_column(column) for name, column in zip(batch.schema.names, batch.columns)}
+
+
+def validate_record_batch(contract: "Contract", batch: "pa.RecordBatch") -> BatchValidation:
+    return contract.validate_batch(record_batch_columns(batch), size=batch.num_rows)
+
+
+def validate_arrow_file(
+    contract: "Contract", file_path: Path, batch_size: Optional[int] = DEFAULT_BATCH_SIZE, skip_rows: int = 0
+) -> Iterator[BatchValidation]:
+    """
+    Validates a Parquet or Arrow IPC file one record batch at a time, reading
+    only the columns of the contract fields. The first `skip_rows` rows are
+    not validated.
+    """
+    columns = [field.name for field in contract.fields]
+    for batch in iter_record_batches(file_path, columns, batch_size):
+        if skip_rows >= batch.num_rows:
+            skip_rows -= batch.num_rows
+            continue
+        if skip_rows:
+            batch, skip_rows = batch.slice(skip_rows), 0
+        yield validate_record_batch(contract, batch)
@@ -0,0 +1,98 @@
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+from ..ValidationReport import ValidationReport
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..Contract import Contract
+
+
+DEFAULT_CHECKPOINT_EVERY = 100_000
+FINGERPRINT_HEAD_SIZE = 1024 * 1024
+
+
+class CheckpointMismatch(Exception):
+    """The checkpoint was saved for a different contract or file."""
+
+
+def file_fingerprint(file_path: Path) -> dict:
+    """Identifies a file by its size, modification time and a hash of its first bytes."""
+    stat = Path(file_path).stat()
+    with open(file_path, "rb") as f:
+        head_hash = hashlib.sha256(f.read(FINGERPRINT_HEAD_SIZE)).hexdigest()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "head_sha256": head_hash}
+
+
+class Checkpoint:
+    """
+    Progress of a file validation: the number of rows already validated, the
+    partial report and the byte positions reached in the output files.
+    """
+    path: Path
+    contract_hash: str
+    file_fingerprint: dict
+    rows: int
+    report: ValidationReport
+    outputs: Dict[str, int]
+
+    def __init__(
+        self,
+        path: Path,
+        contract_hash: str,
+        file_fingerprint: dict,
+        report: Optional[ValidationReport] = None,
+        outputs: Optional[Dict[str, int]] = None,
+    ):
+        self.path = Path(path)
+        self.contract_hash = contract_hash
+        self.file_fingerprint = file_fingerprint
+        self.report = report or ValidationReport()
+        self.outputs = outputs or {}
+
+    @property
+    def rows(self) -> int:
+        return self.report.rows
+
+    @classmethod
+    def open(cls, path: Path, contract: "Contract", file_path: Path) -> "Checkpoint":
+        """
+        Loads the checkpoint to resume from, or starts a new one if there is none.
+        Raises CheckpointMismatch if it was saved for another contract or file.
+        """
+        path = Path(path)
+        fingerprint = file_fingerprint(file_path)
+        if not path.exists():
+            return cls(path, contract.fingerprint, fingerprint)
+        saved = json.loads(path.read_text())
+        if saved["contract_hash"] != contract.fingerprint:
+            raise CheckpointMismatch(f"The checkpoint {path} was saved for another contract.")
+        if saved["file_fingerprint"] != fingerprint:
+            raise CheckpointMismatch(f"The checkpoint {path} was saved for another version of {file_path}.")
+        return cls(
+            path,
+            saved["contract_hash"],
+            saved["file_fingerprint"],
+            ValidationReport.from_dict(saved["report"]),
+            saved["outputs"],
+        )
+
+    def save(self, outputs: Optional[Dict[str, int]] = None):
+        """Atomically replaces the checkpoint file with the current progress."""
+        if outputs is not None:
+            self.outputs = outputs
+        data = {
+            "contract_hash": self.contract_hash,
+            "file_fingerprint": self.file_fingerprint,
+            "rows": self.rows,
+            "report": self.report.to_dict(),
+            "outputs": self.outputs,
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,103 @@
+import io
+import bz2
+import csv
+import gzip
+import json
+import lzma
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterator, Optional
+
+
+DEFAULT_ENCODING = "utf8"
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+NDJSON_SUFFIXES = (".jsonl", ".ndjson")
+
+Decompressor = Callable[[Path], IO[bytes]]
+
+COMPRESSION_SUFFIXES: Dict[str, str] = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+COMPRESSION_MAGIC: Dict[bytes, str] = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+}
+# Opened by path, so closing the decompressed stream closes the file too
+DECOMPRESSORS: Dict[str, Decompressor] = {
+    "gzip": lambda file_path: gzip.open(file_path, "rb"),
+    "bz2": lambda file_path: bz2.open(file_path, "rb"),
+    "xz": lambda file_path: lzma.open(file_path, "rb"),
+}
+
+
+def detect_compression(file_path: Path) -> Optional[str]:
+    """Detects the compression of a file from its magic bytes."""
+    with open(file_path, "rb") as f:
+        header = f.read(max(len(magic) for magic in COMPRESSION_MAGIC))
+    for magic, compression in COMPRESSION_MAGIC.items():
+        if header.startswith(magic):
+            return compression
+    return None
+
+
+def get_data_suffix(file_path: Path) -> str:
+    """The suffix of the data format, ignoring a trailing compression suffix (`data.csv.gz` -> `.csv`)."""
+    file_path = Path(file_path)
+    if file_path.suffix in COMPRESSION_SUFFIXES:
+        return Path(file_path.stem).suffix
+    return file_path.suffix
+
+
+def open_text(file_path: Path, encoding: str = DEFAULT_ENCODING, buffer_size: int = DEFAULT_BUFFER_SIZE) -> IO[str]:
+    """
+    Opens a file for streaming text reads, transparently decompressing gzip,
+    bz2 and xz files through the stdlib decompressors.
+    """
+    compression = detect_compression(file_path)
+    if compression is None:
+        return open(file_path, encoding=encoding, newline="", buffering=buffer_size)
+    decompressed = io.BufferedReader(DECOMPRESSORS[compression](file_path), buffer_size=buffer_size)
+    return io.TextIOWrapper(decompressed, encoding=encoding, newline="")
+
+
+def read_csv_records(
+    file_path: Path, encoding: str = DEFAULT_ENCODING, buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator[dict]:
+    with open_text(file_path, encoding, buffer_size) as f:
+        reader = csv.DictReader(f)
+        reader.fieldnames = [name.strip() for name in reader.fieldnames]
+        for row in reader:
+            yield {k: v.strip() for k, v in row.items()}
+
+
+def read_json_records(
+    file_path: Path, encoding: str = DEFAULT_ENCODING, buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator[dict]:
+    with open_text(file_path, encoding, buffer_size) as f:
+        file_data = json.load(f)
+    if isinstance(file_data, dict):
+        yield file_data
+    else:
+        yield from file_data
+
+
+def read_ndjson_records(
+    file_path: Path, encoding: str = DEFAULT_ENCODING, buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator[dict]:
+    with open_text(file_path, encoding, buffer_size) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_records(
+    file_path: Path, encoding: str = DEFAULT_ENCODING, buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator[dict]:
+    """Streams the records of a CSV, JSON or NDJSON file, optionally gzip/bz2/xz compressed."""
+    file_path = Path(file_path)
+    suffix = get_data_suffix(file_path)
+    if suffix == '.csv':
+        return read_csv_records(file_path, encoding, buffer_size)
+    if suffix == '.json':
+        return read_json_records(file_path, encoding, buffer_size)
+    if suffix in NDJSON_SUFFIXES:
+        return read_ndjson_records(file_path, encoding, buffer_size)
+    raise NotImplementedError(f"Type {suffix or file_path.suffix} not implemented.")
@@ -0,0 +1,158 @@
+import csv
+import json
+import random
+from math import ceil
+from pathlib import Path
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+from .readers import (
+    DEFAULT_BUFFER_SIZE, DEFAULT_ENCODING, NDJSON_SUFFIXES, detect_compression, get_data_suffix, read_records
+)
+
+
+PROBE_LINES = 1000
+MAX_DRAWS_FACTOR = 3
+SEEK_BLOCK_SIZE = 4096
+
+
+def reservoir_sample(records: Iterable[dict], size: int, rng: random.Random) -> List[dict]:
+    """Uniform sample of `size` records from a stream of unknown length (Algorithm R)."""
+    sample = list(islice(records, size))
+    for seen, record in enumerate(records, start=size + 1):
+        position = rng.randrange(seen)
+        if position < size:
+            sample[position] = record
+    return sample
+
+
+def bernoulli_sample(records: Iterable[dict], fraction: float, rng: random.Random) -> Iterator[dict]:
+    return (record for record in records if rng.random() < fraction)
+
+
+def is_seekable_file(file_path: Path) -> bool:
+    """Line based formats that are not compressed can be sampled by seeking to random byte offsets."""
+    suffix = get_data_suffix(file_path)
+    return (suffix == ".csv" or suffix in NDJSON_SUFFIXES) and detect_compression(file_path) is None
+
+
+def estimate_line_count(file_path: Path, has_header: bool) -> int:
+    """Estimates the number of data lines from the mean length of the first lines."""
+    size = file_path.stat().st_size
+    with open(file_path, "rb") as f:
+        if has_header:
+            f.readline()
+        start = f.tell()
+        lines = list(islice(f, PROBE_LINES))
+    if len(lines) < PROBE_LINES:
+        return len(lines)
+    mean_length = sum(len(line) for line in lines) / len(lines)
+    return max(len(lines), round((size - start) / mean_length))
+
+
+def probe_lines(file_path: Path, has_header: bool) -> List[bytes]:
+    """The first data lines of a file."""
+    with open(file_path, "rb") as f:
+        if has_header:
+            f.readline()
+        return list(islice(f, PROBE_LINES))
+
+
+def min_line_length(lines: List[bytes]) -> int:
+    return min((len(line) for line in lines if line.strip()), default=1)
+
+
+def has_multiline_fields(lines: List[bytes]) -> bool:
+    """Whether a CSV line opens a quoted field it doesn't close, quotes in fields being doubled."""
+    return any(line.count(b'"') % 2 for line in lines)
+
+
+def find_line_start(f: BinaryIO, offset: int, start: int) -> int:
+    """The offset of the start of the line the byte at `offset` belongs to."""
+    position = offset
+    while position > start:
+        block_start = max(start, position - SEEK_BLOCK_SIZE)
+        f.seek(block_start)
+        newline = f.read(position - block_start).rfind(b"\n")
+        if newline != -1:
+            return block_start + newline + 1
+        position = block_start
+    return start
+
+
+def sample_lines(file_path: Path, size: int, rng: random.Random, has_header: bool, min_length: int = 1):
+    """
+    Reads about `size` distinct lines at random byte offsets, without reading
+    the whole file. An offset falls in a line with a probability proportional
+    to its length, so the line is only kept with a probability of
+    `min_length` over its length, which makes every line as likely to be
+    picked when no line is shorter than `min_length`.
+    Returns the header line and the sampled lines.
+    """
+    file_size = file_path.stat().st_size
+    lines = {}
+    with open(file_path, "rb") as f:
+        header = f.readline() if has_header else b""
+        start = f.tell()
+        if start >= file_size:
+            return header, []
+        picks = 0
+        while picks < size * MAX_DRAWS_FACTOR and len(lines) < size:
+            line_start = find_line_start(f, rng.randrange(start, file_size), start)
+            f.seek(line_start)
+            line = f.readline()
+            if rng.random() * len(line) >= min_length:  # Rejected, not counted as a pick
+                continue
+            picks += 1
+            lines.setdefault(line_start, line)
+    return header, [lines[offset] for offset in sorted(lines)]
+
+
+def sample_records(
+    file_path: Path,
+    size: Optional[int] = None,
+    fraction: Optional[float] = None,
+    encoding: str = DEFAULT_ENCODING,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    seed: Optional[int] = None,
+) -> List[dict]:
+    """
+    Samples `size` records, or a `fraction` of them, from a file. Uncompressed
+    CSV/NDJSON files are sampled by seeking to random byte offsets, other
+    files, and CSV files with quoted fields spanning lines, are streamed
+    through a reservoir (or Bernoulli) sample.
+    """
+    if (size is None) == (fraction is None):
+        raise ValueError("Either the sample size or the sample fraction must be given.")
+    file_path = Path(file_path)
+    rng = random.Random(seed)
+    suffix = get_data_suffix(file_path)
+
+    def stream_sample() -> List[dict]:
+        records = read_records(file_path, encoding, buffer_size)
+        if size is not None:
+            return reservoir_sample(records, size, rng)
+        return list(bernoulli_sample(records, fraction, rng))
+
+    has_header = suffix == ".csv"
+    if not is_seekable_file(file_path):
+        return stream_sample()
+    probe = probe_lines(file_path, has_header)
+    if has_header and has_multiline_fields(probe):  # Offsets can fall inside a quoted field
+        return stream_sample()
+
+    estimated_lines = estimate_line_count(file_path, has_header)
+    if size is None:
+        size = ceil(fraction * estimated_lines)
+    if size >= estimated_lines:  # Sampling wouldn't save reading the file
+        return reservoir_sample(read_records(file_path, encoding, buffer_size), size, rng)
+
+    header, lines = sample_lines(file_path, size, rng, has_header, min_line_length(probe))
+    if has_header and has_multiline_fields(lines):  # Quoted fields spanning lines after the probed ones
+        return stream_sample()
+    texts = [line.decode(encoding) for line in lines if line.strip()]
+    if not has_header:
+        return [json.loads(text) for text in texts]
+    reader = csv.DictReader([header.decode(encoding), *texts])
+    reader.fieldnames = [name.strip() for name in reader.fieldnames]
+    return [{k: v.strip() for k, v in row.items()} for row in reader]
@@ -0,0 +1,144 @@
+import csv
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .readers import DEFAULT_BUFFER_SIZE, DEFAULT_ENCODING, open_text
+from ..Validation import BatchValidation
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..Contract import Contract
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Conversions done in bulk before the validation, other field types are left to pydantic
+CONVERTERS: Dict[Any, Callable[[str], Any]] = {int: int, float: float}
+
+
+def convert_cell(value: str, converter: Callable[[str], Any]) -> Any:
+    value = value.strip()
+    if not value:
+        return None
+    if not value.isascii():  # Python parses non ASCII digits, pydantic does not
+        return value
+    try:
+        return converter(value)
+    except ValueError:  # Left for pydantic to coerce or report
+        return value
+
+
+def parse_cell(value: str) -> Any:
+    """Guesses the type of a CSV cell without a contract: empty cells are None, then int, float or str."""
+    value = value.strip()
+    if not value:
+        return None
+    if value.isascii():
+        for converter in (int, float):
+            try:
+                return converter(value)
+            except ValueError:
+                pass
+    return value
+
+
+def parse_record(record: Dict[str, str]) -> Dict[str, Any]:
+    return {key: parse_cell(value) if isinstance(value, str) else value for key, value in record.items()}
+
+
+def convert_column(values: Sequence[str], field_type: Any) -> List[Any]:
+    """
+    Converts a column of CSV cells to the field type. Strings are stripped,
+    empty numeric cells are None and cells that can't be converted are left
+    as strings for the validation to coerce or report.
+    """
+    converter = CONVERTERS.get(field_type)
+    if converter is None:
+        return list(map(str.strip, values))
+    if "".join(values).isascii():
+        try:
+            return list(map(converter, values))
+        except ValueError:  # Empty or invalid cells, converted one by one
+            pass
+    return [convert_cell(value, converter) for value in values]
+
+
+def convert_record(record: Dict[str, Optional[str]], field_types: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts the cells of a CSV record of the contract fields as
+    `convert_column` does, so a row gets the same result read as a record or
+    in a column. Missing cells of short rows are empty.
+    """
+    converted = dict(record)
+    for name, field_type in field_types.items():
+        if name not in record:
+            continue
+        value = record[name] or ""
+        converter = CONVERTERS.get(field_type)
+        converted[name] = value.strip() if converter is None else convert_cell(value, converter)
+    return converted
+
+
+def get_field_types(contract: "Contract") -> Dict[str, Any]:
+    return {name: field.field_type for name, field in contract.field_validators.items()}
+
+
+def transpose(rows: List[List[str]], indices: List[int]) -> List[Sequence[str]]:
+    if not indices:
+        return []
+    getter = itemgetter(*indices)
+    try:
+        cells = list(map(getter, rows))
+    except IndexError:  # Short rows, their missing cells are empty
+        width = max(indices) + 1
+        cells = [getter(row + [""] * (width - len(row))) for row in rows]
+    if len(indices) == 1:
+        return [cells]
+    return list(zip(*cells))
+
+
+def read_csv_columns(
+    file_path: Path,
+    field_types: Dict[str, Any],
+    encoding: str = DEFAULT_ENCODING,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    skip_rows: int = 0,
+) -> Iterator[Tuple[Dict[str, List[Any]], int]]:
+    """
+    Reads a CSV file in chunks of `chunk_size` rows, yielding the typed columns
+    of the chunk and its number of rows. Only the columns in `field_types`
+    are converted, the rest of the cells are never touched.
+    """
+    with open_text(file_path, encoding, buffer_size) as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader, [])]
+        selected = [(name, index) for index, name in enumerate(header) if name in field_types]
+        names = [name for name, _ in selected]
+        indices = [index for _, index in selected]
+        rows = islice(reader, skip_rows, None)
+        while chunk := list(islice(rows, chunk_size)):
+            columns = {
+                name: convert_column(values, field_types[name])
+                for name, values in zip(names, transpose(chunk, indices))
+            }
+            yield columns, len(chunk)
+
+
+def validate_csv_file(
+    contract: "Contract",
+    file_path: Path,
+    encoding: str = DEFAULT_ENCODING,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    chunk_size: Optional[int] = DEFAULT_CHUNK_SIZE,
+    skip_rows: int = 0,
+) -> Iterator[BatchValidation]:
+    """
+    Validates a CSV file one chunk at a time, converting the columns of the
+    contract fields to their type in bulk. The first `skip_rows` rows are
+    not validated.
+    """
+    field_types = get_field_types(contract)
+    for columns, size in read_csv_columns(file_path, field_types, encoding, buffer_size, chunk_size, skip_rows):
+        yield contract.validate_batch(columns, size=size)
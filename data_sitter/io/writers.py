@@ -0,0 +1,100 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .readers import DEFAULT_BUFFER_SIZE, DEFAULT_ENCODING, NDJSON_SUFFIXES
+
+
+class RecordWriter(ABC):
+    """Buffered streaming writer of records."""
+
+    def __init__(
+        self,
+        file_path: Path,
+        encoding: str = DEFAULT_ENCODING,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        resume_at: Optional[int] = None,
+    ):
+        """When `resume_at` is given, the file is truncated to that byte position and appended to."""
+        self.file_path = Path(file_path)
+        self.encoding = encoding
+        mode = "w"
+        if resume_at is not None:
+            with open(self.file_path, "r+b") as f:
+                f.truncate(resume_at)
+            mode = "a"
+        self.file = open(self.file_path, mode, encoding=encoding, newline="", buffering=buffer_size)
+        self.count = 0
+
+    @abstractmethod
+    def _write(self, record: dict):
+        pass  # pragma: no cover
+
+    def write(self, record: dict):
+        self._write(record)
+        self.count += 1
+
+    def write_reject(self, row: int, record: dict, errors: Dict[str, List[str]]):
+        self.write({"row": row, "record": record, "errors": errors})
+
+    def tell(self) -> int:
+        """Byte position of the written data, flushing the buffered records."""
+        self.file.flush()
+        return self.file.buffer.tell()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvRecordWriter(RecordWriter):
+    """Writes records as CSV rows, the header is taken from the first record."""
+    writer: csv.DictWriter = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.file.tell() > 0:  # Resuming, the header was already written
+            with open(self.file_path, encoding=self.encoding, newline="") as f:
+                fieldnames = next(csv.reader(f))
+            self.writer = csv.DictWriter(self.file, fieldnames=fieldnames, extrasaction="ignore")
+
+    def _write(self, record: dict):
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.file, fieldnames=list(record), extrasaction="ignore")
+            self.writer.writeheader()
+        self.writer.writerow({
+            key: json.dumps(value) if isinstance(value, (dict, list)) else value
+            for key, value in record.items()
+        })
+
+    def write_reject(self, row: int, record: dict, errors: Dict[str, List[str]]):
+        self.write({"row": row, **record, "errors": errors})
+
+
+class NdjsonRecordWriter(RecordWriter):
+    """Writes one JSON document per line."""
+
+    def _write(self, record: dict):
+        self.file.write(json.dumps(record, default=str))
+        self.file.write("\n")
+
+
+def open_writer(
+    file_path: Path,
+    encoding: str = DEFAULT_ENCODING,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    resume_at: Optional[int] = None,
+) -> RecordWriter:
+    file_path = Path(file_path)
+    if file_path.suffix == ".csv":
+        return CsvRecordWriter(file_path, encoding, buffer_size, resume_at)
+    if file_path.suffix in NDJSON_SUFFIXES:
+        return NdjsonRecordWriter(file_path, encoding, buffer_size, resume_at)
+    raise NotImplementedError(f"Output type {file_path.suffix} not implemented.")
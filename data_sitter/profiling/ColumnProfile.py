@@ -0,0 +1,119 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional
+
+from .HyperLogLog import DEFAULT_PRECISION, HyperLogLog
+from .KllSketch import DEFAULT_K, KllSketch
+from .SpaceSaving import DEFAULT_TOP_K, SpaceSaving
+
+
+QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ColumnProfile:
+    """
+    Statistics of a column computed in one pass and bounded memory: exact
+    counts, bounds and lengths, and sketches of the distinct count, the
+    quantiles of its numbers and its most frequent values.
+    """
+    count: int
+    nulls: int
+    types: Counter
+    lengths: Counter
+    bounds: Dict[str, list]
+    distinct: HyperLogLog
+    numbers: KllSketch
+    frequent: SpaceSaving
+
+    def __init__(
+        self,
+        precision: int = DEFAULT_PRECISION,
+        k: int = DEFAULT_K,
+        top_k: int = DEFAULT_TOP_K,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.count = 0
+        self.nulls = 0
+        self.types = Counter()
+        self.lengths = Counter()
+        self.bounds = {}
+        self.top_k = top_k
+        self.distinct = HyperLogLog(precision)
+        self.numbers = KllSketch(k, seed)
+        self.frequent = SpaceSaving(4 * top_k)
+
+    def _update_bounds(self, kind: str, value: Any):
+        bounds = self.bounds.get(kind)
+        if bounds is None:
+            self.bounds[kind] = [value, value]
+        elif value < bounds[0]:
+            bounds[0] = value
+        elif value > bounds[1]:
+            bounds[1] = value
+
+    def add(self, value: Any):
+        self.count += 1
+        if value is None:
+            self.nulls += 1
+            return
+        self.types[type(value).__name__] += 1
+        self.distinct.add(value)
+        try:
+            self.frequent.add(value)
+        except TypeError:  # Unhashable values are not counted
+            pass
+        if is_number(value):
+            if value == value:  # NaN can't be ranked
+                self._update_bounds("number", value)
+                self.numbers.add(value)
+        elif isinstance(value, str):
+            self._update_bounds("string", value)
+            self.lengths[len(value)] += 1
+
+    def add_column(self, values: Iterable[Any]):
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "ColumnProfile") -> "ColumnProfile":
+        self.count += other.count
+        self.nulls += other.nulls
+        self.types.update(other.types)
+        self.lengths.update(other.lengths)
+        for kind, (minimum, maximum) in other.bounds.items():
+            self._update_bounds(kind, minimum)
+            self._update_bounds(kind, maximum)
+        self.distinct.merge(other.distinct)
+        self.numbers.merge(other.numbers)
+        self.frequent.merge(other.frequent)
+        return self
+
+    @property
+    def minimum(self) -> Any:
+        return next((self.bounds[kind][0] for kind in ("number", "string") if kind in self.bounds), None)
+
+    @property
+    def maximum(self) -> Any:
+        return next((self.bounds[kind][1] for kind in ("number", "string") if kind in self.bounds), None)
+
+    def to_dict(self) -> dict:
+        profile = {
+            "count": self.count,
+            "nulls": self.nulls,
+            "types": dict(self.types),
+            "min": self.minimum,
+            "max": self.maximum,
+            "distinct": min(self.distinct.count(), self.count - self.nulls),
+            "top": [[value, count] for value, count in self.frequent.top(self.top_k)],
+        }
+        if self.lengths:
+            profile["lengths"] = {
+                "min": min(self.lengths),
+                "max": max(self.lengths),
+                "histogram": dict(sorted(self.lengths.items())),
+            }
+        if self.numbers.n:
+            profile["quantiles"] = dict(zip(map(str, QUANTILES), self.numbers.quantiles(QUANTILES)))
+        return profile
@@ -0,0 +1,105 @@
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
+
+from .ColumnProfile import ColumnProfile
+from ..io import read_records
+from ..io.arrow import DEFAULT_BATCH_SIZE, is_columnar_file, iter_record_batches, record_batch_columns
+from ..io.readers import DEFAULT_BUFFER_SIZE, DEFAULT_ENCODING, get_data_suffix
+from ..io.typed_csv import parse_record
+
+
+class DataProfile:
+    """
+    Profiles of the columns of a dataset, fed one record or one batch of
+    columns at a time. Profiles of chunks computed apart, even by other
+    workers, can be merged into the profile of the whole dataset.
+    """
+    columns: Dict[str, ColumnProfile]
+    rows: int
+
+    def __init__(self, columns: Optional[Iterable[str]] = None, **profile_kwargs) -> None:
+        """Only the given `columns` are profiled, all the columns found otherwise."""
+        self.profile_kwargs = profile_kwargs
+        self.fixed_columns = columns is not None
+        self.columns = {name: ColumnProfile(**profile_kwargs) for name in columns or []}
+        self.rows = 0
+
+    def _get_column(self, name: str) -> Optional[ColumnProfile]:
+        column = self.columns.get(name)
+        if column is None and not self.fixed_columns:
+            column = self.columns[name] = ColumnProfile(**self.profile_kwargs)
+            column.count = column.nulls = self.rows  # Missing from the rows already profiled
+        return column
+
+    def add(self, record: Mapping[str, Any]):
+        for name in record:
+            self._get_column(name)
+        for name, column in self.columns.items():
+            column.add(record.get(name))
+        self.rows += 1
+
+    def add_columns(self, columns: Mapping[str, Sequence], size: int):
+        for name in columns:
+            self._get_column(name)
+        for name, column in self.columns.items():
+            values = columns.get(name)
+            if values is None:
+                column.count += size
+                column.nulls += size
+            else:
+                column.add_column(values)
+        self.rows += size
+
+    def merge(self, other: "DataProfile") -> "DataProfile":
+        for name in other.columns:
+            self._get_column(name)
+        for name, column in self.columns.items():
+            if name in other.columns:
+                column.merge(other.columns[name])
+            else:
+                column.count += other.rows
+                column.nulls += other.rows
+        self.rows += other.rows
+        return self
+
+    def to_dict(self) -> dict:
+        return {"rows": self.rows, "columns": {name: column.to_dict() for name, column in self.columns.items()}}
+
+
+def profile_records(
+    records: Iterable[Mapping[str, Any]], columns: Optional[Iterable[str]] = None, **profile_kwargs
+) -> DataProfile:
+    profile = DataProfile(columns, **profile_kwargs)
+    for record in records:
+        profile.add(record)
+    return profile
+
+
+def profile_file(
+    file_path: Path,
+    profile: DataProfile,
+    encoding: str = DEFAULT_ENCODING,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_rows: Optional[int] = None,
+) -> DataProfile:
+    """
+    Profiles a data file in one pass, or only its first `max_rows` rows. The
+    cells of CSV files are typed as int, float or str.
+    """
+    if is_columnar_file(file_path):
+        columns = list(profile.columns) if profile.fixed_columns else None
+        for batch in iter_record_batches(file_path, columns, batch_size):
+            if max_rows is not None:
+                if profile.rows >= max_rows:
+                    break
+                batch = batch.slice(0, max_rows - profile.rows)
+            profile.add_columns(record_batch_columns(batch), batch.num_rows)
+        return profile
+    records = read_records(file_path, encoding, buffer_size)
+    if get_data_suffix(file_path) == '.csv':
+        records = map(parse_record, records)
+    for record in islice(records, max_rows):
+        profile.add(record)
+    return profile
@@ -0,0 +1,50 @@
+import math
+from hashlib import blake2b
+from typing import Any, List
+
+
+DEFAULT_PRECISION = 12
+HASH_BITS = 64
+
+
+def hash_value(value: Any) -> int:
+    """Stable 64 bits hash, the same in every process so sketches can be merged across workers."""
+    return int.from_bytes(blake2b(repr(value).encode(), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """
+    Approximate distinct count in 2^precision registers, with a relative
+    standard error of about 1.04 / sqrt(2^precision) (1.6% by default).
+    """
+    precision: int
+    registers: List[int]
+
+    def __init__(self, precision: int = DEFAULT_PRECISION) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+        self.precision = precision
+        self.registers = [0] * (1 << precision)
+
+    def add(self, value: Any):
+        hashed = hash_value(value)
+        remaining_bits = HASH_BITS - self.precision
+        index = hashed >> remaining_bits
+        rank = remaining_bits - (hashed & ((1 << remaining_bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Can't merge HyperLogLogs of different precision.")
+        self.registers = [max(a, b) for a, b in zip(self.registers, other.registers)]
+        return self
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:  # Small range correction
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
@@ -0,0 +1,86 @@
+import math
+import random
+from typing import List, Optional
+
+
+DEFAULT_K = 200
+CAPACITY_DECAY = 2 / 3
+
+
+class KllSketch:
+    """
+    KLL sketch of approximate quantiles. Items are kept in levels of
+    compactors, an item at level h stands for 2^h items of the stream; when a
+    level is full half of its sorted items are promoted to the next one.
+    """
+    k: int
+    n: int
+    compactors: List[list]
+
+    def __init__(self, k: int = DEFAULT_K, seed: Optional[int] = None) -> None:
+        self.k = k
+        self.n = 0
+        self.compactors = []
+        self.max_size = 0
+        self.random = random.Random(seed)
+        self._grow()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.k * CAPACITY_DECAY ** depth)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self.max_size = sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    @property
+    def size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def _compress(self):
+        while self.size >= self.max_size:
+            for level, compactor in enumerate(self.compactors):
+                if len(compactor) >= self._capacity(level):
+                    if level + 1 == len(self.compactors):
+                        self._grow()
+                    compactor.sort()
+                    kept = [compactor.pop()] if len(compactor) % 2 else []
+                    self.compactors[level + 1].extend(compactor[self.random.randint(0, 1)::2])
+                    self.compactors[level] = kept
+                    break
+
+    def add(self, value):
+        self.compactors[0].append(value)
+        self.n += 1
+        if len(self.compactors[0]) >= self._capacity(0) and self.size >= self.max_size:
+            self._compress()
+
+    def merge(self, other: "KllSketch") -> "KllSketch":
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantiles(self, fractions: List[float]) -> List:
+        """The approximate value at each fraction of the stream (0 is the minimum, 1 the maximum)."""
+        if not self.n:
+            return [None] * len(fractions)
+        weighted = sorted(
+            (value, 1 << level) for level, compactor in enumerate(self.compactors) for value in compactor
+        )
+        total = sum(weight for _, weight in weighted)
+        results = []
+        for fraction in fractions:
+            target, cumulative = fraction * total, 0
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    break
+            results.append(value)
+        return results
+
+    def quantile(self, fraction: float):
+        return self.quantiles([fraction])[0]
@@ -0,0 +1,38 @@
+from typing import Any, Dict, List, Tuple
+
+
+DEFAULT_TOP_K = 10
+
+
+class SpaceSaving:
+    """
+    Space-Saving summary of the most frequent values in `capacity` counters.
+    A new value takes over the counter of the least frequent one, so the
+    counts are over-estimated by at most the count they inherited.
+    """
+    capacity: int
+    counts: Dict[Any, int]
+
+    def __init__(self, capacity: int = 4 * DEFAULT_TOP_K) -> None:
+        self.capacity = capacity
+        self.counts = {}
+
+    def add(self, value: Any, count: int = 1):
+        counts = self.counts
+        if value in counts:
+            counts[value] += count
+        elif len(counts) < self.capacity:
+            counts[value] = count
+        else:
+            evicted = min(counts, key=counts.get)
+            counts[value] = counts.pop(evicted) + count
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        counts = dict(self.counts)
+        for value, count in other.counts.items():
+            counts[value] = counts.get(value, 0) + count
+        self.counts = dict(sorted(counts.items(), key=lambda item: -item[1])[:self.capacity])
+        return self
+
+    def top(self, k: int = DEFAULT_TOP_K) -> List[Tuple[Any, int]]:
+        return sorted(self.counts.items(), key=lambda item: -item[1])[:k]
@@ -0,0 +1,16 @@
+from .HyperLogLog import HyperLogLog
+from .KllSketch import KllSketch
+from .SpaceSaving import SpaceSaving
+from .ColumnProfile import ColumnProfile
+from .DataProfile import DataProfile, profile_file, profile_records
+
+
+__all__ = [
+    "HyperLogLog",
+    "KllSketch",
+    "SpaceSaving",
+    "ColumnProfile",
+    "DataProfile",
+    "profile_file",
+    "profile_records",
+]
@@ -0,0 +1,98 @@
+import re
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from .ColumnProfile import ColumnProfile
+from .DataProfile import DataProfile
+from ..field_types.FieldTypes import FieldTypes
+from ..utils.logger_config import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CATEGORIES = 10
+
+
+def format_number(value: Any) -> str:
+    """Writes a number as the rule parser reads them, without exponent."""
+    if isinstance(value, int):
+        return str(value)
+    text = repr(value)
+    if "e" in text:
+        text = format(Decimal(text), "f")
+    return text
+
+
+def infer_type(column: ColumnProfile) -> Optional[FieldTypes]:
+    """The field type of a column, None when no field type accepts all its values (e.g. booleans or dicts)."""
+    types = set(column.types)
+    if types == {"int"}:
+        return FieldTypes.INT
+    if types and types <= {"int", "float"}:
+        return FieldTypes.FLOAT
+    if types == {"list"}:
+        return FieldTypes.LIST
+    if types == {"date"}:
+        return FieldTypes.DATE
+    if types == {"datetime"}:
+        return FieldTypes.DATETIME
+    if types - {"int", "float", "str"}:
+        return None
+    return FieldTypes.STRING
+
+
+def get_categories(column: ColumnProfile, max_categories: int) -> Optional[List[str]]:
+    """The values of a string column when it has few of them, each seen at least twice on average."""
+    counts = column.frequent.counts
+    if len(counts) >= column.frequent.capacity:  # Values were evicted, the counts may be partial
+        return None
+    non_null = column.count - column.nulls
+    if not 0 < len(counts) <= max_categories or 2 * len(counts) > non_null:
+        return None
+    return sorted(counts)
+
+
+def values_key(name: str, values: Dict[str, Any]) -> str:
+    key = base = re.sub(r"\W", "_", name) + "_values"
+    suffix = 1
+    while key in values:
+        suffix += 1
+        key = f"{base}_{suffix}"
+    return key
+
+
+def infer_contract(
+    profile: DataProfile, name: str = "inferred", max_categories: int = DEFAULT_MAX_CATEGORIES
+) -> dict:
+    """
+    Builds a contract from a data profile with the types of the fields,
+    `Is not null` for the fields without nulls, the bounds of the numeric
+    fields and `Is one of` for the low-cardinality string fields. The
+    categories are written to the `values` of the contract. Fields whose values
+    no field type accepts are left out, with a warning.
+    """
+    fields, values = [], {}
+    for field_name, column in profile.columns.items():
+        field_type = infer_type(column)
+        if field_type is None:
+            logger.warning(
+                f"Field '{field_name}' left out of the inferred contract, "
+                f"no field type accepts its values: {sorted(column.types)}"
+            )
+            continue
+        rules = []
+        if column.count and not column.nulls:
+            rules.append("Is not null")
+        if field_type in (FieldTypes.INT, FieldTypes.FLOAT) and "number" in column.bounds:
+            minimum, maximum = column.bounds["number"]
+            if abs(minimum) != float("inf"):
+                rules.append(f"Is at least {format_number(minimum)}")
+            if abs(maximum) != float("inf"):
+                rules.append(f"Is at most {format_number(maximum)}")
+        elif field_type == FieldTypes.STRING and set(column.types) == {"str"}:
+            if categories := get_categories(column, max_categories):
+                key = values_key(field_name, values)
+                values[key] = categories
+                rules.append(f"Is one of $values.{key}")
+        fields.append({"name": field_name, "type": field_type.value, "rules": rules})
+    return {"name": name, "fields": fields, "values": values}
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Callable, List
 
 from .Enums import LogicalOperator
+from .RuleViolation import RuleViolation
 from .ProcessedRule import ProcessedRule, LogicalParsedRule
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -18,10 +19,10 @@ def and_or_validator(validators: List[Callable], operator: LogicalOperator) -> C
                 exceptions.append(str(e))  # Store error message
 
         if operator == LogicalOperator.OR and all(exceptions):
-            raise ValueError(f"None of the conditions were met. Errors: {exceptions}")
+            raise RuleViolation("or", "None of the conditions were met. Errors: {errors}", errors=exceptions)
         if operator == LogicalOperator.AND and any(exceptions):
             exceptions = list(filter(None, exceptions))
-            raise ValueError(f"Not all conditions were met. Errors: {exceptions}")
+            raise RuleViolation("and", "Not all conditions were met. Errors: {errors}", errors=exceptions)
         return value
     return validator
 
@@ -33,7 +34,7 @@ def not_validator(validator_: Callable):
         except Exception:
             return value  # Validation passes if the condition fails
         else:
-            raise ValueError("Condition was met, but expected NOT to be met.")
+            raise RuleViolation("not", "Condition was met, but expected NOT to be met.")
     return validator
 
 
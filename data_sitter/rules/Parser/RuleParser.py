@@ -6,6 +6,7 @@ from parse_type import TypeBuilder
 from .parser_utils import REF_PATTERN, get_value_from_reference, get_key_from_reference
 from .alias_parameters_parser import NotCompatibleTypes, alias_parameters_types
 from ..Rule import Rule
+from ..ValueSet import ValueSet
 from ..MatchedRule import MatchedRule
 
 
@@ -40,8 +41,11 @@ class RuleParser:
 
         def parse_reference(text):
             reference_value = get_value_from_reference(text, self.values)
-            validation = _parser.parse(repr(reference_value))
-            if validation is None:
+            if isinstance(reference_value, ValueSet):  # External values are only read as strings
+                compatible = type_name == "Strings"
+            else:
+                compatible = _parser.parse(repr(reference_value)) is not None
+            if not compatible:
                 key = get_key_from_reference(text)
                 raise NotCompatibleTypes(f"The reference value of '{key}' is not compatible with '{type_name}'.")
             return text
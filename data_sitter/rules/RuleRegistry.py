@@ -12,6 +12,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = get_logger(__name__)
 
+DATASET = "Dataset"
+
 
 class RuleMetadata(NamedTuple):
     rule: str
@@ -21,6 +23,7 @@ class RuleMetadata(NamedTuple):
 class RuleRegistry:
     rules: Dict[str, List[Rule]] = {}
     type_map: Dict[str, Type["BaseField"]] = {}
+    dataset_rules: List[Rule] = []
 
     @classmethod
     def register_field(cls, field_class: Type["BaseField"]) -> Type["BaseField"]:
@@ -41,6 +44,21 @@ class RuleRegistry:
             cls.add_rule(field_class, rule)
         return field_class
 
+    @classmethod
+    def register_dataset_rules(cls, rules_class: type) -> type:
+        """Registers the rules of a class checking the whole dataset instead of a single value."""
+        for method in rules_class.__dict__.values():
+            metadata: RuleMetadata = getattr(method, "_rule_metadata", None)
+            if metadata is None:
+                continue
+            cls.dataset_rules.append(Rule(
+                field_type=DATASET,
+                field_rule=metadata.rule,
+                rule_setter=method,
+                fixed_params=metadata.fixed_params
+            ))
+        return rules_class
+
     @classmethod
     def add_rule(cls, field_class: Type["BaseField"], rule: Rule):
         if field_class.type_name not in cls.rules:
@@ -84,3 +102,7 @@ def register_rule(rule: str, fixed_params: dict = None):
 
 def register_field(field_class: type):
     return RuleRegistry.register_field(field_class)
+
+
+def register_dataset_rules(rules_class: type):
+    return RuleRegistry.register_dataset_rules(rules_class)
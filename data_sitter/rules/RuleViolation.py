@@ -0,0 +1,98 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+
+MESSAGE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=MESSAGE_CACHE_SIZE)
+def _render_cached(template: str, params: Tuple[Tuple[str, type, Any], ...]) -> str:
+    return template.format(**{key: value for key, _, value in params})
+
+
+def render_message(template: str, params: Dict[str, Any]) -> str:
+    """Render a message template, sharing the same string across identical renders."""
+    if not params:
+        return template
+    try:
+        # The types are part of the key: 1, 1.0 and True are equal but render differently
+        key = tuple((name, type(value), value) for name, value in sorted(params.items()))
+        return _render_cached(template, key)
+    except TypeError:  # Unhashable parameters (e.g. lists) can't be cached
+        return template.format(**params)
+
+
+def _rebuild_violation(cls, rule_id: str, template: str, params: Dict[str, Any]) -> "RuleViolation":
+    return cls(rule_id, template, **params)
+
+
+class RuleViolation(ValueError):
+    """
+    Structured error raised by a rule validator.
+
+    It carries a stable `rule_id` and the parameters of the failure, the
+    human-readable message is only rendered when it is requested.
+    """
+    rule_id: str
+    template: str
+    params: Dict[str, Any]
+
+    def __init__(self, rule_id: str, template: str, **params) -> None:
+        super().__init__(template)
+        self.rule_id = rule_id
+        self.template = template
+        self.params = params
+
+    @classmethod
+    def from_pydantic_error(cls, error: dict) -> "RuleViolation":
+        """Returns the violation behind a pydantic error, wrapping pydantic's own errors."""
+        violation = error.get('ctx', {}).get('error')
+        if isinstance(violation, RuleViolation):
+            return violation
+        return cls(error['type'], error['msg'])
+
+    @property
+    def message(self) -> str:
+        return render_message(self.template, self.params)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.rule_id!r}, {self.params!r})"
+
+    def __reduce__(self):
+        return _rebuild_violation, (type(self), self.rule_id, self.template, self.params)
+
+    def to_dict(self) -> dict:
+        return {"rule_id": self.rule_id, "params": self.params, "msg": self.message}
+
+    def expand(self) -> List["RuleViolation"]:
+        """The single violations it stands for."""
+        return [self]
+
+
+class RuleViolations(RuleViolation):
+    """Several violations of the same value, raised when all the failing rules are reported."""
+    violations: List[RuleViolation]
+
+    def __init__(self, violations: List[RuleViolation]) -> None:
+        super().__init__("violations", "{violations}")
+        self.violations = violations
+
+    @classmethod
+    def group(cls, violations: List[RuleViolation]) -> RuleViolation:
+        return violations[0] if len(violations) == 1 else cls(violations)
+
+    @property
+    def message(self) -> str:
+        return " ".join(violation.message for violation in self.violations)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.violations!r})"
+
+    def __reduce__(self):
+        return type(self), (self.violations,)
+
+    def expand(self) -> List[RuleViolation]:
+        return list(self.violations)
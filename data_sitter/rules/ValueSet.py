@@ -0,0 +1,151 @@
+import mmap
+import hashlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+
+class UnsortedValuesFile(Exception):
+    """The values file of a memory-mapped value set is not sorted."""
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ValueSet(ABC):
+    """
+    A set of string values loaded from an external file, with one value per
+    line. `digest` is the hash of the file content when it was loaded.
+    """
+    path: Path
+    digest: str
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    @abstractmethod
+    def __contains__(self, value: Any) -> bool:
+        pass  # pragma: no cover
+
+    def is_stale(self) -> bool:
+        """Whether the content of the file changed since it was loaded."""
+        try:
+            return file_digest(self.path) != self.digest
+        except FileNotFoundError:
+            return True
+
+    def close(self):
+        """Releases the resources held to look the values up."""
+
+    def __enter__(self) -> "ValueSet":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[str]:
+        with open(self.path, encoding="utf8", newline="") as f:
+            for line in f:
+                yield line.rstrip("\r\n")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r})"
+
+    def __reduce__(self):
+        return type(self), (self.path,)
+
+
+class FrozenValueSet(ValueSet):
+    """Values loaded in memory as a frozenset, O(1) lookups."""
+    values: frozenset
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.digest = file_digest(self.path)
+        self.values = frozenset(super().__iter__())
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class MmapValueSet(ValueSet):
+    """
+    Values of a sorted file, memory-mapped and searched with a bisection over
+    its lines, O(log n) lookups without loading the values in memory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        with open(self.path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.path.stat().st_size else b""
+        self.digest = hashlib.sha256(self.map).hexdigest()
+        try:
+            self.check_sorted()
+        except UnsortedValuesFile:
+            self.close()
+            raise
+
+    def close(self):
+        """Unmaps the file, the map keeps its own handle of the file until then."""
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+
+    def check_sorted(self):
+        previous = None
+        for value in super().__iter__():
+            if previous is not None and value < previous:
+                raise UnsortedValuesFile(f"The values of {self.path} must be sorted, '{value}' follows '{previous}'.")
+            previous = value
+
+    def __contains__(self, value: Any) -> bool:
+        if not isinstance(value, str):
+            return False
+        target = value.encode("utf8")  # UTF-8 bytes sort like the code points
+        data, low, high = self.map, 0, len(self.map)
+        while low < high:
+            middle = (low + high) // 2
+            start = data.rfind(b"\n", 0, middle) + 1
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = len(data)
+            line = data[start:end].rstrip(b"\r")
+            if line == target:
+                return True
+            if line < target:
+                low = end + 1
+            else:
+                high = start
+        return False
+
+
+VALUE_SETS = {"set": FrozenValueSet, "mmap": MmapValueSet}
+
+
+def load_values(values: Dict[str, Any], values_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Loads the values given as `{"file": path, "lookup": "set" | "mmap"}` as value
+    sets, relative paths are relative to `values_dir`.
+    """
+    loaded = {}
+    for key, value in values.items():
+        if isinstance(value, dict) and "file" in value:
+            path = Path(value["file"])
+            if values_dir is not None and not path.is_absolute():
+                path = Path(values_dir) / path
+            lookup = value.get("lookup", "set")
+            if lookup not in VALUE_SETS:
+                raise ValueError(f"Lookup '{lookup}' not recognised for '{key}', expected one of {list(VALUE_SETS)}.")
+            value = VALUE_SETS[lookup](path)
+        loaded[key] = value
+    return loaded
@@ -4,7 +4,9 @@ from .Enums import LogicalOperator
 from .MatchedRule import MatchedRule
 from .LogicalRule import LogicalRule
 from .ProcessedRule import ProcessedRule
-from .RuleRegistry import RuleRegistry, register_rule, register_field
+from .RuleViolation import RuleViolation, RuleViolations
+from .ValueSet import ValueSet, FrozenValueSet, MmapValueSet, load_values
+from .RuleRegistry import RuleRegistry, register_rule, register_field, register_dataset_rules
 
 
 __all__ = [
@@ -13,8 +15,15 @@ __all__ = [
     "MatchedRule",
     "LogicalRule",
     "ProcessedRule",
+    "RuleViolation",
+    "RuleViolations",
+    "ValueSet",
+    "FrozenValueSet",
+    "MmapValueSet",
+    "load_values",
     "RuleRegistry",
     "register_rule",
     "register_field",
+    "register_dataset_rules",
     "LogicalOperator",
 ]
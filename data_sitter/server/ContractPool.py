@@ -0,0 +1,38 @@
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from ..Contract import Contract
+
+
+class ContractNotFound(KeyError):
+    pass
+
+
+class ContractPool:
+    """The contracts served, by name."""
+    contracts: Dict[str, Contract]
+
+    def __init__(self, contracts: Iterable[Contract] = ()) -> None:
+        self.contracts = {}
+        for contract in contracts:
+            self.add(contract)
+
+    @classmethod
+    def from_files(cls, paths: Iterable[Path], encoding: str = "utf8", **kwargs) -> "ContractPool":
+        return cls(
+            Contract.from_dict(json.loads(Path(path).read_text(encoding)), values_dir=Path(path).parent, **kwargs)
+            for path in paths
+        )
+
+    def add(self, contract: Contract):
+        self.contracts[contract.name] = contract
+
+    def get(self, name: str) -> Contract:
+        if name not in self.contracts:
+            raise ContractNotFound(name)
+        return self.contracts[name]
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.contracts)
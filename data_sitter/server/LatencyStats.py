@@ -0,0 +1,48 @@
+import time
+from collections import deque
+from typing import Deque, Optional
+
+
+DEFAULT_WINDOW = 10_000
+
+
+def percentile(sorted_values: list, fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class LatencyStats:
+    """Throughput since the start and latency percentiles over the last `window` requests."""
+    latencies: Deque[float]
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self.latencies = deque(maxlen=window)
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.records = 0
+        self.batches = 0
+        self.batched_records = 0
+
+    def add_request(self, latency: float, records: int = 1):
+        self.latencies.append(latency)
+        self.requests += 1
+        self.records += records
+
+    def add_batch(self, size: int):
+        self.batches += 1
+        self.batched_records += size
+
+    def to_dict(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        latencies = sorted(self.latencies)
+        p50, p99 = percentile(latencies, 0.5), percentile(latencies, 0.99)
+        return {
+            "requests": self.requests,
+            "records": self.records,
+            "records_per_second": self.records / elapsed if elapsed else 0.0,
+            "p50_ms": p50 * 1000 if p50 is not None else None,
+            "p99_ms": p99 * 1000 if p99 is not None else None,
+            "micro_batches": self.batches,
+            "mean_micro_batch_size": self.batched_records / self.batches if self.batches else None,
+        }
@@ -0,0 +1,100 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .LatencyStats import LatencyStats
+from ..Contract import Contract
+from ..Validation import BatchValidation
+
+
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_LATENCY = 0.002
+
+
+def records_to_columns(contract: Contract, records: Sequence[dict]) -> Dict[str, List[Any]]:
+    return {name: [record.get(name) for record in records] for name in contract.field_validators}
+
+
+def validate_records(contract: Contract, records: Sequence[dict]) -> BatchValidation:
+    return contract.validate_batch(records_to_columns(contract, records), size=len(records))
+
+
+class MicroBatcher:
+    """
+    Coalesces the records validated concurrently into batches of up to
+    `max_batch_size` records. A batch waits at most `max_latency` seconds for
+    more records, and only while requests keep arriving together: a lone
+    request is validated right away.
+    """
+    contract: Contract
+    queue: "asyncio.Queue[Tuple[dict, asyncio.Future]]"
+
+    def __init__(
+        self,
+        contract: Contract,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+        stats: Optional[LatencyStats] = None,
+    ) -> None:
+        self.contract = contract
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.stats = stats
+        self.queue = asyncio.Queue()
+        self.last_batch_size = 0
+        self.task = None
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def validate(self, record: dict) -> dict:
+        """The errors of the record, validated in the next micro-batch."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((record, future))
+        return await future
+
+    def _drain(self, batch: list):
+        while len(batch) < self.max_batch_size and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+
+    async def _collect(self) -> list:
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + (self.max_latency if self.last_batch_size > 1 else 0)
+        await asyncio.sleep(0)  # Lets the requests already received enqueue their records
+        self._drain(batch)
+        while len(batch) < self.max_batch_size and (timeout := deadline - loop.time()) > 0:
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+            self._drain(batch)
+        return batch
+
+    async def run(self):
+        while True:
+            batch = await self._collect()
+            self.last_batch_size = len(batch)
+            if self.stats:
+                self.stats.add_batch(len(batch))
+            try:
+                batch_validation = validate_records(self.contract, [record for record, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            errors = batch_validation.errors
+            for row, (_, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result(errors.get(row) or {})
@@ -0,0 +1,191 @@
+import json
+import asyncio
+import time
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+from .ContractPool import ContractNotFound, ContractPool
+from .LatencyStats import LatencyStats
+from .MicroBatcher import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_LATENCY, MicroBatcher, validate_records
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+MAX_BODY_SIZE = 64 * 1024 * 1024
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str = None) -> None:
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+class Request:
+    method: str
+    path: str
+    headers: Dict[str, str]
+    body: bytes
+
+    def __init__(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> None:
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.headers.get("connection", "keep-alive").lower() != "close"
+
+    @property
+    def is_ndjson(self) -> bool:
+        return self.headers.get("content-type", "").split(";")[0].strip() in NDJSON_CONTENT_TYPES
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, path, _ = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    body = await reader.readexactly(length) if length else b""
+    return Request(method.upper(), path, headers, body)
+
+
+def encode_response(status: HTTPStatus, payload: dict, keep_alive: bool) -> bytes:
+    body = json.dumps(payload, default=str).encode()
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class ValidationServer:
+    """
+    Local HTTP server validating records against the contracts of a pool.
+
+    - `POST /contracts/{name}/validate`: a JSON record, micro-batched with the
+      concurrent requests, or NDJSON records (`Content-Type: application/x-ndjson`)
+      validated as a batch.
+    - `GET /contracts`: the names of the contracts.
+    - `GET /stats`: throughput and p50/p99 latency.
+    """
+    pool: ContractPool
+    stats: LatencyStats
+    batchers: Dict[str, MicroBatcher]
+
+    def __init__(
+        self,
+        pool: ContractPool,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+    ) -> None:
+        self.pool = pool
+        self.host = host
+        self.port = port
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.stats = LatencyStats()
+        self.batchers = {}
+        self.server = None
+
+    def get_batcher(self, name: str) -> MicroBatcher:
+        if name not in self.batchers:
+            contract = self.pool.get(name)
+            self.batchers[name] = MicroBatcher(contract, self.max_batch_size, self.max_latency, self.stats)
+        return self.batchers[name]
+
+    async def validate(self, name: str, request: Request) -> Tuple[dict, int]:
+        try:
+            if request.is_ndjson:
+                records = [json.loads(line) for line in request.body.splitlines() if line.strip()]
+            else:
+                records = json.loads(request.body)
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON")
+        if request.is_ndjson:
+            if not all(isinstance(record, dict) for record in records):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "Expected a JSON object on each NDJSON line")
+            batch_validation = validate_records(self.pool.get(name), records)
+            errors = batch_validation.errors
+            return {"rows": len(records), "invalid_rows": list(errors), "errors": errors}, len(records)
+        if not isinstance(records, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Expected a JSON object, or NDJSON records")
+        errors = await self.get_batcher(name).validate(records)
+        return {"valid": not errors, "errors": errors}, 1
+
+    async def route(self, request: Request) -> dict:
+        parts = [part for part in request.path.split("?")[0].split("/") if part]
+        if request.method == "GET" and parts == ["contracts"]:
+            return {"contracts": self.pool.names}
+        if request.method == "GET" and parts == ["stats"]:
+            return self.stats.to_dict()
+        if len(parts) == 3 and parts[0] == "contracts" and parts[2] == "validate":
+            if request.method != "POST":
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+            started = time.perf_counter()
+            response, records = await self.validate(parts[1], request)
+            self.stats.add_request(time.perf_counter() - started, records)
+            return response
+        raise HttpError(HTTPStatus.NOT_FOUND)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await read_request(reader)
+                    if request is None:
+                        break
+                    keep_alive = request.keep_alive
+                    status, payload = HTTPStatus.OK, await self.route(request)
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except ContractNotFound as e:
+                    status, payload = HTTPStatus.NOT_FOUND, {"error": f"Contract not found: {e.args[0]}"}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception as e:
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+                writer.write(encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]  # The port assigned when given 0
+        return self.server
+
+    async def stop(self):
+        for batcher in self.batchers.values():
+            await batcher.stop()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
@@ -0,0 +1,13 @@
+from .ContractPool import ContractPool, ContractNotFound
+from .LatencyStats import LatencyStats
+from .MicroBatcher import MicroBatcher
+from .ValidationServer import ValidationServer
+
+
+__all__ = [
+    "ContractPool",
+    "ContractNotFound",
+    "LatencyStats",
+    "MicroBatcher",
+    "ValidationServer",
+]
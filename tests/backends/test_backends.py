@@ -0,0 +1,134 @@
+import random
+from datetime import date
+import pytest
+
+from data_sitter import Contract
+from data_sitter.Validation import ValidationOutput
+from data_sitter.backends import (
+    BACKENDS, BackendNotFound, LeanBackend, PydanticBackend, ValidationBackend, get_backend, register_backend
+)
+
+
+CONTRACT_DICT = {
+    "name": "BackendContract",
+    "fields": [
+        {"name": "name", "type": "String", "rules": ["Is not null", "Has minimum length 3", "Is uppercase"]},
+        {"name": "age", "type": "Integer", "rules": ["Is not null", "Is at least 18"]},
+        {"name": "score", "type": "Float", "rules": ["Is between 0 and 10", "Has at most 2 decimal places"]},
+        {"name": "day", "type": "Date", "rules": ["Is after '2020-01-01'"]},
+        {"name": "tags", "type": "List[String]", "rules": ["Has maximum length 2", "Is one of ['A', 'B']"]},
+    ],
+}
+
+CELLS = {
+    "name": ["JOHN", "JO", "john", None, 3, "", "ÉCOLE"],
+    "age": [20, 17, "21", "x", None, True, 18.0, 18.5],
+    "score": [1.25, 1.255, 11, "2.5", None, "nan", float("inf"), 0],
+    "day": ["2021-01-01", "2019-01-01", "2021-13-01", None, 20210101],
+    "tags": [["A"], ["A", "C"], ["A", "B", "A"], "A", None, [1], [1, "A", 2.5]],
+}
+
+
+def random_items(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        item = {name: rng.choice(values) for name, values in CELLS.items() if rng.random() < 0.9}
+        if rng.random() < 0.2:
+            item["unknown"] = rng.random()
+        yield item
+
+
+def summary(validation):
+    violations = {
+        field: [(violation.rule_id, violation.message) for violation in field_violations]
+        for field, field_violations in (validation.violations or {}).items()
+    }
+    return validation.item, validation.unknowns, violations
+
+
+class TestBackends:
+    @pytest.mark.parametrize("options", [{}, {"detailed": True}, {"cache_size": 8}])
+    def test_lean_matches_pydantic(self, options):
+        """Test both backends give the same validations on random items"""
+        pydantic_contract = Contract.from_dict(CONTRACT_DICT, **options)
+        lean_contract = Contract.from_dict(CONTRACT_DICT, backend="lean", **options)
+        assert isinstance(pydantic_contract.backend, PydanticBackend)
+        assert isinstance(lean_contract.backend, LeanBackend)
+
+        for item in random_items(2000):
+            assert summary(lean_contract.validate(item)) == summary(pydantic_contract.validate(item)), item
+
+    def test_plain_value_errors(self):
+        """Test errors that aren't violations are reported as pydantic does"""
+        contract = Contract.from_dict({**CONTRACT_DICT, "name": "PlainErrors"})  # Not sharing its model
+
+        def failing(value):
+            raise ValueError("Plain error")
+        contract.field_validators["age"].validators.append(failing)
+
+        for backend in ("lean", "pydantic"):
+            contract.__dict__.pop("backend", None)
+            contract.backend_class = get_backend(backend)
+            violation, = contract.validate({"name": "JOHN", "age": 20}).violations["age"]
+            assert (violation.rule_id, violation.message) == ("value_error", "Value error, Plain error")
+
+    def test_get_backend(self):
+        """Test backends are found by name or class"""
+        assert get_backend("lean") is LeanBackend
+        assert get_backend(PydanticBackend) is PydanticBackend
+        with pytest.raises(BackendNotFound):
+            get_backend("missing")
+        with pytest.raises(BackendNotFound):
+            Contract.from_dict(CONTRACT_DICT, backend="missing")
+
+    def test_register_backend(self):
+        """Test custom backends can be registered and selected by name"""
+        @register_backend
+        class EchoBackend(ValidationBackend):
+            name = "echo"
+
+            def validate(self, item, output):
+                return PydanticBackend(self.contract).validate(item, output)
+
+        try:
+            contract = Contract.from_dict(CONTRACT_DICT, backend="echo")
+            assert isinstance(contract.backend, EchoBackend)
+            assert contract.validate({"name": "JOHN", "age": 20}).errors is None
+        finally:
+            BACKENDS.pop("echo")
+
+    def test_update_keeps_backend(self):
+        """Test the backend is kept when the contract is updated"""
+        contract = Contract.from_dict(CONTRACT_DICT, backend="lean")
+        contract.update({**CONTRACT_DICT, "fields": CONTRACT_DICT["fields"][:2]})
+        assert isinstance(contract.backend, LeanBackend)
+        assert contract.validate({"name": "JOHN", "age": 10}).errors == {"age": ["Value must be at least 18."]}
+
+    @pytest.mark.parametrize("backend", ["pydantic", "lean"])
+    def test_outputs(self, backend):
+        """Test valid items are returned as dicts, models or the input itself"""
+        contract = Contract.from_dict(CONTRACT_DICT, backend=backend)
+        item = {"name": "JOHN", "age": "20", "score": 1.5, "day": "2021-01-01", "tags": ["A"], "unknown": 1}
+
+        validation = contract.validate(item, output="dict")
+        assert validation.item == {
+            "name": "JOHN", "age": 20, "score": 1.5, "day": date(2021, 1, 1), "tags": ["A"]
+        }
+        assert validation.item is not item
+
+        validation = contract.validate(item, output=ValidationOutput.MODEL)
+        assert isinstance(validation.item, contract.pydantic_model)
+        assert validation.item.age == 20
+        assert validation.unknowns == {"unknown": 1}
+
+        validation = contract.validate(item, output="input")
+        assert validation.item is item
+        assert validation.unknowns == {"unknown": 1}
+
+        for output in ValidationOutput:  # Invalid items are always the filled dicts
+            validation = contract.validate({"name": "JO"}, output=output)
+            assert validation.item == {"name": "JO", "age": None, "score": None, "day": None, "tags": None}
+            assert set(validation.errors) == {"name", "age"}
+
+        with pytest.raises(ValueError):
+            contract.validate(item, output="tuple")
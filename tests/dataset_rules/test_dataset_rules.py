@@ -0,0 +1,49 @@
+import pytest
+
+from data_sitter.dataset_rules import DatasetRules, DatasetValidator, UniqueCheck, UnknownDatasetField
+from data_sitter.rules import RuleRegistry
+
+
+class TestDatasetRules:
+    def test_rules_registered(self):
+        """Test the dataset rules are registered apart from the field rules"""
+        rules = [rule.field_rule for rule in RuleRegistry.dataset_rules]
+        assert "Column {field:String} is unique" in rules
+        assert "Columns {fields:Strings} are unique" in rules
+
+    def test_unknown_field(self):
+        """Test dataset rules can only reference fields of the contract"""
+        dataset_rules = DatasetRules(["id"])
+        with pytest.raises(UnknownDatasetField):
+            dataset_rules.validate_unique_columns(["id", "missing"])
+
+    def test_unique_check_skips_nulls(self):
+        """Test keys with nulls are not checked"""
+        check = UniqueCheck(["id", "name"])
+        for row, item in enumerate([{"id": 1, "name": None}, {"id": 1, "name": None}, {"id": 1}], 1):
+            check.add(item, row)
+
+        assert list(check.violations()) == []
+
+    def test_dataset_validator_rows_and_batches(self):
+        """Test rows fed one by one and in batches are numbered from 1"""
+        validator = DatasetValidator({"unique id": UniqueCheck(["id"], max_keys=1)})
+        validator.add({"id": 1})
+        validator.add_batch({"id": [2, 1, None]}, 3)
+        validator.add({"id": 2})
+
+        violations = validator.violations()
+
+        assert validator.rows == 5
+        assert [violation.params["rows"] for violation in violations["unique id"]] == [[1, 3], [2, 5]]
+        assert violations["unique id"][0].rule_id == "unique"
+        assert str(violations["unique id"][0]) == "Key (1,) is repeated at rows [1, 3]."
+
+    def test_unique_check_many_repeats(self):
+        """Test a key repeated more than the rows kept reports its count"""
+        check = UniqueCheck(["id"], max_rows_per_key=2)
+        check.add_batch({"id": [7] * 5}, 5, 1)
+
+        [(duplicate, violation)] = check.violations()
+        assert duplicate.count == 5
+        assert str(violation) == "Key (7,) is repeated 5 times, first at rows [1, 2]."
@@ -0,0 +1,52 @@
+import pytest
+
+from data_sitter.dataset_rules import Duplicate, UniqueKeyTracker
+
+
+KEYS = [("a",), ("b",), ("a",), ("c",), ("b",), ("d",), ("a",)]
+
+
+class TestUniqueKeyTracker:
+    def test_duplicates_in_memory(self):
+        """Test repeated keys are reported with all their rows"""
+        tracker = UniqueKeyTracker()
+        for row, key in enumerate(KEYS, 1):
+            tracker.add(key, row)
+
+        assert not tracker.runs
+        assert list(tracker.duplicates()) == [Duplicate(("a",), [1, 3, 7], 3), Duplicate(("b",), [2, 5], 2)]
+
+    @pytest.mark.parametrize("max_keys", [1, 2, 3])
+    def test_duplicates_spilled(self, max_keys):
+        """Test keys repeated across spilled runs are found by the external merge"""
+        tracker = UniqueKeyTracker(max_keys=max_keys)
+        for row, key in enumerate(KEYS, 1):
+            tracker.add(key, row)
+
+        assert tracker.runs
+        assert sorted(tracker.duplicates()) == [Duplicate(("a",), [1, 3, 7], 3), Duplicate(("b",), [2, 5], 2)]
+        assert not tracker.runs  # The runs are removed once merged
+
+    def test_composite_keys_keep_types(self):
+        """Test composite keys are compared value by value and decoded back"""
+        tracker = UniqueKeyTracker(max_keys=1)
+        for row, key in enumerate([(1, "x"), (1, "y"), ("1", "x"), (1, "x")], 1):
+            tracker.add(key, row)
+
+        assert list(tracker.duplicates()) == [Duplicate((1, "x"), [1, 4], 2)]
+
+    @pytest.mark.parametrize("max_keys", [1, 1000])
+    def test_rows_per_key_capped(self, max_keys):
+        """Test only the first rows of a key are kept, the others are counted, in memory or spilled"""
+        tracker = UniqueKeyTracker(max_keys=max_keys, max_rows_per_key=3)
+        for row in range(1, 101):
+            tracker.add(("a",) if row % 2 else (row,), row)
+            assert all(len(rows) <= 3 for rows in tracker.keys.values())
+
+        assert list(tracker.duplicates()) == [Duplicate(("a",), [1, 3, 5], 50)]
+
+    def test_invalid_max_keys(self):
+        with pytest.raises(ValueError):
+            UniqueKeyTracker(max_keys=0)
+        with pytest.raises(ValueError):
+            UniqueKeyTracker(max_rows_per_key=1)
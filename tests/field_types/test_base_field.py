@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from pydantic import ValidationError
 from typing import Optional, Annotated, get_origin, get_args
 
@@ -148,3 +149,187 @@ class TestAggregatedValidator:
         # Should raise the error from validator2
         with pytest.raises(ValueError, match="Validation error"):
             validator("test")
+
+
+    def test_aggregated_validator_detailed(self):
+        """Test the detailed mode raises every failure, in the order of the validators"""
+        from data_sitter.rules import RuleViolation, RuleViolations
+
+        def validator1(value):
+            raise RuleViolation("first", "First.")
+
+        def validator2(value):
+            return value
+
+        def validator3(value):
+            raise ValueError("Third.")
+
+        validator = aggregated_validator([validator1, validator2, validator3], is_optional=False, detailed=True)
+
+        with pytest.raises(RuleViolations) as e:
+            validator("test")
+        assert [violation.rule_id for violation in e.value.expand()] == ["first", "value_error"]
+        assert e.value.message == "First. Third."
+
+    def test_aggregated_validator_adaptive_order(self):
+        """Test the validators rejecting the most values for their cost are moved first"""
+        from data_sitter.field_types.RuleOrdering import RuleOrdering
+        calls = []
+
+        def never_fails(value):
+            calls.append("never_fails")
+            return value
+
+        def often_fails(value):
+            calls.append("often_fails")
+            if value < 0:
+                raise ValueError("Negative")
+            return value
+
+        ordering = RuleOrdering(2, sample_every=1, reorder_every=10)
+        validator = aggregated_validator([never_fails, often_fails], is_optional=False, ordering=ordering)
+        for value in range(-5, 5):
+            try:
+                validator(value)
+            except ValueError:
+                pass
+        assert ordering.order == [1, 0]
+        assert ordering.rejections == [0, 5]
+
+        ordering.sample_every = 1000
+        calls.clear()
+        with pytest.raises(ValueError, match="Negative"):
+            validator(-1)
+        assert calls == ["often_fails"]
+
+
+class TestValidateColumn:
+    def test_validate_column_without_initialisation(self):
+        """Test validate_column raises NotInitialisedError when validators not set"""
+        from data_sitter.field_types.IntegerField import IntegerField
+        field = IntegerField("test_field")
+        with pytest.raises(NotInitialisedError):
+            field.validate_column([1, 2])
+
+    def test_validate_column_coerces_and_validates(self):
+        """Test the column is coerced once and the first failing rule is reported per row"""
+        from data_sitter.field_types.IntegerField import IntegerField
+        field = IntegerField("test_field")
+        field.validators = [field.validate_positive(), field.validate_max(10)]
+
+        coerced, violations = field.validate_column(["1", None, "abc", -3, 12, 5])
+
+        assert coerced == [1, None, None, -3, 12, 5]
+        assert set(violations) == {2, 3, 4}
+        assert violations[2].rule_id == "int_parsing"
+        assert violations[3].rule_id == "positive"
+        assert violations[4].rule_id == "at_most"
+        assert str(violations[4]) == "Value must not exceed 10."
+
+    def test_validate_column_not_null(self):
+        """Test nulls fail the type check when the field is not optional"""
+        from data_sitter.field_types.StringField import StringField
+        field = StringField("test_field")
+        field.validators = [field.validator_not_null(), field.validate_not_empty()]
+
+        _, violations = field.validate_column(["a", None, ""])
+
+        assert set(violations) == {1, 2}
+        assert violations[2].rule_id == "not_empty"
+
+    def test_validate_column_without_kernel(self):
+        """Test validators without a kernel are run value by value"""
+        field = BaseField("test_field")
+        field.field_type = int
+
+        def validator(value):
+            if value % 2:
+                raise ValueError("Value must be even")
+            return value
+
+        field.validators = [validator]
+        _, violations = field.validate_column([1, 2, 3])
+
+        assert set(violations) == {0, 2}
+        assert violations[0].rule_id == "value_error"
+        assert str(violations[0]) == "Value must be even"
+
+    def test_with_column_kernel(self):
+        """Test the kernel is used to find the failing positions"""
+        from data_sitter.field_types.BaseField import column_violations, with_column_kernel
+        calls = []
+
+        def validator(value):
+            calls.append(value)
+            if value > 1:
+                raise ValueError("Too big")
+            return value
+
+        validator = with_column_kernel(validator, lambda values: [i for i, v in enumerate(values) if v > 1])
+        violations = column_violations(validator, [0, 1, 2, 3])
+
+        assert set(violations) == {2, 3}
+        assert calls == [2, 3]  # The scalar validator only renders the failures
+
+    def test_validate_column_low_cardinality(self):
+        """Test each distinct value is validated once and the verdict is broadcast to its rows"""
+        from data_sitter.field_types.IntegerField import IntegerField
+        field = IntegerField("test_field")
+        calls = []
+
+        def validator(value):
+            calls.append(value)
+            if value < 0:
+                raise ValueError("Negative")
+            return value
+
+        field.validators = [validator]
+        coerced, violations = field.validate_column(["1", "-1", "1", "-1", "1", "1"])
+
+        assert coerced == [1, -1, 1, -1, 1, 1]
+        assert set(violations) == {1, 3}
+        assert violations[1] is violations[3]
+        assert sorted(calls) == [-1, 1]
+
+    def test_validate_column_encoded(self):
+        """Test pre-encoded columns are validated by their distinct values"""
+        from data_sitter.field_types.EncodedColumn import EncodedColumn
+        from data_sitter.field_types.IntegerField import IntegerField
+        field = IntegerField("test_field")
+        field.validators = [field.validate_positive()]
+
+        coerced, violations = field.validate_column(EncodedColumn([5, -5, "x"], [0, 1, 2, 0]))
+
+        assert coerced == [5, -5, None, 5]
+        assert violations[1].rule_id == "positive"
+        assert violations[2].rule_id == "int_parsing"
+        assert set(violations) == {1, 2}
+
+    def test_validate_column_detailed(self):
+        """Test the detailed mode keeps all the failures of each row"""
+        from data_sitter.field_types.IntegerField import IntegerField
+        field = IntegerField("test_field")
+        field.validators = [field.validate_positive(), field.validate_min(10)]
+        field.detailed = True
+
+        coerced, violations = field.validate_column([-1, 5, 20, "x"])
+
+        assert coerced == [-1, 5, 20, None]
+        assert [violation.rule_id for violation in violations[0].expand()] == ["positive", "at_least"]
+        assert [violation.rule_id for violation in violations[1].expand()] == ["at_least"]
+        assert violations[3].rule_id == "int_parsing"
+        assert set(violations) == {0, 1, 3}
+
+    def test_validate_column_adaptive_order(self):
+        """Test the column path records the rules statistics and follows their order"""
+        from data_sitter.field_types.IntegerField import IntegerField
+        field = IntegerField("test_field")
+        field.validators = [field.validate_non_zero(), field.validate_positive()]
+        field.enable_adaptive_order(reorder_every=1)
+
+        ticks = iter(range(1000))  # Every rule costs the same, only their rejections decide the order
+        with patch('data_sitter.field_types.BaseField.perf_counter', lambda: next(ticks)):
+            field.validate_column(list(range(-50, 50)))
+        assert field.ordering.order == [1, 0]
+        _, violations = field.validate_column([0, -1])
+        assert violations[0].rule_id == "positive"
@@ -0,0 +1,67 @@
+import random
+import pytest
+from importlib import import_module
+
+from data_sitter.field_types.decimal_places import (
+    decimal_places, exceeding_positions, fast_has_decimal_places, has_decimal_places
+)
+
+
+def random_floats(count: int, seed: int = 42):
+    """Values of every kind: random, rounded, decimal literals, tiny, huge and special ones."""
+    rng = random.Random(seed)
+    generators = [
+        lambda: rng.uniform(-1e6, 1e6),
+        lambda: round(rng.uniform(-1e4, 1e4), rng.randint(0, 8)),
+        lambda: rng.randint(-10**6, 10**6) / 10 ** rng.randint(0, 9),
+        lambda: float(f"{rng.random():.{rng.randint(1, 17)}g}") * 10 ** rng.randint(-8, 12),
+        lambda: float(rng.randint(-10**5, 10**5)),
+        lambda: rng.choice([
+            0.1, 0.2, 0.3, 1.005, 2.675, 0.1 + 0.2, 1e-6, 1e-7, 1.5e-7, 1200.0, 123.0, 1e16, 1e22, 2.0 ** 53,
+            float("nan"), float("inf"), float("-inf"), -0.0, 0.0, 5e-324,
+        ]),
+    ]
+    return [rng.choice(generators)() for _ in range(count)]
+
+
+class TestDecimalPlaces:
+    def test_decimal_places(self):
+        """Test the places of the normalised Decimal representation"""
+        assert decimal_places(1.25) == 2
+        assert decimal_places(3.0) == 0
+        assert decimal_places(0.1 + 0.2) == 17
+
+    def test_fast_check(self):
+        """Test the scaled integer check and the values it leaves to Decimal"""
+        assert fast_has_decimal_places(1.25, 2) is True
+        assert fast_has_decimal_places(1.25, 1) is False
+        assert fast_has_decimal_places(0.1 + 0.2, 16) is False
+        assert fast_has_decimal_places(123.0, 0) is True
+        assert fast_has_decimal_places(1200.0, 0) is None
+        assert fast_has_decimal_places(1e-7, 3) is None
+        assert fast_has_decimal_places(float("nan"), 3) is None
+        assert fast_has_decimal_places(1e300, 3) is None
+
+    def test_ints(self):
+        """Test ints have no decimal places, whatever their size"""
+        assert fast_has_decimal_places(1200, 0) is True
+        assert fast_has_decimal_places(10 ** 30, 2) is True
+        assert has_decimal_places(123, 0)
+        assert exceeding_positions([1, 2.5, 10 ** 30] * 50, 0) == list(range(1, 150, 3))
+
+    def test_matches_decimal(self):
+        """Test the checks match the Decimal ones on a randomized corpus"""
+        rng = random.Random(7)
+        for value in random_floats(100_000):
+            places = rng.randint(0, 12)
+            assert has_decimal_places(value, places) == (decimal_places(value) <= places), (value, places)
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    @pytest.mark.parametrize("places", [0, 1, 2, 5, 10, 17, 30])
+    def test_exceeding_positions_match_decimal(self, numpy, places, monkeypatch):
+        """Test the column kernel, with and without NumPy, matches Decimal"""
+        if not numpy:
+            monkeypatch.setattr(import_module("data_sitter.field_types.decimal_places"), "np", None)
+        values = random_floats(20_000, seed=places)
+        expected = [i for i, value in enumerate(values) if decimal_places(value) > places]
+        assert exceeding_positions(values, places) == expected
@@ -0,0 +1,51 @@
+from data_sitter.field_types.EncodedColumn import FACTORIZE_CHUNK_SIZE, EncodedColumn, factorize
+
+
+class TestEncodedColumn:
+    def test_factorize(self):
+        """Test a column is split into its distinct values and a code per row"""
+        encoded = factorize(["a", "b", "a", None, "a"])
+
+        assert encoded.uniques == ["a", "b", None]
+        assert encoded.codes == [0, 1, 0, 2, 0]
+        assert len(encoded) == 5
+        assert list(encoded) == ["a", "b", "a", None, "a"]
+        assert encoded[3] is None
+
+    def test_factorize_keeps_types_apart(self):
+        """Test equal values of different types are not merged"""
+        encoded = factorize([1, 1.0, True, 1])
+
+        assert encoded.uniques == [1, 1.0, True]
+        assert [type(value) for value in encoded.uniques] == [int, float, bool]
+        assert encoded.codes == [0, 1, 2, 0]
+
+    def test_factorize_unhashable(self):
+        """Test columns of unhashable values can't be encoded"""
+        assert factorize([[1], [2]]) is None
+
+    def test_factorize_max_uniques(self):
+        """Test encoding stops at the first chunk with too many distinct values"""
+        assert factorize(["a", "b", "a"] * 10, max_uniques=2).uniques == ["a", "b"]
+        assert factorize(["a", "b", "c"], max_uniques=2) is None
+
+        seen = []
+
+        class Value(int):
+            def __hash__(self):
+                seen.append(self)
+                return super().__hash__()
+        assert factorize([Value(i) for i in range(FACTORIZE_CHUNK_SIZE * 4)], max_uniques=10) is None
+        assert len(seen) == FACTORIZE_CHUNK_SIZE
+
+    def test_cardinality_ratio(self):
+        assert factorize(["a", "a", "a", "b"]).cardinality_ratio == 0.5
+        assert EncodedColumn([], []).cardinality_ratio == 1.0
+
+    def test_decode_and_broadcast(self):
+        """Test results per distinct value are broadcast to every row"""
+        encoded = EncodedColumn(["a", "b"], [1, 0, 1, 1])
+
+        assert encoded.decode(["A", "B"]) == ["B", "A", "B", "B"]
+        assert encoded.broadcast({1: "error"}) == {0: "error", 2: "error", 3: "error"}
+        assert encoded.broadcast({}) == {}
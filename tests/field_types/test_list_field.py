@@ -0,0 +1,68 @@
+import pytest
+from typing import List
+
+from data_sitter.field_types.IntegerField import IntegerField
+from data_sitter.field_types.ListField import ListField, ListIntegerField, ListStringField
+from data_sitter.field_types.FieldTypes import FieldTypes
+
+
+class TestListField:
+    def test_element_field(self):
+        """Test the list fields of the element fields"""
+        field = ListIntegerField("test_field")
+        assert isinstance(field, ListField)
+        assert isinstance(field.element, IntegerField)
+        assert field.field_type == List[int]
+        assert field.type_name == FieldTypes.LIST_INT
+        assert ListField("test_field").element is None
+
+    def test_element_rules(self):
+        """Test the element rules are added, except the ones defined by the lists"""
+        rules = [method._rule_metadata.rule for method in vars(ListStringField).values()
+                 if hasattr(method, "_rule_metadata")]
+        assert "Is one of {possible_values:Strings}" in rules
+        assert "Has maximum length {max_len:Integer}" not in rules
+        assert "Is not null" not in rules
+
+    def test_each(self):
+        """Test the element validators check every element, reporting the first failing one"""
+        field = ListIntegerField("test_field")
+        validator = field.each(field.element.validate_positive())
+
+        assert validator([1, 2, 3]) == [1, 2, 3]
+        assert validator([]) == []
+        with pytest.raises(ValueError, match="Item 1: Value must be positive.") as e:
+            validator([1, -2, -3])
+        assert e.value.rule_id == "positive"
+        assert e.value.params == {"index": 1}
+
+    def test_each_uses_column_kernel(self):
+        """Test the elements are checked by the kernel of the rule, not one call per element"""
+        field = ListIntegerField("test_field")
+        element_validator = field.element.validate_min(0)
+        calls = []
+
+        def kernel(values):
+            calls.append(len(values))
+            return [i for i, value in enumerate(values) if value < 0]
+        element_validator.column_kernel = kernel
+
+        field.each(element_validator)(list(range(100)))
+        assert calls == [100]
+
+    def test_length_validators(self):
+        """Test the length rules apply to the list"""
+        field = ListField("test_field")
+        field.validate_not_empty()([1])
+        field.validate_max_length(2)([1, 2])
+        field.validate_min_length(2)([1, 2])
+        field.validate_length_between(1, 3)([1, 2])
+
+        with pytest.raises(ValueError, match="List cannot be empty."):
+            field.validate_not_empty()([])
+        with pytest.raises(ValueError, match="Length must not exceed 2 items."):
+            field.validate_max_length(2)([1, 2, 3])
+        with pytest.raises(ValueError, match="Length must be at least 2 items."):
+            field.validate_min_length(2)([1])
+        with pytest.raises(ValueError, match="Length must be between 1 and 3 items."):
+            field.validate_length_between(1, 3)([1, 2, 3])
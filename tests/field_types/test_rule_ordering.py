@@ -0,0 +1,27 @@
+from math import inf
+
+from data_sitter.field_types.RuleOrdering import RuleOrdering
+
+
+class TestRuleOrdering:
+    def test_initial_order(self):
+        """Test the rules start in the contract order"""
+        ordering = RuleOrdering(3)
+        assert ordering.order == [0, 1, 2]
+        assert ordering.rank(0) == inf
+
+    def test_reorder_by_cost_per_rejection(self):
+        """Test cheap rules rejecting many values are moved first"""
+        ordering = RuleOrdering(3, reorder_every=30)
+        ordering.record(0, cost=1.0, checks=10, rejections=1)  # Expensive, rarely rejects
+        ordering.record(1, cost=0.1, checks=10, rejections=0)  # Never rejects
+        assert ordering.order == [0, 1, 2]
+        ordering.record(2, cost=0.1, checks=10, rejections=5)  # Cheap, often rejects
+
+        assert ordering.order == [2, 0, 1]
+        assert ordering.rank(2) < ordering.rank(0) < ordering.rank(1)
+
+    def test_should_sample(self):
+        """Test one value of every `sample_every` is sampled, the first one included"""
+        ordering = RuleOrdering(1, sample_every=4)
+        assert [ordering.should_sample() for _ in range(8)] == [True, False, False, False] * 2
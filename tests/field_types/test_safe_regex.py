@@ -0,0 +1,94 @@
+import re
+import time
+import threading
+import pytest
+
+from data_sitter.field_types.safe_regex import (
+    RegexTimeout, UnsafeRegexError, UnsafeRegexWarning, compile_pattern, has_nested_quantifier, time_budget
+)
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+
+CATASTROPHIC_INPUT = "a" * 64 + "!"
+
+
+class TestNestedQuantifiers:
+    @pytest.mark.parametrize("pattern", [
+        r"^(a+)+$", r"(a*)*", r"(\w+\s?)+$", r"(a|b*)*", r"((ab)+c?)*", r"(?=(a+)+)", r"(a{1,3})+$",
+        r"(\w+\w)+", r"(x+x+)+y", r"(.*a){8}$", r"^(.*a){6}b", r"^(\w+\s?){2,5}$",
+    ])
+    def test_unsafe(self, pattern):
+        """Test repeated groups with variable repetitions not delimited are found"""
+        assert has_nested_quantifier(sre_parse.parse(pattern))
+
+    @pytest.mark.parametrize("pattern", [r"^(a|a)*$", r"(a|aa)+", r"^(\d+|\d+\.)+$"])
+    def test_overlapping_alternatives(self, pattern):
+        """Test repeated alternatives that can match the same text are found"""
+        assert has_nested_quantifier(sre_parse.parse(pattern))
+
+    @pytest.mark.parametrize("pattern", [
+        r"^[\w\.-]+@[\w\.-]+\.\w+$", r"^\d{3}-\d{4}$", r"(ab)+", r"(a{2})+", r"(a?)", r"(a+)?", r"(?>a+)+",
+        r"(a++)+", r"^(https?|ftp)://\S+$", r"(?:x(a{1,3}))+", r"(a|ab)*", r"(.|\n)*", r"(a{2}){3}", r"(.*a){1}",
+    ])
+    def test_safe(self, pattern):
+        """Test patterns without ambiguous repetitions, possessive or atomic ones included"""
+        assert not has_nested_quantifier(sre_parse.parse(pattern))
+
+    @pytest.mark.parametrize("pattern", [
+        r"^(\d{1,3}\.){3}\d{1,3}$", r"^[\w.+-]+@([\w-]+\.)+[a-z]{2,}$", r"^(ab?)+$", r"^(\d+,)*\d+$",
+        r"^([A-Z][a-z]*\s)*$", r"(xa+)+",
+    ])
+    def test_delimited(self, pattern):
+        """Test variable repetitions delimited by a character they can't match are safe, and fast to fail"""
+        assert not has_nested_quantifier(sre_parse.parse(pattern))
+        compiled = re.compile(pattern)
+        start = time.perf_counter()
+        for char in "a1.x A,":
+            compiled.match(char * 5000 + "!")
+        assert time.perf_counter() - start < 1
+
+    def test_compile_pattern(self):
+        """Test patterns are compiled once and unsafe ones are rejected"""
+        assert compile_pattern(r"^\d+$") is compile_pattern(r"^\d+$")
+        assert isinstance(compile_pattern(r"^\d+$"), re.Pattern)
+        with pytest.raises(UnsafeRegexError, match="nested quantifiers"):
+            compile_pattern(r"^(a+)+$")
+
+    def test_allow_unsafe(self):
+        """Test unsafe patterns only get a warning when they are allowed"""
+        for _ in range(2):  # Also once the pattern is cached
+            with pytest.warns(UnsafeRegexWarning, match="regex timeout"):
+                assert compile_pattern(r"^(\w+\s?)+$", allow_unsafe=True).match("two words")
+
+
+class TestTimeBudget:
+    def test_timeout(self):
+        """Test a catastrophic match is interrupted once its budget is spent"""
+        pattern = re.compile(r"^(a+)+$")
+        start = time.perf_counter()
+        with pytest.raises(RegexTimeout):
+            with time_budget(0.05):
+                pattern.match(CATASTROPHIC_INPUT)
+        assert time.perf_counter() - start < 5
+
+    def test_within_budget(self):
+        """Test fast matches are not affected and the timer is cleared"""
+        with time_budget(0.05):
+            assert re.match(r"^a+$", "aaa")
+        time.sleep(0.1)  # The timer would fire here if it was not cleared
+
+    def test_no_budget_out_of_main_thread(self):
+        """Test budgets are not enforced from other threads, where signals can't be handled"""
+        results = []
+
+        def run():
+            with time_budget(0.001):
+                results.append(re.match(r"^a+$", "aaa") is not None)
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        assert results == [True]
@@ -221,4 +221,88 @@ class TestStringField:
             validator("1test")
 
         with pytest.raises(ValueError, match="Value must not contain any digits"):
-            validator("test1") 
\ No newline at end of file
+            validator("test1") 
+
+    def test_validate_no_digits_unicode(self):
+        """Test digits outside ASCII are found too, in values and columns"""
+        validator = StringField("test_field").validate_no_digits()
+        for value in ["x²", "٣", "abc"]:
+            expected = [0] if value != "abc" else []
+            assert validator.column_kernel([value, "abc"]) == expected
+        with pytest.raises(ValueError, match="Value must not contain any digits"):
+            validator("x²")
+
+
+STRING_CORPUS = [
+    "", "a", "A", "abc", "ABC", "Abc", "abc1", "ABC1", "x²", "٣", "ÉCOLE", "école", "ß", "john@example.com",
+    "john.doe@mail.example.org", "john@example", "@example.com", "john@example.com\n", "john@exam ple.com",
+    "http://example.com", "https://example.com/path?q=1", "ftp://example.com", "http:/example.com",
+    "http://example.com\n", "http://exa mple.com", "prefix_value", "value_suffix", "123", " ",
+]
+
+
+class TestStringKernels:
+    @pytest.mark.parametrize("rule, params", [
+        ("validate_not_empty", {}),
+        ("validate_starts_with", {"prefix": "prefix"}),
+        ("validate_ends_with", {"suffix": "suffix"}),
+        ("validate_in", {"possible_values": ["a", "ABC"], "negative": False}),
+        ("validate_in", {"possible_values": ["a", "ABC"], "negative": True}),
+        ("validate_length_between", {"min_val": 1, "max_val": 5}),
+        ("validate_max_length", {"max_len": 3}),
+        ("validate_min_length", {"min_len": 3}),
+        ("validate_uppercase", {}),
+        ("validate_lowercase", {}),
+        ("validate_email", {}),
+        ("validate_url", {}),
+        ("validate_no_digits", {}),
+    ])
+    def test_kernel_matches_validator(self, rule, params):
+        """Test the column kernels fail the same values as the validators"""
+        validator = getattr(StringField("test_field"), rule)(**params)
+        expected = []
+        for position, value in enumerate(STRING_CORPUS):
+            try:
+                validator(value)
+            except ValueError:
+                expected.append(position)
+        assert list(validator.column_kernel(STRING_CORPUS)) == expected
+        ascii_corpus = [value for value in STRING_CORPUS if value.isascii()]
+        assert list(validator.column_kernel(ascii_corpus)) == [
+            position for position, value in enumerate(ascii_corpus) if STRING_CORPUS.index(value) in expected
+        ]
+
+
+class TestRegexRules:
+    def test_unsafe_pattern_rejected(self):
+        """Test patterns with nested quantifiers are rejected when the rule is set"""
+        from data_sitter.field_types.safe_regex import UnsafeRegexError
+        with pytest.raises(UnsafeRegexError):
+            StringField("test_field").validate_matches_regex(r"^(\w+\s?)+$")
+
+    def test_regex_timeout(self):
+        """Test the values running out of the time budget fail the rule, one by one in columns"""
+        from data_sitter.field_types.BaseField import column_violations
+        from data_sitter.field_types.safe_regex import UnsafeRegexWarning
+        field = StringField("test_field")
+        field.regex_timeout = 0.05
+        with pytest.warns(UnsafeRegexWarning):  # Only bounded by the budget
+            validator = field.validate_matches_regex(r"^(a|aa)*$")
+
+        validator("aaaa")
+        with pytest.raises(ValueError, match="does not match the required pattern"):
+            validator("a" * 64 + "!")
+        assert list(column_violations(validator, ["aaaa", "a" * 64 + "!", "aa"])) == [1]
+
+    def test_alarm_handler_installed_once_per_column(self):
+        """Test the budgets of the values of a column share the signal handler installed for it"""
+        import signal
+        from unittest.mock import patch
+        field = StringField("test_field")
+        field.regex_timeout = 0.05
+        field.validators = [field.validate_matches_regex(r"^\d+$")]
+
+        with patch.object(signal, "signal", wraps=signal.signal) as install:
+            _, violations = field.validate_column([f"x{i}" for i in range(50)])
+        assert len(violations) == 50
+        assert install.call_count == 2  # Installed and restored
@@ -0,0 +1,130 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from importlib import import_module
+from unittest.mock import patch
+
+from data_sitter.field_types.DateField import DateField
+from data_sitter.field_types.DatetimeField import DatetimeField
+from data_sitter.field_types.TemporalField import comparable, iso_parser
+
+
+class TestIsoParser:
+    def test_parse(self):
+        """Test ISO strings are parsed and other values are left as they are"""
+        parser = iso_parser(date.fromisoformat)
+        assert parser("2024-02-29") == date(2024, 2, 29)
+        assert parser(" 2024-02-29 ") == date(2024, 2, 29)
+        assert parser("29/02/2024") == "29/02/2024"
+        assert parser(None) is None
+        assert parser(date(2024, 1, 1)) == date(2024, 1, 1)
+
+    def test_parsed_values_cached(self):
+        """Test repeated timestamps are parsed once"""
+        calls = []
+
+        def parse(text):
+            calls.append(text)
+            return datetime.fromisoformat(text)
+
+        parser = iso_parser(parse)
+        for _ in range(3):
+            parser("2024-01-01T10:00:00")
+        assert calls == ["2024-01-01T10:00:00"]
+
+    def test_comparable(self):
+        """Test aware datetimes are compared as naive UTC"""
+        aware = datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+        assert comparable(aware) == datetime(2024, 1, 1, 10)
+        assert comparable(datetime(2024, 1, 1)) == datetime(2024, 1, 1)
+        assert comparable(date(2024, 1, 1)) == date(2024, 1, 1)
+
+
+class TestDateField:
+    def test_after_before(self):
+        """Test the bounds are exclusive"""
+        field = DateField("test_field")
+        field.validate_after("2024-01-01")(date(2024, 1, 2))
+        field.validate_before("2024-01-01")(date(2023, 12, 31))
+
+        with pytest.raises(ValueError, match="Value must be after 2024-01-01."):
+            field.validate_after("2024-01-01")(date(2024, 1, 1))
+        with pytest.raises(ValueError, match="Value must be before 2024-01-01."):
+            field.validate_before("2024-01-01")(date(2024, 1, 1))
+
+    def test_between(self):
+        """Test the between rule"""
+        validator = DateField("test_field").validate_between("2024-01-01", "2024-12-31")
+        validator(date(2024, 6, 1))
+        with pytest.raises(ValueError, match="Value must be between 2024-01-01 and 2024-12-31."):
+            validator(date(2025, 1, 1))
+
+    def test_not_in_future(self):
+        """Test today in UTC is not in the future, as for the datetimes"""
+        today = datetime.now(timezone.utc).date()
+        validator = DateField("test_field").validate_not_in_future()
+        validator(today)
+        with pytest.raises(ValueError, match="Value cannot be in the future."):
+            validator(today + timedelta(days=1))
+
+    def test_now_is_utc(self):
+        """Test today is the UTC date whatever the local time zone"""
+        class LateEvening(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2024, 1, 1, 23, 30, tzinfo=timezone(timedelta(hours=-5))).astimezone(tz)
+
+        with patch("data_sitter.field_types.DateField.datetime", LateEvening):
+            assert DateField.now() == date(2024, 1, 2)
+
+    def test_invalid_bound(self):
+        """Test bounds that aren't ISO dates are rejected when the rule is set"""
+        with pytest.raises(ValueError):
+            DateField("test_field").validate_after("yesterday")
+
+
+class TestDatetimeField:
+    def test_aware_and_naive(self):
+        """Test aware and naive datetimes are compared, naive ones taken as UTC"""
+        validator = DatetimeField("test_field").validate_before("2024-01-01T12:00:00+00:00")
+        validator(datetime(2024, 1, 1, 11))
+        validator(datetime(2024, 1, 1, 13, tzinfo=timezone(timedelta(hours=2))))
+        with pytest.raises(ValueError):
+            validator(datetime(2024, 1, 1, 12, 30))
+
+    def test_not_in_future(self):
+        """Test the not in the future rule"""
+        validator = DatetimeField("test_field").validate_not_in_future()
+        validator(datetime.now())
+        validator(datetime.now(timezone.utc))
+        with pytest.raises(ValueError, match="Value cannot be in the future."):
+            validator(datetime.now(timezone.utc) + timedelta(hours=1))
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_kernels(self, numpy, monkeypatch):
+        """Test the kernels find the same failures as the validators, with and without NumPy"""
+        if not numpy:
+            monkeypatch.setattr(import_module("data_sitter.field_types.TemporalField"), "np", None)
+        field = DatetimeField("test_field")
+        start = datetime(2024, 1, 1)
+        values = [start + timedelta(hours=hours) for hours in range(-100, 100)]
+        values += [value.replace(tzinfo=timezone(timedelta(hours=3))) for value in values]
+        validators = [
+            field.validate_after("2024-01-01T00:00:00"),
+            field.validate_before("2024-01-02T00:00:00+01:00"),
+            field.validate_between("2023-12-31", "2024-01-03"),
+            field.validate_not_in_future(),
+        ]
+        for validator in validators:
+            expected = []
+            for position, value in enumerate(values):
+                try:
+                    validator(value)
+                except ValueError:
+                    expected.append(position)
+            assert validator.column_kernel(values) == expected
+
+    def test_date_kernel(self):
+        """Test the date kernels compare days"""
+        validator = DateField("test_field").validate_after("2024-01-01")
+        values = [date(2024, 1, 1) + timedelta(days=days) for days in range(-50, 50)]
+        assert validator.column_kernel(values) == list(range(51))
@@ -0,0 +1,97 @@
+import pytest
+from data_sitter.field_types.BaseField import aggregated_validator
+from data_sitter.field_types.ValidationCache import MISSING, ValidationCache
+
+
+class TestValidationCache:
+    def test_get_and_put(self):
+        """Test outcomes are stored per value"""
+        cache = ValidationCache()
+        error = ValueError("bad")
+
+        assert cache.get("a") is MISSING
+        cache.put("a", None)
+        cache.put("b", error)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is error
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_keys_are_typed(self):
+        """Test equal values of different types are cached separately"""
+        cache = ValidationCache()
+        cache.put(1, None)
+        assert cache.get(1.0) is MISSING
+        assert cache.get(True) is MISSING
+
+    def test_lru_eviction(self):
+        """Test the least recently used value is evicted"""
+        cache = ValidationCache(maxsize=2)
+        cache.put("a", None)
+        cache.put("b", None)
+        cache.get("a")
+        cache.put("c", None)
+
+        assert len(cache) == 2
+        assert cache.get("b") is MISSING
+        assert cache.get("a") is None
+
+    def test_unhashable_values_are_not_cached(self):
+        """Test unhashable values are skipped"""
+        cache = ValidationCache()
+        cache.put(["a"], None)
+        assert cache.get(["a"]) is MISSING
+        assert len(cache) == 0
+
+    def test_disables_on_low_hit_rate(self):
+        """Test the cache disables itself after the warmup when it barely hits"""
+        cache = ValidationCache(warmup=100, min_hit_rate=0.5)
+        for value in range(100):
+            cache.get(value)
+            cache.put(value, None)
+
+        assert cache.enabled is False
+        assert len(cache) == 0
+
+    def test_stays_enabled_on_high_hit_rate(self):
+        """Test the cache stays enabled on low-cardinality values"""
+        cache = ValidationCache(warmup=100, min_hit_rate=0.5)
+        for value in range(200):
+            if cache.get(value % 5) is MISSING:
+                cache.put(value % 5, None)
+
+        assert cache.enabled is True
+        assert cache.hit_rate > 0.9
+
+
+class TestCachedAggregatedValidator:
+    def test_cached_outcomes(self):
+        """Test the validators only run once per distinct value"""
+        calls = []
+
+        def validator_func(value):
+            calls.append(value)
+            if value == "bad":
+                raise ValueError("Value is bad")
+            return value
+
+        validator = aggregated_validator([validator_func], is_optional=True, cache=ValidationCache())
+
+        assert validator("good") == "good"
+        assert validator("good") == "good"
+        assert validator(None) is None
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Value is bad"):
+                validator("bad")
+        assert calls == ["good", "bad"]
+
+    def test_disabled_cache_runs_validators(self):
+        """Test a disabled cache falls back to running the validators"""
+        calls = []
+        cache = ValidationCache()
+        cache.disable()
+        validator = aggregated_validator([calls.append], is_optional=False, cache=cache)
+
+        validator("a")
+        validator("a")
+        assert calls == ["a", "a"]
@@ -0,0 +1,114 @@
+import pytest
+
+from data_sitter import Contract
+from data_sitter.field_types.EncodedColumn import EncodedColumn
+from data_sitter.io.arrow import encode_column, is_columnar_file, iter_record_batches, validate_arrow_file
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.ipc as ipc  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+
+
+@pytest.fixture
+def table():
+    return pa.table({
+        "name": ["John Doe", "Jo", "Jane Smith", None, "Jack Black"],
+        "age": [25, 30, 12, 40, 50],
+        "unused": ["a", "b", "c", "d", "e"],
+    })
+
+
+@pytest.fixture
+def contract():
+    return Contract.from_dict({
+        "name": "TestContract",
+        "fields": [
+            {"name": "name", "type": "String", "rules": ["Is not null", "Has minimum length 3"]},
+            {"name": "age", "type": "Integer", "rules": ["Is at least 18"]},
+        ],
+    })
+
+
+@pytest.fixture
+def parquet_file(tmp_path, table):
+    file_path = tmp_path / "data.parquet"
+    pq.write_table(table, file_path)
+    return file_path
+
+
+@pytest.fixture
+def ipc_file(tmp_path, table):
+    file_path = tmp_path / "data.arrow"
+    with ipc.new_file(file_path, table.schema) as writer:
+        writer.write_table(table)
+    return file_path
+
+
+@pytest.fixture
+def ipc_stream(tmp_path, table):
+    file_path = tmp_path / "data.arrows"
+    with ipc.new_stream(file_path, table.schema) as writer:
+        writer.write_table(table)
+    return file_path
+
+
+class TestArrow:
+    def test_is_columnar_file(self):
+        """Test Parquet and Arrow files are recognised by their suffix"""
+        assert is_columnar_file("data.parquet")
+        assert is_columnar_file("data.arrow")
+        assert not is_columnar_file("data.csv")
+
+    @pytest.mark.parametrize("source", ["parquet_file", "ipc_file", "ipc_stream"])
+    def test_iter_record_batches_projection(self, request, source):
+        """Test only the requested columns are read, in batches"""
+        file_path = request.getfixturevalue(source)
+
+        batches = list(iter_record_batches(file_path, ["name", "age", "missing"], batch_size=2))
+
+        assert all(batch.schema.names == ["name", "age"] for batch in batches)
+        assert sum(batch.num_rows for batch in batches) == 5
+
+    def test_parquet_batch_size(self, parquet_file):
+        """Test Parquet files are read one batch of the given size at a time"""
+        batches = list(iter_record_batches(parquet_file, ["age"], batch_size=2))
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+
+    @pytest.mark.parametrize("source", ["parquet_file", "ipc_file"])
+    def test_validate_arrow_file(self, request, contract, source):
+        """Test the batches are validated column by column"""
+        file_path = request.getfixturevalue(source)
+
+        batch_validations = list(validate_arrow_file(contract, file_path, batch_size=2))
+        errors = {}
+        offset = 0
+        for batch_validation in batch_validations:
+            errors.update({offset + row: error for row, error in batch_validation.errors.items()})
+            offset += len(batch_validation)
+
+        assert offset == 5
+        assert errors == {
+            1: {"name": ["Length must be at least 3 characters."]},
+            2: {"age": ["Value must be at least 18."]},
+            3: {"name": ["Input should be a valid string"]},
+        }
+
+    def test_encode_column_low_cardinality(self):
+        """Test low-cardinality columns are dictionary-encoded, nulls included"""
+        encoded = encode_column(pa.array(["a", "b", "a", None, "a", "a"]))
+
+        assert isinstance(encoded, EncodedColumn)
+        assert encoded.uniques == ["a", "b", None]
+        assert encoded.codes == [0, 1, 0, 2, 0, 0]
+
+    def test_encode_column_dictionary(self):
+        """Test dictionary arrays are kept encoded whatever their cardinality"""
+        encoded = encode_column(pa.array(["x", "y"]).dictionary_encode())
+
+        assert isinstance(encoded, EncodedColumn)
+        assert list(encoded) == ["x", "y"]
+
+    def test_encode_column_high_cardinality(self):
+        """Test high-cardinality columns are converted to plain lists"""
+        assert encode_column(pa.array([1, 2, 3])) == [1, 2, 3]
+        assert encode_column(pa.array([[1], [1]])) == [[1], [1]]
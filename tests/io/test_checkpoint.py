@@ -0,0 +1,100 @@
+import json
+import pytest
+
+from data_sitter import Contract
+from data_sitter.io.checkpoint import Checkpoint, CheckpointMismatch, file_fingerprint
+from data_sitter.rules import RuleViolation
+from data_sitter.Validation import Validation
+
+
+@pytest.fixture
+def contract():
+    return Contract.from_dict({
+        "name": "TestContract",
+        "fields": [{"name": "age", "type": "Integer", "rules": ["Is at least 18"]}],
+    })
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    file_path = tmp_path / "data.csv"
+    file_path.write_text("age\n20\n10\n")
+    return file_path
+
+
+class TestCheckpoint:
+    def test_file_fingerprint(self, data_file):
+        """Test the fingerprint changes with the file content"""
+        fingerprint = file_fingerprint(data_file)
+        assert fingerprint["size"] == data_file.stat().st_size
+
+        data_file.write_text("age\n20\n11\n")
+        assert file_fingerprint(data_file)["head_sha256"] != fingerprint["head_sha256"]
+
+    def test_open_new(self, tmp_path, contract, data_file):
+        """Test a new checkpoint starts from the first row"""
+        checkpoint = Checkpoint.open(tmp_path / "checkpoint.json", contract, data_file)
+
+        assert checkpoint.rows == 0
+        assert checkpoint.outputs == {}
+        assert checkpoint.contract_hash == contract.fingerprint
+
+    def test_save_and_resume(self, tmp_path, contract, data_file):
+        """Test the progress and partial report are restored"""
+        path = tmp_path / "checkpoint.json"
+        checkpoint = Checkpoint.open(path, contract, data_file)
+        checkpoint.report.add(Validation(item={}))
+        checkpoint.report.add(Validation(item={}, violations={"age": [RuleViolation("at_least", "")]}))
+        checkpoint.save({"output": 12})
+
+        resumed = Checkpoint.open(path, contract, data_file)
+
+        assert resumed.rows == 2
+        assert resumed.outputs == {"output": 12}
+        assert resumed.report.to_dict() == checkpoint.report.to_dict()
+        assert json.loads(path.read_text())["rows"] == 2
+        assert not (tmp_path / "checkpoint.json.tmp").exists()
+
+    def test_contract_mismatch(self, tmp_path, contract, data_file):
+        """Test a checkpoint can't be resumed with another contract"""
+        path = tmp_path / "checkpoint.json"
+        Checkpoint.open(path, contract, data_file).save()
+        other = Contract.from_dict({
+            "name": "TestContract",
+            "fields": [{"name": "age", "type": "Integer", "rules": ["Is at least 21"]}],
+        })
+
+        with pytest.raises(CheckpointMismatch, match="another contract"):
+            Checkpoint.open(path, other, data_file)
+
+    def test_values_file_mismatch(self, tmp_path, data_file):
+        """Test a checkpoint can't be resumed once a values file of the contract changed"""
+        path = tmp_path / "checkpoint.json"
+        (tmp_path / "codes.txt").write_text("20\n")
+        contract_dict = {
+            "name": "TestContract",
+            "fields": [{"name": "age", "type": "String", "rules": ["Is one of $values.codes"]}],
+            "values": {"codes": {"file": "codes.txt"}},
+        }
+        Checkpoint.open(path, Contract.from_dict(contract_dict, values_dir=tmp_path), data_file).save()
+        (tmp_path / "codes.txt").write_text("20\n10\n")
+
+        with pytest.raises(CheckpointMismatch, match="another contract"):
+            Checkpoint.open(path, Contract.from_dict(contract_dict, values_dir=tmp_path), data_file)
+
+    def test_file_mismatch(self, tmp_path, contract, data_file):
+        """Test a checkpoint can't be resumed once the file changed"""
+        path = tmp_path / "checkpoint.json"
+        Checkpoint.open(path, contract, data_file).save()
+        data_file.write_text("age\n20\n10\n30\n")
+
+        with pytest.raises(CheckpointMismatch, match="another version"):
+            Checkpoint.open(path, contract, data_file)
+
+    def test_remove(self, tmp_path, contract, data_file):
+        """Test removing the checkpoint file"""
+        path = tmp_path / "checkpoint.json"
+        checkpoint = Checkpoint.open(path, contract, data_file)
+        checkpoint.save()
+        checkpoint.remove()
+        assert not path.exists()
@@ -0,0 +1,117 @@
+import gc
+import bz2
+import gzip
+import json
+import lzma
+import pytest
+import warnings
+from data_sitter.io.readers import detect_compression, get_data_suffix, open_text, read_records
+
+
+COMPRESSORS = {".gz": gzip.compress, ".bz2": bz2.compress, ".xz": lzma.compress}
+
+
+class TestReadRecords:
+    def test_read_csv(self, tmp_path):
+        """Test CSV records are streamed with stripped keys and values"""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text(" name , age\n John , 25\nJane,30\n")
+
+        records = read_records(file_path)
+
+        assert next(records) == {"name": "John", "age": "25"}
+        assert list(records) == [{"name": "Jane", "age": "30"}]
+
+    def test_read_json_list(self, tmp_path):
+        """Test a JSON array is read as a list of records"""
+        file_path = tmp_path / "data.json"
+        file_path.write_text(json.dumps([{"a": 1}, {"a": 2}]))
+
+        assert list(read_records(file_path)) == [{"a": 1}, {"a": 2}]
+
+    def test_read_json_object(self, tmp_path):
+        """Test a JSON object is read as a single record"""
+        file_path = tmp_path / "data.json"
+        file_path.write_text(json.dumps({"a": 1}))
+
+        assert list(read_records(file_path)) == [{"a": 1}]
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".ndjson"])
+    def test_read_ndjson(self, tmp_path, suffix):
+        """Test NDJSON files are read line by line, skipping blank lines"""
+        file_path = tmp_path / f"data{suffix}"
+        file_path.write_text('{"a": 1}\n\n{"a": 2}\n')
+
+        assert list(read_records(file_path)) == [{"a": 1}, {"a": 2}]
+
+    def test_unsupported_type(self, tmp_path):
+        """Test unsupported extensions raise NotImplementedError"""
+        with pytest.raises(NotImplementedError):
+            read_records(tmp_path / "data.txt")
+
+
+class TestCompressedInputs:
+    @pytest.mark.parametrize("suffix,compression", [(".gz", "gzip"), (".bz2", "bz2"), (".xz", "xz")])
+    def test_detect_compression(self, tmp_path, suffix, compression):
+        """Test compression is detected from the magic bytes"""
+        file_path = tmp_path / f"data.csv{suffix}"
+        file_path.write_bytes(COMPRESSORS[suffix](b"a,b\n1,2\n"))
+
+        assert detect_compression(file_path) == compression
+
+    def test_detect_no_compression(self, tmp_path):
+        """Test plain files are not detected as compressed"""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("a,b\n")
+
+        assert detect_compression(file_path) is None
+
+    def test_get_data_suffix(self):
+        """Test the compression suffix is ignored to pick the data format"""
+        assert get_data_suffix("data.csv.gz") == ".csv"
+        assert get_data_suffix("data.jsonl.xz") == ".jsonl"
+        assert get_data_suffix("data.json") == ".json"
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+    def test_read_compressed_csv(self, tmp_path, suffix):
+        """Test compressed CSV files are streamed without decompressing to disk"""
+        file_path = tmp_path / f"data.csv{suffix}"
+        file_path.write_bytes(COMPRESSORS[suffix]("name,city\nJohn,Málaga\n".encode("utf8")))
+
+        assert list(read_records(file_path, buffer_size=16)) == [{"name": "John", "city": "Málaga"}]
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+    def test_read_compressed_ndjson(self, tmp_path, suffix):
+        """Test compressed NDJSON files are streamed line by line"""
+        file_path = tmp_path / f"data.jsonl{suffix}"
+        file_path.write_bytes(COMPRESSORS[suffix](b'{"a": 1}\n{"a": 2}\n'))
+
+        assert list(read_records(file_path)) == [{"a": 1}, {"a": 2}]
+
+    def test_read_compressed_json(self, tmp_path):
+        """Test compressed JSON documents are parsed from the stream"""
+        file_path = tmp_path / "data.json.gz"
+        file_path.write_bytes(gzip.compress(json.dumps([{"a": 1}]).encode()))
+
+        assert list(read_records(file_path)) == [{"a": 1}]
+
+    def test_open_text_detects_by_content(self, tmp_path):
+        """Test compressed files are detected even without a compression suffix"""
+        file_path = tmp_path / "data.csv"
+        file_path.write_bytes(gzip.compress(b"a,b\n"))
+
+        with open_text(file_path) as f:
+            assert f.read() == "a,b\n"
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+    def test_open_text_closes_compressed_file(self, tmp_path, suffix):
+        """Test closing a decompressed stream closes the file it reads"""
+        file_path = tmp_path / f"data.csv{suffix}"
+        file_path.write_bytes(COMPRESSORS[suffix](b"a,b\n"))
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with open_text(file_path) as f:
+                assert f.read() == "a,b\n"
+            gc.collect()
+        assert not [warning for warning in caught if issubclass(warning.category, ResourceWarning)]
@@ -0,0 +1,122 @@
+import gzip
+import json
+import random
+
+import pytest
+from data_sitter.io.sampling import (
+    estimate_line_count, is_seekable_file, reservoir_sample, sample_lines, sample_records
+)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "data.csv"
+    rows = "".join(f"{i},name_{i}\n" for i in range(5000))
+    file_path.write_text(f"id,name\n{rows}")
+    return file_path
+
+
+@pytest.fixture
+def ndjson_file(tmp_path):
+    file_path = tmp_path / "data.jsonl"
+    file_path.write_text("".join(json.dumps({"id": i}) + "\n" for i in range(5000)))
+    return file_path
+
+
+class TestSampling:
+    def test_reservoir_sample(self):
+        """Test the reservoir keeps the requested number of distinct records"""
+        sample = reservoir_sample(({"id": i} for i in range(1000)), 10, random.Random(1))
+        assert len(sample) == 10
+        assert len({record["id"] for record in sample}) == 10
+
+    def test_reservoir_sample_short_stream(self):
+        """Test streams shorter than the sample are fully kept"""
+        assert reservoir_sample(iter([{"id": 1}]), 10, random.Random(1)) == [{"id": 1}]
+
+    def test_is_seekable_file(self, csv_file, tmp_path):
+        """Test only uncompressed line based files are sampled by seeking"""
+        compressed = tmp_path / "data.csv.gz"
+        compressed.write_bytes(gzip.compress(b"id\n1\n"))
+
+        assert is_seekable_file(csv_file)
+        assert not is_seekable_file(compressed)
+
+    def test_estimate_line_count(self, csv_file):
+        """Test the line count is estimated from the first lines"""
+        assert estimate_line_count(csv_file, has_header=True) == pytest.approx(5000, rel=0.2)
+
+    def test_sample_lines_never_returns_header(self, csv_file):
+        """Test sampled lines are complete, distinct data lines"""
+        header, lines = sample_lines(csv_file, 200, random.Random(3), has_header=True)
+
+        assert header == b"id,name\n"
+        assert len(lines) == 200
+        assert len(set(lines)) == 200
+        for line in lines:
+            row_id, name = line.decode().strip().split(",")
+            assert name == f"name_{row_id}"
+
+    def test_sample_lines_uniform(self, tmp_path):
+        """Test long lines are not more likely to be picked than short ones"""
+        file_path = tmp_path / "data.jsonl"
+        file_path.write_text("".join(
+            json.dumps({"id": i, "text": "x" * (200 if i % 2 else 0)}) + "\n" for i in range(5000)
+        ))
+        min_length = len(json.dumps({"id": 0, "text": ""})) + 1
+
+        _, lines = sample_lines(file_path, 400, random.Random(5), has_header=False, min_length=min_length)
+
+        long_lines = sum(json.loads(line)["id"] % 2 for line in lines)
+        assert len(lines) == 400
+        assert long_lines / len(lines) == pytest.approx(0.5, abs=0.1)
+
+    @pytest.mark.parametrize("first_row", [0, 4000])
+    def test_sample_csv_multiline_fields(self, tmp_path, first_row):
+        """Test CSV files with quoted fields spanning lines are streamed, also when they come after the probe"""
+        file_path = tmp_path / "data.csv"
+        rows = [
+            f'{i},"name_{i}\nsecond line"\n' if i >= first_row and i % 10 == 0 else f"{i},name_{i}\n"
+            for i in range(5000)
+        ]
+        file_path.write_text("id,name\n" + "".join(rows))
+
+        records = sample_records(file_path, size=300, seed=1)
+
+        assert len(records) == 300
+        assert all(record["name"].startswith(f"name_{record['id']}") for record in records)
+
+    def test_sample_csv_records(self, csv_file):
+        """Test CSV records are sampled and parsed with the header"""
+        records = sample_records(csv_file, size=50, seed=7)
+
+        assert len(records) == 50
+        assert all(record["name"] == f"name_{record['id']}" for record in records)
+        assert sample_records(csv_file, size=50, seed=7) == records
+
+    def test_sample_ndjson_fraction(self, ndjson_file):
+        """Test a fraction of the NDJSON records is sampled"""
+        records = sample_records(ndjson_file, fraction=0.01, seed=7)
+        assert len(records) == pytest.approx(50, abs=5)
+
+    def test_sample_compressed_file(self, tmp_path):
+        """Test compressed files fall back to a reservoir sample"""
+        file_path = tmp_path / "data.jsonl.gz"
+        file_path.write_bytes(gzip.compress("".join(json.dumps({"id": i}) + "\n" for i in range(100)).encode()))
+
+        assert len(sample_records(file_path, size=10, seed=1)) == 10
+        assert len(sample_records(file_path, fraction=0.5, seed=1)) == pytest.approx(50, abs=15)
+
+    def test_sample_larger_than_file(self, tmp_path):
+        """Test asking for more rows than available returns all of them"""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("id\n1\n2\n3\n")
+
+        assert sorted(record["id"] for record in sample_records(file_path, size=10)) == ["1", "2", "3"]
+
+    def test_sample_requires_size_or_fraction(self, csv_file):
+        """Test exactly one of size and fraction must be given"""
+        with pytest.raises(ValueError):
+            sample_records(csv_file)
+        with pytest.raises(ValueError):
+            sample_records(csv_file, size=1, fraction=0.1)
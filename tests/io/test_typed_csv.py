@@ -0,0 +1,53 @@
+import pytest
+
+from data_sitter import Contract
+from data_sitter.io.typed_csv import convert_column, read_csv_columns, validate_csv_file
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    file_path = tmp_path / "data.csv"
+    file_path.write_text(" name ,unused, age,score\nJohn Doe,x, 25,1.5\nJo,y,,2\nJane Smith,z,abc\n")
+    return file_path
+
+
+class TestTypedCsv:
+    def test_convert_column(self):
+        """Test cells are converted in bulk, empty numeric cells are None"""
+        assert convert_column(["1", " 2 ", "3"], int) == [1, 2, 3]
+        assert convert_column(["1.5", "", "2"], float) == [1.5, None, 2.0]
+        assert convert_column([" a ", ""], str) == ["a", ""]
+
+    def test_convert_column_leaves_invalid_cells(self):
+        """Test cells that can't be converted are left as strings for the validation"""
+        assert convert_column(["1", "abc", "1.0", "١"], int) == [1, "abc", "1.0", "١"]
+
+    def test_read_csv_columns(self, csv_file):
+        """Test only the requested columns are read, typed and in chunks"""
+        chunks = list(read_csv_columns(csv_file, {"name": str, "age": int, "score": float}, chunk_size=2))
+
+        assert [size for _, size in chunks] == [2, 1]
+        assert chunks[0][0] == {"name": ["John Doe", "Jo"], "age": [25, None], "score": [1.5, 2.0]}
+        assert chunks[1][0] == {"name": ["Jane Smith"], "age": ["abc"], "score": [None]}
+
+    def test_read_csv_columns_skip_rows(self, csv_file):
+        """Test the first rows can be skipped"""
+        (columns, size), = read_csv_columns(csv_file, {"name": str}, skip_rows=2)
+        assert (columns, size) == ({"name": ["Jane Smith"]}, 1)
+
+    def test_validate_csv_file(self, csv_file):
+        """Test typed chunks report the same errors as the row by row validation"""
+        contract = Contract.from_dict({
+            "name": "TestContract",
+            "fields": [
+                {"name": "name", "type": "String", "rules": ["Has minimum length 3"]},
+                {"name": "age", "type": "Integer", "rules": ["Is at least 18"]},
+            ],
+        })
+
+        batch_validation, = validate_csv_file(contract, csv_file)
+
+        assert batch_validation.invalid_rows == [1, 2]
+        assert batch_validation.errors[1] == {"name": ["Length must be at least 3 characters."]}
+        assert batch_validation.errors[2] == {"age": ["Input should be a valid integer, unable to parse string as an integer"]}
+        assert batch_validation.get_item(0) == {"name": "John Doe", "age": 25}
@@ -0,0 +1,73 @@
+import csv
+import json
+import pytest
+from data_sitter.io.writers import CsvRecordWriter, NdjsonRecordWriter, open_writer
+
+
+class TestWriters:
+    def test_open_writer_by_suffix(self, tmp_path):
+        """Test the writer is chosen by the file suffix"""
+        with open_writer(tmp_path / "out.csv") as writer:
+            assert isinstance(writer, CsvRecordWriter)
+        with open_writer(tmp_path / "out.jsonl") as writer:
+            assert isinstance(writer, NdjsonRecordWriter)
+        with pytest.raises(NotImplementedError):
+            open_writer(tmp_path / "out.txt")
+
+    def test_csv_writer(self, tmp_path):
+        """Test CSV writer takes its header from the first record"""
+        file_path = tmp_path / "out.csv"
+        with open_writer(file_path) as writer:
+            writer.write({"name": "John", "age": "25"})
+            writer.write({"name": "Jane", "age": "30"})
+
+        assert writer.count == 2
+        with open(file_path, newline="") as f:
+            assert list(csv.DictReader(f)) == [
+                {"name": "John", "age": "25"},
+                {"name": "Jane", "age": "30"},
+            ]
+
+    def test_csv_writer_rejects(self, tmp_path):
+        """Test rejected rows keep the record columns and serialise the errors"""
+        file_path = tmp_path / "rejects.csv"
+        with open_writer(file_path) as writer:
+            writer.write_reject(3, {"name": "Jo"}, {"name": ["Too short"]})
+
+        with open(file_path, newline="") as f:
+            row = next(csv.DictReader(f))
+        assert row["row"] == "3"
+        assert row["name"] == "Jo"
+        assert json.loads(row["errors"]) == {"name": ["Too short"]}
+
+    def test_ndjson_writer_rejects(self, tmp_path):
+        """Test NDJSON rejects nest the record and its errors"""
+        file_path = tmp_path / "rejects.jsonl"
+        with open_writer(file_path) as writer:
+            writer.write({"name": "John"})
+            writer.write_reject(2, {"name": "Jo"}, {"name": ["Too short"]})
+
+        lines = [json.loads(line) for line in file_path.read_text().splitlines()]
+        assert lines == [
+            {"name": "John"},
+            {"row": 2, "record": {"name": "Jo"}, "errors": {"name": ["Too short"]}},
+        ]
+
+    @pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+    def test_resume_at(self, tmp_path, suffix):
+        """Test resuming truncates what was written after the position and appends"""
+        file_path = tmp_path / f"out{suffix}"
+        with open_writer(file_path) as writer:
+            writer.write({"name": "John", "age": "25"})
+            position = writer.tell()
+            writer.write({"name": "Lost", "age": "0"})
+
+        with open_writer(file_path, resume_at=position) as writer:
+            writer.write({"name": "Jane", "age": "30"})
+
+        if suffix == ".csv":
+            with open(file_path, newline="") as f:
+                records = list(csv.DictReader(f))
+        else:
+            records = [json.loads(line) for line in file_path.read_text().splitlines()]
+        assert records == [{"name": "John", "age": "25"}, {"name": "Jane", "age": "30"}]
@@ -0,0 +1,67 @@
+from data_sitter.profiling import ColumnProfile, DataProfile, profile_records
+
+
+RECORDS = [
+    {"id": 1, "name": "Ann", "score": 3.5},
+    {"id": 2, "name": "Bob", "score": None},
+    {"id": 3, "name": "Ann"},
+    {"id": 4, "name": "Christine", "score": 7.0, "extra": True},
+]
+
+
+class TestColumnProfile:
+    def test_to_dict(self):
+        """Test the statistics of a column"""
+        profile = ColumnProfile(top_k=2)
+        profile.add_column(["ab", None, "abc", "ab", 5])
+
+        assert profile.to_dict() == {
+            "count": 5,
+            "nulls": 1,
+            "types": {"str": 3, "int": 1},
+            "min": 5,
+            "max": 5,
+            "distinct": 3,
+            "top": [["ab", 2], ["abc", 1]],
+            "lengths": {"min": 2, "max": 3, "histogram": {2: 2, 3: 1}},
+            "quantiles": {"0.01": 5, "0.05": 5, "0.25": 5, "0.5": 5, "0.75": 5, "0.95": 5, "0.99": 5},
+        }
+
+    def test_nan_not_ranked(self):
+        profile = ColumnProfile()
+        profile.add_column([float("nan"), 1.0])
+        assert (profile.minimum, profile.maximum, profile.numbers.n) == (1.0, 1.0, 1)
+
+
+class TestDataProfile:
+    def test_profile_records(self):
+        """Test columns found later count the earlier rows as nulls"""
+        profile = profile_records(RECORDS).to_dict()
+
+        assert profile["rows"] == 4
+        assert list(profile["columns"]) == ["id", "name", "score", "extra"]
+        assert profile["columns"]["score"]["nulls"] == 2
+        assert profile["columns"]["extra"]["nulls"] == 3
+        assert profile["columns"]["name"]["top"][0] == ["Ann", 2]
+        assert profile["columns"]["id"]["min"] == 1 and profile["columns"]["id"]["max"] == 4
+
+    def test_fixed_columns(self):
+        profile = profile_records(RECORDS, columns=["id", "missing"]).to_dict()
+        assert list(profile["columns"]) == ["id", "missing"]
+        assert profile["columns"]["missing"]["nulls"] == 4
+
+    def test_add_columns(self):
+        """Test batches of columns are profiled like records"""
+        profile = DataProfile()
+        profile.add_columns({"id": [1, 2, 3, 4], "name": ["Ann", "Bob", "Ann", "Christine"]}, 4)
+        expected = profile_records({"id": r["id"], "name": r["name"]} for r in RECORDS)
+        assert profile.to_dict() == expected.to_dict()
+
+    def test_merge(self):
+        """Test profiles of chunks merge into the profile of the whole dataset"""
+        first = profile_records(RECORDS[:2], seed=0)
+        second = profile_records(RECORDS[2:], seed=0)
+
+        merged = first.merge(second).to_dict()
+
+        assert merged == profile_records(RECORDS, seed=0).to_dict()
@@ -0,0 +1,36 @@
+import pytest
+
+from data_sitter.profiling import HyperLogLog
+
+
+class TestHyperLogLog:
+    def test_small_counts_are_exact(self):
+        """Test small cardinalities are counted through the linear counting correction"""
+        sketch = HyperLogLog()
+        for value in ["a", "b", "c", "a", 1, 1.0]:
+            sketch.add(value)
+        assert sketch.count() == 5
+
+    def test_large_count_error(self):
+        """Test the estimate is within a few standard errors"""
+        sketch = HyperLogLog()
+        for value in range(50_000):
+            sketch.add(value)
+        assert sketch.count() == pytest.approx(50_000, rel=0.05)
+
+    def test_merge(self):
+        """Test merging counts the union of both streams"""
+        first, second = HyperLogLog(), HyperLogLog()
+        for value in range(20_000):
+            first.add(value)
+        for value in range(10_000, 30_000):
+            second.add(value)
+        assert first.merge(second).count() == pytest.approx(30_000, rel=0.05)
+
+    def test_merge_different_precision(self):
+        with pytest.raises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+    def test_invalid_precision(self):
+        with pytest.raises(ValueError):
+            HyperLogLog(20)
@@ -0,0 +1,59 @@
+from data_sitter.profiling import ColumnProfile, profile_records
+from data_sitter.profiling.inference import format_number, get_categories, infer_contract, infer_type
+
+
+class TestInference:
+    def test_format_number(self):
+        """Test numbers are written without exponent so the rule parser can read them"""
+        assert format_number(3) == "3"
+        assert format_number(-1.5) == "-1.5"
+        assert format_number(1e-05) == "0.00001"
+        assert format_number(1.5e20) == "150000000000000000000"
+
+    def test_infer_type(self):
+        def column(values):
+            profile = ColumnProfile()
+            profile.add_column(values)
+            return profile
+
+        assert infer_type(column([1, 2, None])) == "Integer"
+        assert infer_type(column([1, 2.5])) == "Float"
+        assert infer_type(column([1, "a"])) == "String"
+        assert infer_type(column([None])) == "String"
+        assert infer_type(column([[1], ["a"], None])) == "List"
+        assert infer_type(column([True, False])) is None
+        assert infer_type(column([1, True])) is None
+        assert infer_type(column([{"a": 1}])) is None
+
+    def test_get_categories(self):
+        """Test only columns with few and repeated values are categorical"""
+        profile = ColumnProfile()
+        profile.add_column(["b", "a", "b", "a", None])
+        assert get_categories(profile, max_categories=2) == ["a", "b"]
+        assert get_categories(profile, max_categories=1) is None
+
+        unique = ColumnProfile()
+        unique.add_column(["a", "b", "c"])
+        assert get_categories(unique, max_categories=10) is None
+
+    def test_infer_contract(self):
+        """Test the rules inferred for each field"""
+        records = [
+            {"id": 1, "status": "open", "score": 0.5, "note": "x"},
+            {"id": 7, "status": "closed", "score": None, "note": "y"},
+            {"id": 3, "status": "open", "score": 2, "note": "z"},
+            {"id": 4, "status": "open", "score": 1.0, "note": "w"},
+        ]
+
+        contract = infer_contract(profile_records(records), name="tickets")
+
+        assert contract == {
+            "name": "tickets",
+            "fields": [
+                {"name": "id", "type": "Integer", "rules": ["Is not null", "Is at least 1", "Is at most 7"]},
+                {"name": "status", "type": "String", "rules": ["Is not null", "Is one of $values.status_values"]},
+                {"name": "score", "type": "Float", "rules": ["Is at least 0.5", "Is at most 2"]},
+                {"name": "note", "type": "String", "rules": ["Is not null"]},
+            ],
+            "values": {"status_values": ["closed", "open"]},
+        }
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from data_sitter.profiling import KllSketch
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(0)
+    values = list(range(100_000))
+    rng.shuffle(values)
+    return values
+
+
+class TestKllSketch:
+    def test_small_streams_are_exact(self):
+        """Test streams smaller than the sketch are kept whole"""
+        sketch = KllSketch()
+        for value in [5, 1, 3, 2, 4]:
+            sketch.add(value)
+        assert sketch.quantiles([0, 0.5, 1]) == [1, 3, 5]
+
+    def test_empty(self):
+        assert KllSketch().quantile(0.5) is None
+
+    def test_quantiles_bounded_memory(self, values):
+        """Test the quantiles are approximated while keeping few items"""
+        sketch = KllSketch(seed=1)
+        for value in values:
+            sketch.add(value)
+
+        assert sketch.n == 100_000
+        assert sketch.size < 1000
+        for fraction in (0.1, 0.5, 0.9):
+            assert sketch.quantile(fraction) == pytest.approx(fraction * 100_000, abs=2_000)
+
+    def test_merge(self, values):
+        """Test sketches of chunks merge into the sketch of the whole stream"""
+        sketches = [KllSketch(seed=seed) for seed in range(4)]
+        for i, value in enumerate(values):
+            sketches[i % 4].add(value)
+        merged = sketches[0]
+        for sketch in sketches[1:]:
+            merged.merge(sketch)
+
+        assert merged.n == 100_000
+        assert merged.quantile(0.5) == pytest.approx(50_000, abs=2_000)
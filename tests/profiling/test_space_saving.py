@@ -0,0 +1,23 @@
+from data_sitter.profiling import SpaceSaving
+
+
+class TestSpaceSaving:
+    def test_top(self):
+        """Test the most frequent values are found while keeping few counters"""
+        summary = SpaceSaving(capacity=10)
+        for value in ["a"] * 50 + ["b"] * 30 + [str(i) for i in range(100)] + ["a"] * 10:
+            summary.add(value)
+
+        assert len(summary.counts) == 10
+        assert [value for value, _ in summary.top(2)] == ["a", "b"]
+        assert summary.top(1)[0][1] >= 60  # Counts are never under-estimated
+
+    def test_merge(self):
+        """Test summaries of chunks merge their counts"""
+        first, second = SpaceSaving(capacity=3), SpaceSaving(capacity=3)
+        for value in "aab":
+            first.add(value)
+        for value in "bbc":
+            second.add(value)
+
+        assert first.merge(second).top(3) == [("b", 3), ("a", 2), ("c", 1)]
@@ -36,6 +36,18 @@ class LeafField:
         return [MiddleField]
 
 
+@pytest.fixture(autouse=True)
+def restore_registry():
+    """Restores the fields and rules registered by the package, the tests register their own"""
+    rules = {name: list(field_rules) for name, field_rules in RuleRegistry.rules.items()}
+    type_map = dict(RuleRegistry.type_map)
+    yield
+    RuleRegistry.rules.clear()
+    RuleRegistry.rules.update(rules)
+    RuleRegistry.type_map.clear()
+    RuleRegistry.type_map.update(type_map)
+
+
 class TestRuleRegistry:
     def setup_method(self):
         """Setup method to reset the RuleRegistry before each test"""
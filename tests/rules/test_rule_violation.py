@@ -0,0 +1,53 @@
+import pickle
+
+import pytest
+from data_sitter.rules.RuleViolation import RuleViolation, render_message
+
+
+class TestRuleViolation:
+    def test_is_value_error(self):
+        """Test that RuleViolation can be handled as a ValueError"""
+        with pytest.raises(ValueError, match="Value must be at least 5."):
+            raise RuleViolation("at_least", "Value must be at least {min_val}.", min_val=5)
+
+    def test_structured_attributes(self):
+        """Test rule id and params are kept without rendering the message"""
+        violation = RuleViolation("between", "Value must be between {min_val} and {max_val}.", min_val=1, max_val=3)
+        assert violation.rule_id == "between"
+        assert violation.params == {"min_val": 1, "max_val": 3}
+        assert violation.to_dict() == {
+            "rule_id": "between",
+            "params": {"min_val": 1, "max_val": 3},
+            "msg": "Value must be between 1 and 3.",
+        }
+
+    def test_message_without_params_is_not_formatted(self):
+        """Test templates without params are returned verbatim"""
+        violation = RuleViolation("int_parsing", "Input should be {a valid integer}")
+        assert violation.message == "Input should be {a valid integer}"
+
+    def test_identical_messages_are_shared(self):
+        """Test identical renders return the same string object"""
+        first = RuleViolation("at_most", "Value must not exceed {max_val}.", max_val=12345).message
+        second = RuleViolation("at_most", "Value must not exceed {max_val}.", max_val=12345).message
+        assert first == second
+        assert first is second
+
+    def test_equal_params_of_other_types(self):
+        """Test params that compare equal but render differently are not shared"""
+        template = "Value must be at least {min_val}."
+        assert RuleViolation("at_least", template, min_val=1).message == "Value must be at least 1."
+        assert RuleViolation("at_least", template, min_val=1.0).message == "Value must be at least 1.0."
+        assert RuleViolation("at_least", template, min_val=True).message == "Value must be at least True."
+
+    def test_unhashable_params(self):
+        """Test rendering with unhashable params falls back to plain formatting"""
+        assert render_message("Errors: {errors}", {"errors": ["a", None]}) == "Errors: ['a', None]"
+
+    def test_pickle(self):
+        """Test violations survive a pickle round trip"""
+        violation = RuleViolation("at_least", "Value must be at least {min_val}.", min_val=5)
+        restored = pickle.loads(pickle.dumps(violation))
+        assert restored.rule_id == "at_least"
+        assert restored.params == {"min_val": 5}
+        assert str(restored) == "Value must be at least 5."
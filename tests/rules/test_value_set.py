@@ -0,0 +1,88 @@
+import pickle
+
+import pytest
+
+from data_sitter.rules import FrozenValueSet, MmapValueSet, ValueSet, load_values
+from data_sitter.rules.ValueSet import UnsortedValuesFile
+
+
+VALUES = ["AD", "AE", "ES", "FR", "Ñandú", "ÖSTERREICH"]
+
+
+@pytest.fixture
+def values_file(tmp_path):
+    file_path = tmp_path / "codes.txt"
+    file_path.write_text("\n".join(VALUES) + "\n", encoding="utf8")
+    return file_path
+
+
+class TestValueSet:
+    @pytest.mark.parametrize("value_set_class", [FrozenValueSet, MmapValueSet])
+    def test_membership(self, value_set_class, values_file):
+        """Test every value of the file is found and nothing else"""
+        value_set = value_set_class(values_file)
+
+        assert all(value in value_set for value in VALUES)
+        for value in ["", "A", "AF", "ESP", "ZZ", "ñandú", None, 1]:
+            assert value not in value_set
+        assert sorted(value_set) == sorted(VALUES)
+
+    def test_mmap_crlf_and_no_trailing_newline(self, tmp_path):
+        file_path = tmp_path / "codes.txt"
+        file_path.write_bytes(b"a\r\nb\r\nc")
+        value_set = MmapValueSet(file_path)
+        assert all(value in value_set for value in "abc")
+        assert "d" not in value_set
+
+    def test_mmap_empty_file(self, tmp_path):
+        file_path = tmp_path / "codes.txt"
+        file_path.write_text("")
+        assert "a" not in MmapValueSet(file_path)
+
+    def test_mmap_unsorted_file(self, tmp_path):
+        file_path = tmp_path / "codes.txt"
+        file_path.write_text("b\na\n")
+        with pytest.raises(UnsortedValuesFile):
+            MmapValueSet(file_path)
+
+    def test_abstract(self, values_file):
+        """Test value sets must implement their lookup"""
+        with pytest.raises(TypeError):
+            ValueSet(values_file)
+
+    @pytest.mark.parametrize("content", ["a\nb\n", ""])
+    def test_mmap_close(self, tmp_path, content):
+        """Test the map of the file is released when the value set is closed"""
+        file_path = tmp_path / "codes.txt"
+        file_path.write_text(content)
+        with MmapValueSet(file_path) as value_set:
+            assert ("a" in value_set) == bool(content)
+        assert not content or value_set.map.closed
+        value_set.close()  # Closing again does nothing
+
+    @pytest.mark.parametrize("value_set_class", [FrozenValueSet, MmapValueSet])
+    def test_is_stale(self, value_set_class, values_file):
+        """Test a value set is stale once its file changed or is removed"""
+        value_set = value_set_class(values_file)
+        assert not value_set.is_stale()
+        values_file.write_text("\n".join(VALUES + ["ZZ"]) + "\n", encoding="utf8")
+        assert value_set.is_stale()
+        values_file.unlink()
+        assert value_set.is_stale()
+
+    def test_pickle(self, values_file):
+        """Test value sets are pickled by their path"""
+        value_set = pickle.loads(pickle.dumps(MmapValueSet(values_file)))
+        assert "ES" in value_set
+
+    def test_load_values(self, values_file):
+        """Test file values are loaded relative to the values directory"""
+        loaded = load_values(
+            {"codes": {"file": values_file.name, "lookup": "mmap"}, "other": [1, 2]}, values_file.parent
+        )
+        assert isinstance(loaded["codes"], MmapValueSet)
+        assert loaded["other"] == [1, 2]
+        assert isinstance(load_values({"codes": {"file": str(values_file)}})["codes"], FrozenValueSet)
+
+        with pytest.raises(ValueError):
+            load_values({"codes": {"file": str(values_file), "lookup": "tree"}})
@@ -0,0 +1,14 @@
+import pytest
+
+from data_sitter import Contract
+
+
+@pytest.fixture
+def contract():
+    return Contract.from_dict({
+        "name": "people",
+        "fields": [
+            {"name": "name", "type": "String", "rules": ["Is not null", "Has minimum length 3"]},
+            {"name": "age", "type": "Integer", "rules": ["Is at least 18"]},
+        ],
+    })
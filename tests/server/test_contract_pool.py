@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+from data_sitter.server import ContractNotFound, ContractPool
+
+
+class TestContractPool:
+    def test_get(self, contract):
+        pool = ContractPool([contract])
+        assert pool.get("people") is contract
+        assert pool.names == ["people"]
+        with pytest.raises(ContractNotFound):
+            pool.get("missing")
+
+    def test_from_files(self, tmp_path):
+        """Test contracts are loaded by the name in their file"""
+        file_path = tmp_path / "contract.json"
+        file_path.write_text(json.dumps({"name": "orders", "fields": [{"name": "id", "type": "Integer"}]}))
+
+        pool = ContractPool.from_files([file_path], cache_size=4)
+
+        assert pool.names == ["orders"]
+        assert pool.get("orders").cache_size == 4
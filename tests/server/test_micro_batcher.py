@@ -0,0 +1,55 @@
+import asyncio
+
+from data_sitter.server import LatencyStats, MicroBatcher
+from data_sitter.server.LatencyStats import percentile
+
+
+class TestMicroBatcher:
+    def test_validate(self, contract):
+        """Test a lone record is validated right away"""
+        async def run():
+            batcher = MicroBatcher(contract, max_latency=10)
+            try:
+                return await asyncio.wait_for(batcher.validate({"name": "Jo", "age": 20}), 1)
+            finally:
+                await batcher.stop()
+
+        assert asyncio.run(run()) == {"name": ["Length must be at least 3 characters."]}
+
+    def test_concurrent_records_are_batched(self, contract):
+        """Test concurrent records are coalesced into micro-batches of at most max_batch_size"""
+        stats = LatencyStats()
+
+        async def run():
+            batcher = MicroBatcher(contract, max_batch_size=8, max_latency=0.05, stats=stats)
+            records = [{"name": "John", "age": age} for age in range(10, 30)]
+            try:
+                return await asyncio.gather(*(batcher.validate(record) for record in records))
+            finally:
+                await batcher.stop()
+
+        results = asyncio.run(run())
+
+        assert [bool(errors) for errors in results] == [age < 18 for age in range(10, 30)]
+        assert stats.batched_records == 20
+        assert stats.batches < 20
+        assert stats.to_dict()["mean_micro_batch_size"] <= 8
+
+
+class TestLatencyStats:
+    def test_to_dict(self):
+        stats = LatencyStats(window=100)
+        for latency in range(1, 101):
+            stats.add_request(latency / 1000, records=2)
+
+        report = stats.to_dict()
+
+        assert report["requests"] == 100
+        assert report["records"] == 200
+        assert report["p50_ms"] == 51
+        assert report["p99_ms"] == 100
+        assert report["records_per_second"] > 0
+
+    def test_percentile_empty(self):
+        assert percentile([], 0.5) is None
+        assert LatencyStats().to_dict()["p50_ms"] is None
@@ -0,0 +1,86 @@
+import json
+import asyncio
+import http.client
+
+import pytest
+
+from data_sitter.server import ContractPool, ValidationServer
+
+
+def request(port: int, method: str, path: str, body: str = None, headers: dict = None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def serve(contract):
+    """Runs the checks against a server listening on a free local port"""
+    def run(check):
+        async def main():
+            server = ValidationServer(ContractPool([contract]), port=0)
+            await server.start()
+            try:
+                return await asyncio.to_thread(check, server.port)
+            finally:
+                await server.stop()
+        return asyncio.run(main())
+    return run
+
+
+class TestValidationServer:
+    def test_validate_record(self, serve):
+        def check(port):
+            assert request(port, "POST", "/contracts/people/validate", json.dumps({"name": "John", "age": 30})) == (
+                200, {"valid": True, "errors": {}}
+            )
+            status, response = request(port, "POST", "/contracts/people/validate", json.dumps({"name": "Jo"}))
+            assert status == 200
+            assert response == {"valid": False, "errors": {"name": ["Length must be at least 3 characters."]}}
+        serve(check)
+
+    def test_validate_ndjson(self, serve):
+        """Test NDJSON bodies are validated as a batch"""
+        def check(port):
+            body = "\n".join(json.dumps(r) for r in [{"name": "John", "age": 30}, {"name": "Jane", "age": 3}])
+            status, response = request(
+                port, "POST", "/contracts/people/validate", body, {"Content-Type": "application/x-ndjson"}
+            )
+            assert status == 200
+            assert response == {"rows": 2, "invalid_rows": [1], "errors": {"1": {"age": ["Value must be at least 18."]}}}
+        serve(check)
+
+    def test_concurrent_requests_and_stats(self, serve):
+        """Test concurrent clients are served and reported in the stats"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def check(port):
+            body = json.dumps({"name": "John", "age": 30})
+            with ThreadPoolExecutor(8) as executor:
+                results = list(executor.map(
+                    lambda _: request(port, "POST", "/contracts/people/validate", body), range(32)
+                ))
+            assert all(result == (200, {"valid": True, "errors": {}}) for result in results)
+
+            status, stats = request(port, "GET", "/stats")
+            assert status == 200
+            assert stats["requests"] == 32
+            assert stats["p50_ms"] <= stats["p99_ms"]
+        serve(check)
+
+    def test_errors(self, serve):
+        def check(port):
+            assert request(port, "GET", "/contracts") == (200, {"contracts": ["people"]})
+            assert request(port, "POST", "/contracts/missing/validate", "{}")[0] == 404
+            assert request(port, "GET", "/contracts/people/validate")[0] == 405
+            assert request(port, "POST", "/contracts/people/validate", "not json")[0] == 400
+            assert request(port, "POST", "/contracts/people/validate", "[1]")[0] == 400
+            for body in ['{"name": "John"}\n[1, 2]', "5", '"John"']:
+                ndjson = request(port, "POST", "/contracts/people/validate", body, {"Content-Type": "application/x-ndjson"})
+                assert ndjson[0] == 400
+            assert request(port, "GET", "/unknown")[0] == 404
+        serve(check)
@@ -174,4 +174,426 @@ class TestCLI:
         mock_parse_args.side_effect = argparse.ArgumentError(None, "argument -c/--contract is required")
         
         with pytest.raises(argparse.ArgumentError):
-            main() 
\ No newline at end of file
+            main() 
+
+@pytest.fixture
+def mixed_csv_file(tmp_path):
+    content = "name,age\nJohn Doe,25\nJo,30\nJane Smith,12\nJack Black,40\n"
+    file_path = tmp_path / "mixed.csv"
+    file_path.write_text(content)
+    return str(file_path)
+
+
+class TestQuarantine:
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_split_valid_and_invalid_rows(self, mock_print, mock_argv, sample_contract_file, mixed_csv_file, tmp_path):
+        """Test valid rows and rejects are written to separate files"""
+        output = tmp_path / "valid.csv"
+        rejects = tmp_path / "rejects.jsonl"
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter",
+            "-c", sample_contract_file,
+            "-f", mixed_csv_file,
+            "-o", str(output),
+            "-r", str(rejects),
+        ][i]
+
+        main()
+
+        assert output.read_text().splitlines() == ["name,age", "John Doe,25", "Jack Black,40"]
+        reject_lines = [json.loads(line) for line in rejects.read_text().splitlines()]
+        assert [line["row"] for line in reject_lines] == [2, 3]
+        assert reject_lines[0]["record"] == {"name": "Jo", "age": "30"}
+        assert "name" in reject_lines[0]["errors"]
+        assert "age" in reject_lines[1]["errors"]
+        assert any("2 valid and 2 invalid" in args[0] for args, _ in mock_print.call_args_list)
+        assert not any("pass the contract" in args[0] for args, _ in mock_print.call_args_list)
+
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_max_errors_aborts(self, mock_print, mock_argv, sample_contract_file, mixed_csv_file, tmp_path):
+        """Test validation stops once the maximum number of errors is reached"""
+        from data_sitter.cli import TooManyErrors
+
+        rejects = tmp_path / "rejects.csv"
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter",
+            "-c", sample_contract_file,
+            "-f", mixed_csv_file,
+            "-r", str(rejects),
+            "--max-errors", "1",
+        ][i]
+
+        with pytest.raises(TooManyErrors):
+            main()
+
+        # The reject is flushed before aborting
+        assert rejects.read_text().splitlines()[1].startswith("2,Jo,30")
+
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_all_rows_valid(self, mock_print, mock_argv, sample_contract_file, sample_csv_file, tmp_path):
+        """Test a file without invalid rows still passes the contract"""
+        output = tmp_path / "valid.jsonl"
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter",
+            "-c", sample_contract_file,
+            "-f", sample_csv_file,
+            "-o", str(output),
+        ][i]
+
+        main()
+
+        assert len(output.read_text().splitlines()) == 2
+        assert any("pass the contract" in args[0] for args, _ in mock_print.call_args_list)
+
+
+class TestCompressedInput:
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_cli_with_gzip_csv_file(self, mock_print, mock_argv, sample_contract_file, tmp_path):
+        """Test CLI with a gzip compressed CSV file"""
+        import gzip
+
+        file_path = tmp_path / "data.csv.gz"
+        file_path.write_bytes(gzip.compress(b"name,age\nJohn Doe,25\nJane Smith,30\n"))
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter",
+            "-c", sample_contract_file,
+            "-f", str(file_path),
+            "--buffer-size", "4096",
+        ][i]
+
+        main()
+
+        assert any("pass the contract" in args[0] for args, _ in mock_print.call_args_list)
+
+
+class TestTypedCsvInput:
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_cli_with_invalid_csv_file(self, mock_print, mock_argv, sample_contract_file, tmp_path):
+        """Test CLI raises on the first invalid row of a CSV file validated in chunks"""
+        from data_sitter.cli import InvalidRow
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("name,age\nJohn Doe,25\nJane Smith,\n")
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter",
+            "-c", sample_contract_file,
+            "-f", str(file_path),
+            "--batch-size", "1",
+        ][i]
+
+        with pytest.raises(InvalidRow, match="Row 2"):
+            main()
+
+
+class TestDatasetRules:
+    @pytest.fixture
+    def unique_contract_file(self, tmp_path, sample_contract_dict):
+        sample_contract_dict["dataset_rules"] = ["Column 'name' is unique"]
+        file_path = tmp_path / "unique_contract.json"
+        file_path.write_text(json.dumps(sample_contract_dict))
+        return str(file_path)
+
+    @pytest.mark.parametrize("content, suffix", [
+        ("name,age\nJohn Doe,25\nJane Smith,30\nJohn Doe,40\n", ".csv"),
+        ('{"name": "John Doe", "age": 25}\n{"name": "Jane Smith", "age": 30}\n{"name": "John Doe", "age": 40}\n', ".jsonl"),
+    ])
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_duplicates_fail(self, mock_print, mock_argv, unique_contract_file, tmp_path, content, suffix):
+        """Test CLI reports the duplicated keys with their rows"""
+        from data_sitter.cli import InvalidDataset
+        file_path = tmp_path / f"data{suffix}"
+        file_path.write_text(content)
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter", "-c", unique_contract_file, "-f", str(file_path), "--max-keys", "1",
+        ][i]
+
+        with pytest.raises(InvalidDataset):
+            main()
+
+        printed = [args[0] for args, _ in mock_print.call_args_list]
+        assert "  Key ('John Doe',) is repeated at rows [1, 3]." in printed
+
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_duplicates_quarantine(self, mock_print, mock_argv, unique_contract_file, tmp_path):
+        """Test the duplicates are reported after routing the rows"""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("name,age\nJohn Doe,25\nJohn Doe,30\n")
+        output = tmp_path / "valid.csv"
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter", "-c", unique_contract_file, "-f", str(file_path), "-o", str(output),
+        ][i]
+
+        main()
+
+        printed = [args[0] for args, _ in mock_print.call_args_list]
+        assert "Column 'name' is unique: 1 failures" in printed
+        assert not any("pass the contract" in line for line in printed)
+
+
+    @pytest.mark.parametrize("quarantine", [False, True])
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_duplicates_coerced(self, mock_print, mock_argv, sample_contract_dict, tmp_path, quarantine):
+        """Test the keys are compared once coerced, on every path and for invalid rows too"""
+        from data_sitter.cli import InvalidDataset
+        sample_contract_dict["dataset_rules"] = ["Column 'age' is unique"]
+        contract_path = tmp_path / "contract.json"
+        contract_path.write_text(json.dumps(sample_contract_dict))
+        file_path = tmp_path / "data.jsonl"
+        rows = [{"name": "John Doe", "age": 25}, {"name": "Jane Smith", "age": "25"}]
+        if quarantine:
+            rows.append({"name": "Jo", "age": "25"})  # Invalid name, its age still counts
+        file_path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+        flags = ["-o", str(tmp_path / "valid.jsonl")] if quarantine else []
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter", "-c", str(contract_path), "-f", str(file_path), *flags
+        ][i]
+
+        if quarantine:
+            main()
+        else:
+            with pytest.raises(InvalidDataset):
+                main()
+
+        printed = [args[0] for args, _ in mock_print.call_args_list]
+        rows = "[1, 2, 3]" if quarantine else "[1, 2]"
+        assert f"  Key (25,) is repeated at rows {rows}." in printed
+
+
+class TestProfile:
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_profile_csv(self, mock_print, mock_argv, tmp_path):
+        """Test the profile subcommand types the CSV cells and prints the profile"""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("name,age,other\nJohn Doe,25,x\nJane Smith,,y\n")
+        mock_argv.__getitem__.side_effect = lambda i: ["data-sitter", "profile", "-f", str(file_path)][i]
+
+        main()
+
+        profile = json.loads(mock_print.call_args[0][0])
+        assert profile["rows"] == 2
+        assert profile["columns"]["age"]["types"] == {"int": 1}
+        assert profile["columns"]["age"]["nulls"] == 1
+        assert profile["columns"]["name"]["lengths"]["max"] == 10
+
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_profile_with_contract(self, mock_print, mock_argv, sample_contract_file, sample_json_file):
+        """Test only the contract fields are profiled"""
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter", "profile", "-f", sample_json_file, "-c", sample_contract_file,
+        ][i]
+
+        main()
+
+        profile = json.loads(mock_print.call_args[0][0])
+        assert list(profile["columns"]) == ["name", "age"]
+        assert profile["columns"]["age"]["min"] == 25
+
+
+class TestColumnarInput:
+    @pytest.fixture
+    def parquet_file(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+        file_path = tmp_path / "data.parquet"
+        pq.write_table(pa.table({"name": ["John Doe", "Jo", "Jane Smith"], "age": [25, 30, 40]}), file_path)
+        return str(file_path)
+
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_cli_with_parquet_file_fails(self, mock_print, mock_argv, sample_contract_file, parquet_file):
+        """Test CLI raises on the first invalid row of a Parquet file"""
+        from data_sitter.cli import InvalidRow
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter",
+            "-c", sample_contract_file,
+            "-f", parquet_file,
+        ][i]
+
+        with pytest.raises(InvalidRow, match="Row 2"):
+            main()
+
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_cli_with_parquet_file_quarantine(self, mock_print, mock_argv, sample_contract_file, parquet_file, tmp_path):
+        """Test Parquet rows are routed to the output and reject files"""
+        output = tmp_path / "valid.jsonl"
+        rejects = tmp_path / "rejects.jsonl"
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter",
+            "-c", sample_contract_file,
+            "-f", parquet_file,
+            "--batch-size", "2",
+            "-o", str(output),
+            "-r", str(rejects),
+        ][i]
+
+        main()
+
+        valid = [json.loads(line) for line in output.read_text().splitlines()]
+        assert valid == [{"name": "John Doe", "age": 25}, {"name": "Jane Smith", "age": 40}]
+        assert json.loads(rejects.read_text())["row"] == 2
+
+
+class TestCsvCells:
+    @pytest.fixture
+    def optional_contract_file(self, tmp_path):
+        file_path = tmp_path / "optional_contract.json"
+        file_path.write_text(json.dumps({
+            "name": "OptionalContract",
+            "fields": [
+                {"name": "name", "type": "String", "rules": ["Is not null"]},
+                {"name": "score", "type": "Integer", "rules": ["Is at least 0"]},
+            ],
+        }))
+        return str(file_path)
+
+    @pytest.mark.parametrize("flags", [[], ["-r", "rejects.jsonl"], ["--max-errors", "0"], ["--sample", "2"]])
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_empty_cells_same_verdict(self, mock_print, mock_argv, optional_contract_file, tmp_path, flags):
+        """Test empty numeric cells are None whatever the flags, as the columnar check reads them"""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("name,score\nJohn, \nJane,3\n")
+        flags = [str(tmp_path / flag) if flag.endswith(".jsonl") else flag for flag in flags]
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter", "-c", optional_contract_file, "-f", str(file_path), *flags
+        ][i]
+
+        main()
+
+        printed = [args[0] for args, _ in mock_print.call_args_list]
+        if "--sample" in flags:
+            assert json.loads(printed[-1])["invalid_rows"]["failures"] == 0
+        else:
+            assert "pass the contract" in printed[-1]
+        if "-r" in flags or "--max-errors" in flags:
+            assert "2 valid and 0 invalid" in printed[-2]
+
+
+class TestJsonBackend:
+    @pytest.mark.parametrize("backend", ["pydantic", "lean"])
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_backend_validates_json_rows(self, mock_print, mock_argv, sample_contract_file, sample_json_file, backend):
+        """Test the JSON check validates the rows with the selected backend"""
+        from data_sitter.backends import BACKENDS
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter", "-c", sample_contract_file, "-f", sample_json_file, "--backend", backend
+        ][i]
+
+        with patch.object(BACKENDS[backend], "validate", autospec=True, side_effect=BACKENDS[backend].validate) as validate:
+            main()
+
+        assert validate.call_count == 2
+        assert any("pass the contract" in args[0] for args, _ in mock_print.call_args_list)
+
+    @pytest.mark.parametrize("backend", ["pydantic", "lean"])
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_invalid_json_row(self, mock_print, mock_argv, sample_contract_file, tmp_path, backend):
+        """Test the JSON check raises on the first invalid row whatever the backend"""
+        from data_sitter.cli import InvalidRow
+        file_path = tmp_path / "data.json"
+        file_path.write_text(json.dumps([{"name": "John Doe", "age": 25}, {"name": "Jane Smith", "age": 12}]))
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter", "-c", sample_contract_file, "-f", str(file_path), "--backend", backend
+        ][i]
+
+        with pytest.raises(InvalidRow, match="Row 2"):
+            main()
+
+
+class TestSamplingMode:
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_cli_sample(self, mock_print, mock_argv, sample_contract_file, tmp_path):
+        """Test the sampled failure rates are reported"""
+        file_path = tmp_path / "data.csv"
+        rows = "".join(f"Person {i},{10 if i % 4 == 0 else 30}\n" for i in range(4000))
+        file_path.write_text(f"name,age\n{rows}")
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter",
+            "-c", sample_contract_file,
+            "-f", str(file_path),
+            "--sample", "400",
+            "--seed", "1",
+        ][i]
+
+        main()
+
+        report = json.loads(mock_print.call_args_list[-1][0][0])
+        assert report["rows"] == 400
+        age = report["fields"]["age"]
+        assert age["interval"][0] < 0.25 < age["interval"][1]
+        assert list(age["rules"]) == ["at_least"]
+
+    @patch('sys.argv')
+    def test_cli_sample_columnar(self, mock_argv, sample_contract_file, tmp_path, capsys):
+        """Test sampling a columnar file is rejected as a wrong argument"""
+        file_path = tmp_path / "data.parquet"
+        file_path.write_bytes(b"PAR1")
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter", "-c", sample_contract_file, "-f", str(file_path), "--sample", "10"
+        ][i]
+
+        with pytest.raises(SystemExit):
+            main()
+        assert "only implemented for CSV and JSON files" in capsys.readouterr().err
+
+
+class TestCheckpointResume:
+    @patch('sys.argv')
+    @patch('builtins.print')
+    def test_resume_after_interruption(self, mock_print, mock_argv, sample_contract_file, tmp_path):
+        """Test an interrupted run resumes from its checkpoint without duplicating rows"""
+        from data_sitter import Contract
+        from data_sitter.cli import quarantine, validate_records
+        from data_sitter.io import read_records
+        from data_sitter.io.checkpoint import Checkpoint
+
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("name,age\n" + "".join(f"Person {i},{10 if i % 3 == 0 else 30}\n" for i in range(10)))
+        output = tmp_path / "valid.csv"
+        rejects = tmp_path / "rejects.jsonl"
+        checkpoint_path = tmp_path / "checkpoint.json"
+        contract = Contract.from_dict(json.loads(open(sample_contract_file).read()))
+
+        def interrupted(validations, after):
+            for i, validation in enumerate(validations):
+                if i == after:
+                    raise KeyboardInterrupt()
+                yield validation
+
+        checkpoint = Checkpoint.open(checkpoint_path, contract, file_path)
+        with pytest.raises(KeyboardInterrupt):
+            quarantine(
+                interrupted(validate_records(contract, read_records(file_path)), after=7),
+                output, rejects, checkpoint=checkpoint, checkpoint_every=3,
+            )
+        assert json.loads(checkpoint_path.read_text())["rows"] == 6
+
+        mock_argv.__getitem__.side_effect = lambda i: [
+            "data-sitter",
+            "-c", sample_contract_file,
+            "-f", str(file_path),
+            "-o", str(output),
+            "-r", str(rejects),
+            "--checkpoint", str(checkpoint_path),
+            "--checkpoint-every", "3",
+        ][i]
+        main()
+
+        valid_names = [line.split(",")[0] for line in output.read_text().splitlines()[1:]]
+        assert valid_names == [f"Person {i}" for i in range(10) if i % 3]
+        assert [json.loads(line)["row"] for line in rejects.read_text().splitlines()] == [1, 4, 7, 10]
+        assert any("6 valid and 4 invalid" in args[0] for args, _ in mock_print.call_args_list)
+        assert not checkpoint_path.exists()
@@ -1,8 +1,10 @@
+from datetime import date, datetime, timezone
 import pytest
 import json
 import yaml
 
 from data_sitter import Contract
+from data_sitter.Validation import Validation
 
 
 @pytest.fixture
@@ -172,3 +174,425 @@ class TestContract:
         assert len(frontend_contract["fields"]) == 2
         # Check that rules have front-end representation
         assert isinstance(frontend_contract["fields"][0]["rules"], list)
+
+    def test_validate_keeps_rule_violations(self, sample_contract):
+        """Test that rule failures are kept as structured violations"""
+        validation = sample_contract.validate({"name": "John Doe", "age": 16})
+
+        violation = validation.violations["age"][0]
+        assert violation.rule_id == "at_least"
+        assert violation.params == {"min_val": 18}
+        assert validation.errors == {"age": ["Value must be at least 18."]}
+
+    def test_validate_batch(self, sample_contract):
+        """Test column validation reports the same errors as the row by row validation"""
+        rows = [
+            {"name": "John Doe", "age": 25},
+            {"name": "Jo", "age": 30},
+            {"name": None, "age": "12"},
+            {"name": "Jane Smith"},
+        ]
+        columns = {
+            "name": [row.get("name") for row in rows],
+            "age": [row.get("age") for row in rows],
+            "ignored": [1, 2, 3, 4],
+        }
+
+        batch_validation = sample_contract.validate_batch(columns)
+
+        assert len(batch_validation) == 4
+        assert batch_validation.invalid_rows == [1, 2, 3]
+        assert batch_validation.is_valid(0)
+        assert batch_validation.get_item(0) == {"name": "John Doe", "age": 25}
+        for row, validation in zip(rows, batch_validation):
+            assert validation.errors == sample_contract.validate(row).errors
+
+    def test_validate_batch_missing_column(self, sample_contract):
+        """Test columns missing from the batch are validated as nulls"""
+        batch_validation = sample_contract.validate_batch({"name": ["John Doe"]})
+
+        assert batch_validation.columns["age"] == [None]
+        assert list(batch_validation.errors[0]) == ["age"]
+
+    def test_validate_batch_encoded_column(self, sample_contract):
+        """Test dictionary-encoded columns are validated as their decoded rows"""
+        from data_sitter.field_types.EncodedColumn import EncodedColumn
+        ages = EncodedColumn([25, 12], [0, 1, 1, 0])
+
+        batch_validation = sample_contract.validate_batch({"name": ["John Doe"] * 4, "age": ages})
+
+        assert len(batch_validation) == 4
+        assert batch_validation.columns["age"] == [25, 12, 12, 25]
+        assert batch_validation.invalid_rows == [1, 2]
+
+    def test_dataset_rules(self, sample_contract_dict):
+        """Test the dataset rules are parsed and checked across all the rows"""
+        sample_contract_dict["dataset_rules"] = ["Column 'name' is unique", "Columns ['name', 'age'] are unique"]
+        contract = Contract.from_dict(sample_contract_dict)
+        validator = contract.dataset_validator(max_keys=1)
+        for item in [{"name": "Jo", "age": 20}, {"name": "Al", "age": 20}, {"name": "Jo", "age": 21}]:
+            validator.add(item)
+
+        violations = validator.violations()
+
+        assert list(violations) == ["Column 'name' is unique"]
+        assert violations["Column 'name' is unique"][0].params == {"key": ("Jo",), "rows": [1, 3]}
+        assert contract.contract["dataset_rules"] == sample_contract_dict["dataset_rules"]
+
+    def test_dataset_rule_not_found(self, sample_contract_dict):
+        from data_sitter.FieldResolver import RuleNotFoundError
+        sample_contract_dict["dataset_rules"] = ["Is sorted"]
+        with pytest.raises(RuleNotFoundError):
+            Contract.from_dict(sample_contract_dict).dataset_validator()
+
+    def test_profile(self, sample_contract):
+        """Test only the contract fields are profiled"""
+        profile = sample_contract.profile([{"name": "Jo", "age": 20, "other": 1}, {"name": "Al"}])
+
+        assert list(profile.columns) == ["name", "age"]
+        assert profile.to_dict()["columns"]["age"]["nulls"] == 1
+
+    def test_infer(self):
+        """Test the inferred contract loads and passes the records it was inferred from"""
+        records = [
+            {"code": "A,1", "amount": 10.25},
+            {"code": "B'2", "amount": 1e-05},
+            {"code": "A,1", "amount": None},
+            {"code": "B'2", "amount": 3},
+        ]
+
+        contract_dict = Contract.infer(iter(records), name="payments")
+        contract = Contract.from_dict(contract_dict)
+
+        assert contract_dict["values"] == {"code_values": ["A,1", "B'2"]}
+        assert all(contract.validate(record).errors is None for record in records)
+        assert contract.validate({"code": "C", "amount": 11}).errors == {
+            "code": ["Value 'C' must be one of the possible values."],
+            "amount": ["Value must not exceed 10.25."],
+        }
+
+    def test_infer_validates_its_records(self, caplog):
+        """Test the contract inferred from records accepts them, leaving out the fields no type accepts"""
+        records = [
+            {"id": i, "score": i / 2, "status": "open" if i % 2 else "closed", "active": i % 3 == 0,
+             "tags": ["a"] * (i % 3), "meta": {"i": i}, "day": date(2024, 1, i + 1)}
+            for i in range(10)
+        ]
+
+        contract_dict = Contract.infer(records)
+
+        assert [field["name"] for field in contract_dict["fields"]] == ["id", "score", "status", "tags", "day"]
+        assert "'active' left out" in caplog.text and "'meta' left out" in caplog.text
+        contract = Contract.from_dict(contract_dict)
+        for record in records:
+            assert contract.validate(record).errors is None, record
+
+    def test_infer_from_file(self, tmp_path):
+        """Test the contract is inferred from a sample of the rows of a file"""
+        file_path = tmp_path / "data.csv"
+        file_path.write_text("id,name\n1,a\n2,b\n300,\n")
+
+        contract_dict = Contract.infer(file_path, sample_size=2)
+
+        assert contract_dict["fields"][0] == {"name": "id", "type": "Integer", "rules": ["Is not null", "Is at least 1", "Is at most 2"]}
+        assert contract_dict["fields"][1]["rules"] == ["Is not null"]
+
+    @pytest.mark.parametrize("lookup", ["set", "mmap"])
+    def test_external_values(self, tmp_path, lookup):
+        """Test values referenced from an external file"""
+        (tmp_path / "codes.txt").write_text("AD\nES\nFR\n")
+        contract_dict = {
+            "name": "test",
+            "fields": [
+                {"name": "country", "type": "String", "rules": ["Is one of $values.countries"]},
+            ],
+            "values": {"countries": {"file": "codes.txt", "lookup": lookup}},
+        }
+
+        contract = Contract.from_dict(contract_dict, values_dir=tmp_path)
+
+        assert contract.validate({"country": "ES"}).errors is None
+        assert contract.validate({"country": "PT"}).errors == {
+            "country": ["Value 'PT' must be one of the possible values."],
+        }
+        assert contract.contract["values"] == contract_dict["values"]
+
+    @pytest.mark.parametrize("lookup", ["set", "mmap"])
+    def test_external_values_changed(self, tmp_path, lookup):
+        """Test a contract loaded after its values file changed doesn't reuse the old model"""
+        (tmp_path / "codes.txt").write_text("A\nB\n")
+        contract_dict = {
+            "name": "ChangedValues",
+            "fields": [{"name": "c", "type": "String", "rules": ["Is one of $values.codes"]}],
+            "values": {"codes": {"file": "codes.txt", "lookup": lookup}},
+        }
+        old = Contract.from_dict(contract_dict, values_dir=tmp_path)
+        assert old.validate({"c": "C"}).errors
+
+        (tmp_path / "codes.txt").write_text("A\nB\nC\n")
+        new = Contract.from_dict(contract_dict, values_dir=tmp_path)
+
+        assert new.pydantic_model is not old.pydantic_model
+        assert new.validate({"c": "C"}).errors is None
+        assert new.validate_json(b'{"c": "C"}').errors is None
+        assert new.validate_batch({"c": ["C"]}).violations == {}
+        assert old.validate({"c": "C"}).errors
+
+    def test_external_values_not_strings(self, tmp_path):
+        from data_sitter.rules.Parser.alias_parameters_parser import NotCompatibleTypes
+        (tmp_path / "codes.txt").write_text("1\n2\n")
+        contract_dict = {
+            "name": "test",
+            "fields": [{"name": "size", "type": "Integer", "rules": ["Is at least $values.codes"]}],
+            "values": {"codes": {"file": "codes.txt"}},
+        }
+        with pytest.raises(NotCompatibleTypes):
+            Contract.from_dict(contract_dict, values_dir=tmp_path).pydantic_model
+
+    def test_update(self):
+        """Test only the fields with changed rules or values are compiled again"""
+        contract_dict = {
+            "name": "test",
+            "fields": [
+                {"name": "id", "type": "Integer", "rules": ["Is positive"]},
+                {"name": "code", "type": "String", "rules": ["Is one of $values.codes"]},
+                {"name": "tag", "type": "String", "rules": ["Is one of $values.tags"]},
+            ],
+            "values": {"codes": ["A", "B"], "tags": ["x"]},
+        }
+        contract = Contract.from_dict(contract_dict)
+        old_validators = dict(contract.field_validators)
+        old_model = contract.pydantic_model
+
+        new_dict = {
+            **contract_dict,
+            "fields": contract_dict["fields"][1:] + [{"name": "size", "type": "Integer", "rules": []}],
+            "values": {"codes": ["A", "B", "C"], "tags": ["x"]},
+        }
+        changes = contract.update(new_dict)
+
+        assert changes == {"added": ["size"], "removed": ["id"], "changed": ["code"]}
+        assert contract.field_validators["tag"] is old_validators["tag"]
+        assert contract.field_validators["code"] is not old_validators["code"]
+        assert list(contract.field_validators) == ["code", "tag", "size"]
+        assert contract.validate({"code": "C", "tag": "x", "size": 1}).errors is None
+        assert contract.contract["values"] == new_dict["values"]
+        # A validation holding the old model is not affected
+        assert Validation.validate(old_model, {"id": 1, "code": "C", "tag": "x"}).errors is not None
+
+    @pytest.mark.parametrize("lookup", ["set", "mmap"])
+    def test_update_external_values_changed(self, tmp_path, lookup):
+        """Test the fields referencing a values file whose content changed are compiled again"""
+        (tmp_path / "codes.txt").write_text("A\nB\n")
+        contract_dict = {
+            "name": "ChangedValues",
+            "fields": [
+                {"name": "c", "type": "String", "rules": ["Is one of $values.codes"]},
+                {"name": "n", "type": "Integer", "rules": []},
+            ],
+            "values": {"codes": {"file": "codes.txt", "lookup": lookup}},
+        }
+        contract = Contract.from_dict(contract_dict, values_dir=tmp_path)
+        assert contract.update(contract_dict) == {"added": [], "removed": [], "changed": []}
+
+        (tmp_path / "codes.txt").write_text("A\nB\nC\n")
+        assert contract.update(contract_dict) == {"added": [], "removed": [], "changed": ["c"]}
+        assert contract.validate({"c": "C"}).errors is None
+
+    def test_update_without_changes(self, sample_contract_dict):
+        """Test the compiled model is kept when nothing changed"""
+        contract = Contract.from_dict(sample_contract_dict)
+        model = contract.pydantic_model
+
+        assert contract.update(sample_contract_dict) == {"added": [], "removed": [], "changed": []}
+        assert contract.pydantic_model is model
+
+    def test_pydantic_model_shared(self, sample_contract_dict):
+        """Test structurally identical contracts share their model, once their rules are normalised"""
+        contract = Contract.from_dict(sample_contract_dict)
+        same = Contract.from_dict(json.loads(json.dumps(sample_contract_dict)))
+        sample_contract_dict["fields"][1]["rules"] = ["is not null", "Is at least $values.min_age"]
+        normalised = Contract.from_dict(sample_contract_dict)
+
+        assert same.pydantic_model is contract.pydantic_model
+        assert normalised.pydantic_model is contract.pydantic_model
+
+    def test_pydantic_model_not_shared(self, sample_contract_dict):
+        """Test contracts differing in their name, rules or values get their own model"""
+        contract = Contract.from_dict(sample_contract_dict)
+        renamed = Contract.from_dict({**sample_contract_dict, "name": "Other"})
+        cached = Contract.from_dict(sample_contract_dict, cache_size=8)
+        sample_contract_dict["fields"][1]["rules"] = ["Is not null", "Is at least 21"]
+        other_rules = Contract.from_dict(sample_contract_dict)
+
+        models = {id(c.pydantic_model) for c in (contract, renamed, cached, other_rules)}
+        assert len(models) == 4
+        assert other_rules.validate({"name": "John", "age": 19}).errors == {"age": ["Value must be at least 21."]}
+
+    def test_detailed(self, sample_contract_dict):
+        """Test the detailed mode reports every failing rule, whatever the order of the rules"""
+        sample_contract_dict["fields"][1]["rules"] = ["Is not null", "Is at least 18", "Is at most 10"]
+        first_failure = Contract.from_dict(sample_contract_dict)
+        detailed = Contract.from_dict(sample_contract_dict, detailed=True)
+        adaptive = Contract.from_dict(sample_contract_dict, detailed=True, adaptive_order=True)
+
+        assert first_failure.validate({"name": "John", "age": 16}).errors == {"age": ["Value must be at least 18."]}
+        for contract in (detailed, adaptive):
+            for _ in range(3):
+                validation = contract.validate({"name": "John", "age": 16})
+                assert validation.errors == {"age": ["Value must be at least 18.", "Value must not exceed 10."]}
+            batch_validation = contract.validate_batch({"name": ["John", "Jo"], "age": [16, 5]})
+            assert batch_validation.errors == {
+                0: {"age": ["Value must be at least 18.", "Value must not exceed 10."]},
+                1: {"name": ["Length must be at least 3 characters."], "age": ["Value must be at least 18."]},
+            }
+
+    def test_adaptive_order(self, sample_contract_dict):
+        """Test the adaptive order is enabled on every field without changing which rows fail"""
+        contract = Contract.from_dict(sample_contract_dict, adaptive_order=True)
+        assert all(v.ordering is not None for v in contract.field_validators.values())
+
+        rows = [{"name": "John", "age": age} for age in range(0, 40)]
+        assert [contract.validate(row).errors is None for row in rows] == [age >= 18 for age in range(0, 40)]
+        assert contract.field_validators["age"].ordering.checks[1] > 0
+
+    def test_list_fields(self):
+        """Test list fields apply the length rules to the list and the other rules to every element"""
+        contract = Contract.from_dict({
+            "name": "ListContract",
+            "fields": [
+                {"name": "tags", "type": "List[String]", "rules": ["Has maximum length 2", "Is one of $values.tags"]},
+                {"name": "measures", "type": "List[Float]", "rules": ["Is not null", "Is positive"]},
+            ],
+            "values": {"tags": ["a", "b"]},
+        })
+
+        assert contract.validate({"tags": ["a"], "measures": [1, "2.5"]}).item == {"tags": ["a"], "measures": [1.0, 2.5]}
+        assert contract.validate({"tags": ["a", "b", "a"], "measures": [1, -2]}).errors == {
+            "tags": ["Length must not exceed 2 items."],
+            "measures": ["Item 1: Value must be positive."],
+        }
+        batch_validation = contract.validate_batch({"tags": [["a"], ["c"]], "measures": [[1.0], [0.5, 0.0]]})
+        assert batch_validation.errors == {
+            1: {"tags": ["Item 0: Value 'c' must be one of the possible values."],
+                "measures": ["Item 1: Value must be positive."]},
+        }
+        bad_items = {"tags": ["a"], "measures": ["x", 1, "y"]}
+        assert contract.validate_batch({name: [value] for name, value in bad_items.items()}).errors == {
+            0: contract.validate(bad_items).errors
+        }
+        assert len(contract.validate(bad_items).errors["measures"]) == 2
+        assert contract.contract["fields"][0]["type"] == "List[String]"
+
+    def test_temporal_fields(self):
+        """Test date and datetime fields parse ISO strings and check their ranges"""
+        contract = Contract.from_dict({
+            "name": "TemporalContract",
+            "fields": [
+                {"name": "day", "type": "Date", "rules": ["Is not null", "Is after '2020-01-01'"]},
+                {"name": "at", "type": "Datetime", "rules": ["Is not in the future"]},
+            ],
+        })
+
+        validation = contract.validate({"day": "2021-05-05", "at": "2024-01-01T10:00:00Z"})
+        assert validation.item == {
+            "day": date(2021, 5, 5), "at": datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+        }
+        assert contract.validate({"day": "2019-12-31", "at": "3000-01-01T00:00:00"}).errors == {
+            "day": ["Value must be after 2020-01-01."],
+            "at": ["Value cannot be in the future."],
+        }
+        batch_validation = contract.validate_batch({"day": ["2021-01-01", "2019-01-01", "2021-01-01"]})
+        assert batch_validation.errors == {1: {"day": ["Value must be after 2020-01-01."]}}
+
+    def test_regex_timeout(self):
+        """Test the regex time budget is set on every field, list elements included"""
+        contract = Contract.from_dict({
+            "name": "RegexContract",
+            "fields": [
+                {"name": "code", "type": "String", "rules": ["Matches regex '^[A-Z]{3}$'"]},
+                {"name": "codes", "type": "List[String]", "rules": ["Matches regex '^[A-Z]{3}$'"]},
+            ],
+        }, regex_timeout=0.5)
+
+        assert contract.field_validators["code"].regex_timeout == 0.5
+        assert contract.field_validators["codes"].element.regex_timeout == 0.5
+        assert contract.validate({"code": "ABC", "codes": ["ABC", "abc"]}).errors == {
+            "codes": ["Item 1: Value does not match the required pattern ^[A-Z]{3}$."]
+        }
+
+    def test_unsafe_regex_with_timeout(self):
+        """Test unsafe patterns are rejected, unless a regex time budget bounds them"""
+        from data_sitter.field_types.safe_regex import UnsafeRegexError, UnsafeRegexWarning
+        contract_dict = {
+            "name": "UnsafeRegexContract",
+            "fields": [
+                {"name": "words", "type": "String", "rules": ["Matches regex '^(\\w+\\s?)+$'"]},
+                {"name": "tags", "type": "List[String]", "rules": ["Matches regex '^(\\w+\\s?)+$'"]},
+            ],
+        }
+        with pytest.raises(UnsafeRegexError):
+            Contract.from_dict(contract_dict).field_validators
+        with pytest.warns(UnsafeRegexWarning):
+            contract = Contract.from_dict(contract_dict, regex_timeout=0.05)
+            contract.field_validators
+        assert contract.validate({"words": "two words", "tags": ["one", "a" * 64 + "!"]}).errors == {
+            "tags": ["Item 1: Value does not match the required pattern ^(\\w+\\s?)+$."]
+        }
+
+    def test_cache_size(self, sample_contract_dict):
+        """Test the validation cache is enabled on every field"""
+        contract = Contract.from_dict(sample_contract_dict, cache_size=16)
+        assert all(v.cache.maxsize == 16 for v in contract.field_validators.values())
+
+        for _ in range(3):
+            validation = contract.validate({"name": "Jo", "age": 16})
+            assert validation.errors == {
+                "name": ["Length must be at least 3 characters."],
+                "age": ["Value must be at least 18."],
+            }
+        assert contract.field_validators["age"].cache.hits == 2
+
+    def test_validate_json(self, sample_contract):
+        """Test validating raw JSON gives the same result as validating the parsed item"""
+        items = [
+            {"name": "John", "age": 30},
+            {"name": "Jo", "age": 16, "email": "jo@example.com"},
+            {"name": "John", "age": "thirty"},
+            {"name": "John"},
+        ]
+        for item in items:
+            data = json.dumps(item).encode()
+            assert sample_contract.validate_json(data).to_dict() == sample_contract.validate(item).to_dict()
+
+        validation = sample_contract.validate_json(b'{"name": "John", "age": 30, "email": "j@example.com"}')
+        assert validation.item == {"name": "John", "age": 30}
+        assert validation.unknowns == {"email": "j@example.com"}
+        assert validation.errors is None
+
+    def test_validate_json_not_an_object(self, sample_contract):
+        """Test raw JSON that isn't an object is rejected"""
+        with pytest.raises(TypeError):
+            sample_contract.validate_json(b'[1, 2]')
+        with pytest.raises(json.JSONDecodeError):
+            sample_contract.validate_json(b'{"name": ')
+
+    def test_validate_json_many(self, sample_contract):
+        """Test validating a raw JSON array reports every item"""
+        items = [
+            {"name": "John", "age": 30},
+            {"name": "Jo", "age": 16},
+            {"name": "Jane", "age": 25, "email": "jane@example.com"},
+        ]
+        validations = sample_contract.validate_json_many(json.dumps(items).encode())
+        assert [v.to_dict() for v in validations] == [sample_contract.validate(item).to_dict() for item in items]
+        assert validations[1].errors == {
+            "name": ["Length must be at least 3 characters."],
+            "age": ["Value must be at least 18."],
+        }
+        assert validations[2].unknowns == {"email": "jane@example.com"}
+
+        validations = sample_contract.validate_json_many(json.dumps(items[::2]).encode())
+        assert [v.errors for v in validations] == [None, None]
+        with pytest.raises(TypeError):
+            sample_contract.validate_json_many(b'{"name": "John"}')
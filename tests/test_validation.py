@@ -128,3 +128,10 @@ class TestValidation:
         assert validation.item["age"] is None
         assert validation.item["email"] is None
         assert validation.unknowns == None
+
+    def test_validate_wraps_pydantic_errors(self, test_model):
+        """Test that pydantic's own errors are exposed with their type as rule id"""
+        validation = Validation.validate(test_model, {"name": "John", "age": "abc"})
+
+        assert validation.violations["age"][0].rule_id == "int_parsing"
+        assert validation.errors["age"] == [validation.violations["age"][0].message]
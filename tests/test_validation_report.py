@@ -0,0 +1,89 @@
+import pytest
+
+from data_sitter.rules import RuleViolation
+from data_sitter.Validation import BatchValidation, Validation
+from data_sitter.ValidationReport import ValidationReport, wilson_interval
+
+
+def invalid(**fields):
+    return Validation(item={}, violations={
+        field: [RuleViolation(rule_id, rule_id)] for field, rule_id in fields.items()
+    })
+
+
+class TestWilsonInterval:
+    def test_interval_contains_rate(self):
+        """Test the interval contains the observed rate"""
+        low, high = wilson_interval(10, 100)
+        assert low < 0.1 < high
+        assert low == pytest.approx(0.0552, abs=1e-4)
+        assert high == pytest.approx(0.1744, abs=1e-4)
+
+    def test_interval_bounds(self):
+        """Test the interval stays within [0, 1]"""
+        assert wilson_interval(0, 50)[0] == 0.0
+        assert wilson_interval(50, 50)[1] == 1.0
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+
+    def test_interval_narrows_with_confidence(self):
+        """Test lower confidence gives a narrower interval"""
+        low_90, high_90 = wilson_interval(10, 100, 0.90)
+        low_99, high_99 = wilson_interval(10, 100, 0.99)
+        assert high_90 - low_90 < high_99 - low_99
+
+
+class TestValidationReport:
+    def test_add(self):
+        """Test failures are counted per row, field and rule"""
+        report = ValidationReport()
+        report.add(Validation(item={}))
+        report.add(invalid(age="at_least"))
+        report.add(invalid(age="int_parsing", name="min_length"))
+
+        assert report.rows == 3
+        assert report.invalid_rows == 2
+        assert report.field_failures == {"age": 2, "name": 1}
+        assert report.rule_failures["age"] == {"at_least": 1, "int_parsing": 1}
+
+    def test_add_batch(self):
+        """Test batch validations are counted like row validations"""
+        report = ValidationReport()
+        report.add_batch(BatchValidation(columns={}, size=3, violations={
+            1: {"age": [RuleViolation("at_least", "")]},
+        }))
+
+        assert report.rows == 3
+        assert report.invalid_rows == 1
+        assert report.rule_failures == {"age": {"at_least": 1}}
+
+    def test_failure_rates(self):
+        """Test rates and intervals are reported per field and rule"""
+        report = ValidationReport()
+        for _ in range(9):
+            report.add(Validation(item={}))
+        report.add(invalid(age="at_least"))
+
+        rates = report.failure_rates(0.9)
+
+        assert rates["rows"] == 10
+        assert rates["confidence"] == 0.9
+        assert rates["invalid_rows"]["rate"] == 0.1
+        age = rates["fields"]["age"]
+        assert age["failures"] == 1
+        assert age["interval"][0] < 0.1 < age["interval"][1]
+        assert age["rules"]["at_least"]["rate"] == 0.1
+
+    def test_merge_and_round_trip(self):
+        """Test reports merge and survive a dict round trip"""
+        first, second = ValidationReport(), ValidationReport()
+        first.add(invalid(age="at_least"))
+        second.add(invalid(age="at_least", name="not_null"))
+
+        merged = ValidationReport.from_dict(first.to_dict()).merge(second)
+
+        assert merged.to_dict() == {
+            "rows": 2,
+            "invalid_rows": 2,
+            "field_failures": {"age": 2, "name": 1},
+            "rule_failures": {"age": {"at_least": 2}, "name": {"not_null": 1}},
+        }